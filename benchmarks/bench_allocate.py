@@ -0,0 +1,55 @@
+"""
+Splitting a total many ways: the usual hand-written loop (Decimal share per
+part, quantized, rounding drift dumped on the last part) against
+Money.allocate
+
+Run from the repository root, optionally with the number of parts:
+
+    python -m benchmarks.bench_allocate [parts]
+"""
+
+import sys
+import time
+from decimal import Decimal
+from typing import Callable
+
+from money.dataclasses.money import Money, sum_money
+
+PARTS = 1_000_000
+
+TOTAL = Money("1234567.89", "USD")
+
+
+def handwritten(total: Money, ratios: list[int]) -> list[Money]:
+    weight = sum(ratios)
+    cent = Decimal("0.01")
+    parts = [
+        Money((total.amount * ratio / weight).quantize(cent), total.currency)
+        for ratio in ratios
+    ]
+    parts[-1] += total - sum_money(parts)
+    return parts
+
+
+def main() -> None:
+    parts = int(sys.argv[1]) if len(sys.argv) > 1 else PARTS
+    ratios = [index % 7 + 1 for index in range(parts)]
+
+    runs: dict[str, Callable[[], list[Money]]] = {
+        "handwritten": lambda: handwritten(TOTAL, ratios),
+        "allocate()": lambda: TOTAL.allocate(ratios),
+    }
+    for name, allocate in runs.items():
+        start = time.perf_counter()
+        result = allocate()
+        elapsed = time.perf_counter() - start
+        assert sum_money(result) == TOTAL
+        print(
+            "{:<12} {:>7.2f} s {:>8.1f} ns/part   last part {}".format(
+                name, elapsed, elapsed / parts * 1e9, result[-1]
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Shipping Money between services: a JSON list of 'USD 123.45' strings parsed
+back with Money.from_string, against money.codec streams, exact and in minor
+units, decoded to Money or only to columns
+
+Run from the repository root:
+
+    python -m benchmarks.bench_codec
+"""
+
+import json
+import random
+import time
+from typing import Callable
+
+from money.codec import decode, decode_columns, encode
+from money.dataclasses.money import Money
+
+ELEMENTS = 200_000
+
+CODES = ["USD", "EUR", "JPY", "GBP", "CHF"]
+
+
+def timed(function: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    generator = random.Random(0)
+    values = [
+        Money(
+            "%d.%02d" % (generator.randrange(100_000), generator.randrange(100)), code
+        )
+        for code in (generator.choice(CODES[:2] + CODES[3:]) for _ in range(ELEMENTS))
+    ]
+
+    text = json.dumps([str(value) for value in values]).encode()
+    exact = encode(values)
+    units = encode(values, minor_units=True)
+    assert [Money.from_string(value) for value in json.loads(text)] == values
+    assert decode(exact) == decode(units) == values
+
+    rows: list[tuple[str, int, float | None, float]] = [
+        (
+            "JSON strings",
+            len(text),
+            timed(lambda: json.dumps([str(value) for value in values])),
+            timed(lambda: [Money.from_string(value) for value in json.loads(text)]),
+        ),
+        (
+            "codec exact",
+            len(exact),
+            timed(lambda: encode(values)),
+            timed(lambda: decode(exact)),
+        ),
+        (
+            "codec minor units",
+            len(units),
+            timed(lambda: encode(values, minor_units=True)),
+            timed(lambda: decode(units)),
+        ),
+        ("  to columns", len(units), None, timed(lambda: decode_columns(units))),
+    ]
+    print("{:<18} {:>10} {:>16} {:>16}".format("", "bytes", "encode", "decode"))
+    for name, size, encoding, decoding in rows:
+        print(
+            "{:<18} {:>10} {:>16} {:>7.1f} ns/value".format(
+                name,
+                size,
+                ""
+                if encoding is None
+                else "%.1f ns/value" % (encoding / ELEMENTS * 1e9),
+                decoding / ELEMENTS * 1e9,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Totalling a MoneyField per currency over an in-memory SQLite table: one
+Sum query per currency against MoneySum, which groups by the currency column
+in a single query
+
+Run from the repository root:
+
+    python -m benchmarks.bench_django_aggregate
+"""
+
+import os
+import time
+from typing import Callable
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "money.tests.settings")
+django.setup()
+
+from django.db import connection, reset_queries  # noqa: E402
+from django.db.models import Sum  # noqa: E402
+
+from money.contrib.django.models.aggregates import MoneySum  # noqa: E402
+from money.dataclasses.currency import Currency  # noqa: E402
+from money.dataclasses.money import Money  # noqa: E402
+from money.tests.models import BulkMoneyModel  # noqa: E402
+
+ROWS = 200_000
+RUNS = 5
+CODES = ["USD", "EUR", "JPY", "GBP", "CHF", "AUD", "CAD", "SEK"]
+
+
+def fill() -> None:
+    with connection.schema_editor() as editor:
+        editor.create_model(BulkMoneyModel)
+    with connection.cursor() as cursor:
+        cursor.executemany(
+            "INSERT INTO %s (name, price, price_currency) VALUES (%%s, %%s, %%s)"
+            % BulkMoneyModel._meta.db_table,
+            [
+                ("row", "%d.25" % (row % 10_000), CODES[row % len(CODES)])
+                for row in range(ROWS)
+            ],
+        )
+
+
+def per_currency() -> dict[Currency, Money]:
+    totals = {}
+    currencies = (
+        BulkMoneyModel.objects.order_by()
+        .values_list("price_currency", flat=True)
+        .distinct()
+    )
+    for currency in currencies:
+        amount = BulkMoneyModel.objects.filter(price_currency=currency).aggregate(
+            total=Sum("price")
+        )["total"]
+        total = Money(amount, currency)
+        totals[total.currency] = total
+    return totals
+
+
+def grouped() -> dict[Currency, Money]:
+    totals: dict[Currency, Money] = BulkMoneyModel.objects.aggregate(
+        total=MoneySum("price")
+    )["total"]
+    return totals
+
+
+def best(run: Callable[[], dict[Currency, Money]]) -> tuple[float, int]:
+    elapsed = float("inf")
+    for _ in range(RUNS):
+        reset_queries()
+        start = time.perf_counter()
+        run()
+        elapsed = min(elapsed, time.perf_counter() - start)
+    queries = len(connection.queries)
+    return elapsed, queries
+
+
+def main() -> None:
+    fill()
+    assert per_currency() == grouped()
+    # Count the queries
+    connection.force_debug_cursor = True
+
+    print("{} rows, {} currencies, best of {}".format(ROWS, len(CODES), RUNS))
+    for name, run in [("Sum per currency", per_currency), ("MoneySum", grouped)]:
+        elapsed, queries = best(run)
+        print("{:<18} {:>8.1f} ms {:>4} queries".format(name, elapsed * 1e3, queries))
+
+
+if __name__ == "__main__":
+    main()
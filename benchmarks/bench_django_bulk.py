@@ -0,0 +1,106 @@
+"""
+Writing MoneyField rows to an in-memory SQLite table: save() per row against
+bulk_create, and updating them with save() per row against bulk_update of
+the MoneyField alone, which also writes its currency column
+
+Run from the repository root:
+
+    python -m benchmarks.bench_django_bulk
+"""
+
+import os
+import time
+from decimal import Decimal
+from typing import Callable
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "money.tests.settings")
+django.setup()
+
+from django.db import connection, transaction  # noqa: E402
+
+from money.dataclasses.money import Money  # noqa: E402
+from money.tests.models import BulkMoneyModel  # noqa: E402
+
+ROWS = 10_000
+RUNS = 3
+BATCH_SIZE = 500
+CODES = ["USD", "EUR", "JPY", "GBP", "CHF"]
+
+
+def rows() -> list[BulkMoneyModel]:
+    return [
+        BulkMoneyModel(
+            name="line",
+            price=Money(Decimal(row % 10_000) / 4, CODES[row % len(CODES)]),
+        )
+        for row in range(ROWS)
+    ]
+
+
+def save_each() -> None:
+    with transaction.atomic():
+        for row in rows():
+            row.save()
+
+
+def bulk_create() -> None:
+    BulkMoneyModel.objects.bulk_create(rows(), batch_size=BATCH_SIZE)
+
+
+def reprice(lines: list[BulkMoneyModel]) -> None:
+    for line in lines:
+        line.price = Money(line.price.amount + 1, "EUR")
+
+
+def update_each() -> None:
+    lines = list(BulkMoneyModel.objects.all())
+    reprice(lines)
+    with transaction.atomic():
+        for line in lines:
+            line.save(update_fields=["price", "price_currency"])
+
+
+def bulk_update() -> None:
+    lines = list(BulkMoneyModel.objects.all())
+    reprice(lines)
+    BulkMoneyModel.objects.bulk_update(lines, ["price"], batch_size=BATCH_SIZE)
+
+
+def best(setup: Callable[[], None], run: Callable[[], None]) -> float:
+    elapsed = float("inf")
+    for _ in range(RUNS):
+        BulkMoneyModel.objects.all().delete()
+        setup()
+        start = time.perf_counter()
+        run()
+        elapsed = min(elapsed, time.perf_counter() - start)
+    return elapsed
+
+
+def main() -> None:
+    with connection.schema_editor() as editor:
+        editor.create_model(BulkMoneyModel)
+
+    def nothing() -> None:
+        pass
+
+    timings = [
+        ("save() per row", best(nothing, save_each)),
+        ("bulk_create", best(nothing, bulk_create)),
+        ("save() per row, update", best(bulk_create, update_each)),
+        ("bulk_update", best(bulk_create, bulk_update)),
+    ]
+
+    print("{} rows, batches of {}, best of {}".format(ROWS, BATCH_SIZE, RUNS))
+    for name, elapsed in timings:
+        print(
+            "{:<24} {:>8.1f} ms {:>10,.0f} rows/s".format(
+                name, elapsed * 1e3, ROWS / elapsed
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
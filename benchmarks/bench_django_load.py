@@ -0,0 +1,58 @@
+"""
+Iterating a large in-memory SQLite table and reading each row's MoneyField
+
+Run from the repository root:
+
+    python -m benchmarks.bench_django_load
+"""
+
+import os
+import time
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "money.tests.settings")
+django.setup()
+
+from django.db import connection, models  # noqa: E402
+
+from money.tests.models import SimpleMoneyModel  # noqa: E402
+
+ROWS = 1_000_000
+RUNS = 3
+CODES = ["USD", "EUR", "JPY", "GBP", "CHF"]
+
+
+def fill(model: type[models.Model]) -> None:
+    with connection.schema_editor() as editor:
+        editor.create_model(model)
+    with connection.cursor() as cursor:
+        cursor.executemany(
+            "INSERT INTO %s (name, price, price_currency) VALUES (%%s, %%s, %%s)"
+            % model._meta.db_table,
+            [
+                ("row", "%d.25" % (row % 100_000), CODES[row % len(CODES)])
+                for row in range(ROWS)
+            ],
+        )
+
+
+def iterate(model: type[SimpleMoneyModel]) -> float:
+    start = time.perf_counter()
+    for row in model.objects.iterator(chunk_size=10_000):
+        row.price
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    fill(SimpleMoneyModel)
+    elapsed = min(iterate(SimpleMoneyModel) for _ in range(RUNS))
+    print(
+        "{} rows, best of {}: {:.2f} s {:.2f} us/row".format(
+            ROWS, RUNS, elapsed, elapsed / ROWS * 1e6
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
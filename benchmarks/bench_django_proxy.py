@@ -0,0 +1,62 @@
+"""
+Reading a MoneyField a dozen times per row over a page of rows loaded from
+an in-memory SQLite table: building a new Money on every read, as the proxy
+used to, against the Money cached on each instance
+
+Run from the repository root:
+
+    python -m benchmarks.bench_django_proxy
+"""
+
+import os
+import time
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "money.tests.settings")
+django.setup()
+
+from django.db import connection  # noqa: E402
+
+from money.dataclasses.money import Money  # noqa: E402
+from money.tests.models import SimpleMoneyModel  # noqa: E402
+
+ROWS = 10_000
+READS = 12
+
+
+def main() -> None:
+    with connection.schema_editor() as editor:
+        editor.create_model(SimpleMoneyModel)
+    SimpleMoneyModel.objects.bulk_create(
+        SimpleMoneyModel(name="row %d" % row, price=Money("%d.25" % row, "USD"))
+        for row in range(ROWS)
+    )
+
+    start = time.perf_counter()
+    rows = list(SimpleMoneyModel.objects.all())
+    loading = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for row in rows:
+        for _ in range(READS):
+            Money(row.__dict__["price"], row.__dict__["price_currency"])
+    rebuilt = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for row in rows:
+        for _ in range(READS):
+            row.price
+    cached = time.perf_counter() - start
+
+    print("{} rows loaded in {:.1f} ms".format(ROWS, loading * 1e3))
+    for name, elapsed in (("rebuilt per read", rebuilt), ("cached", cached)):
+        print(
+            "{:<18} {:>8.1f} ms {:>8.1f} ns/read".format(
+                name, elapsed * 1e3, elapsed / (ROWS * READS) * 1e9
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
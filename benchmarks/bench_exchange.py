@@ -0,0 +1,61 @@
+"""
+Converting a mixed-currency column: an ad-hoc converter that crosses through
+the base currency on every call against RateTable.convert and convert_many
+
+Run from the repository root:
+
+    python -m benchmarks.bench_exchange
+"""
+
+import time
+from decimal import Decimal
+from typing import Callable
+
+from money.constants import CURRENCY
+from money.dataclasses.money import Money
+from money.exchange import RateTable
+
+ELEMENTS = 100_000
+
+QUOTES = {"USD": "1.08", "JPY": "160", "GBP": "0.855", "CHF": "0.96", "KWD": "0.33"}
+TABLE = RateTable({("EUR", code): rate for code, rate in QUOTES.items()}, "EUR")
+
+VALUES = [Money("12.34", code) for code in QUOTES]
+
+
+def adhoc(value: Money, to: str) -> Money:
+    """Looks both legs up and crosses them for every value"""
+    per_eur = {code: Decimal(rate) for code, rate in QUOTES.items()}
+    per_eur["EUR"] = Decimal(1)
+    rate = per_eur[to] / per_eur[value.currency.code]
+    return Money(value.amount * rate, CURRENCY[to])
+
+
+def seconds(run: Callable[[], list[Money]], repeat: int = 5) -> float:
+    """Best-of-repeat wall time of ``run``"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    values = VALUES * (ELEMENTS // len(VALUES))
+    runs: dict[str, Callable[[], list[Money]]] = {
+        "ad-hoc": lambda: [adhoc(value, "CHF") for value in values],
+        "convert()": lambda: [TABLE.convert(value, "CHF") for value in values],
+        "convert_many()": lambda: TABLE.convert_many(values, "CHF"),
+    }
+    for name, run in runs.items():
+        elapsed = seconds(run)
+        print(
+            "{:<15} {:>7.3f} s {:>8.1f} ns/value".format(
+                name, elapsed, elapsed / len(values) * 1e9
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
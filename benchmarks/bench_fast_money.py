@@ -0,0 +1,50 @@
+"""
+Per-operation latency of FastMoney against Money
+
+Run from the repository root:
+
+    python -m benchmarks.bench_fast_money
+"""
+
+import timeit
+from decimal import Decimal
+
+from money.constants import CURRENCY
+from money.dataclasses.fast_money import FastMoney
+from money.dataclasses.money import Money
+
+USD = CURRENCY["USD"]
+NAMESPACES = {
+    "Money": {
+        "a": Money("123.45", USD),
+        "b": Money("67.89", USD),
+        "d": Decimal("1.2"),
+    },
+    "FastMoney": {
+        "a": FastMoney("123.45", USD),
+        "b": FastMoney("67.89", USD),
+        "d": Decimal("1.2"),
+    },
+}
+
+OPERATIONS = ["a + b", "a - b", "a * 3", "a * d", "-a", "a < b", "a == b", "hash(a)"]
+
+
+def latency(stmt: str, namespace: dict[str, object], number: int = 200_000) -> float:
+    """Best-of-5 latency of ``stmt`` in nanoseconds"""
+    timer = timeit.Timer(stmt, globals=namespace)
+    return min(timer.repeat(repeat=5, number=number)) / number * 1e9
+
+
+def main() -> None:
+    print("{:<10} {:>12} {:>12}".format("", *NAMESPACES))
+    for stmt in OPERATIONS:
+        print(
+            "{:<10} {:>6.1f} ns/op {:>6.1f} ns/op".format(
+                stmt, *(latency(stmt, namespace) for namespace in NAMESPACES.values())
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Bulk conversion through a ConversionGraph: searching for the path of every
+value against the cached paths, with the cache's hit rate
+
+Run from the repository root:
+
+    python -m benchmarks.bench_graph
+"""
+
+import time
+from decimal import Decimal
+
+from money.dataclasses.money import Money
+from money.exchange import ConversionGraph, RateTable
+
+ELEMENTS = 100_000
+
+# A chain of quotes, so most conversions to JPY take several hops
+RATES = RateTable(
+    {
+        ("ZMK", "ZAR"): "0.0035",
+        ("ZAR", "USD"): "0.054",
+        ("USD", "EUR"): "0.92",
+        ("GBP", "EUR"): "1.17",
+        ("EUR", "CHF"): "0.96",
+        ("CHF", "JPY"): "170",
+        ("SEK", "NOK"): "1.01",
+        ("NOK", "EUR"): "0.087",
+    }
+)
+SOURCES = ["ZMK", "ZAR", "USD", "GBP", "SEK", "NOK", "EUR", "CHF"]
+
+
+def uncached(graph: ConversionGraph, values: list[Money], to: str) -> list[Money]:
+    """Searches the graph for every value, as an engine without a cache would"""
+    results = []
+    for value in values:
+        path = graph._search(value.currency.code, to)
+        assert path is not None
+        rate = Decimal(1)
+        for step, next_step in zip(path, path[1:]):
+            rate *= graph._edges[step][next_step]
+        results.append(Money(value.amount * rate, to))
+    return results
+
+
+def main() -> None:
+    values = [Money("12.34", code) for code in SOURCES] * (ELEMENTS // len(SOURCES))
+    graph = ConversionGraph(RATES)
+
+    start = time.perf_counter()
+    expected = uncached(graph, values, "JPY")
+    searching = time.perf_counter() - start
+
+    start = time.perf_counter()
+    converted = graph.convert_many(values, "JPY")
+    cached = time.perf_counter() - start
+    assert converted == expected
+
+    info = graph.cache_info()
+    print(
+        "{:<16} {:>8.1f} ns/value".format(
+            "search per value", searching / ELEMENTS * 1e9
+        )
+    )
+    print("{:<16} {:>8.1f} ns/value".format("convert_many()", cached / ELEMENTS * 1e9))
+    print(
+        "cache: {} hits, {} misses, {} paths, hit rate {:.4%}".format(
+            info.hits, info.misses, info.currsize, info.hit_rate
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Historical rate lookups: a dict of dicts keyed by date against RateHistory,
+in memory and mapped from a file
+
+Run from the repository root:
+
+    python -m benchmarks.bench_history
+"""
+
+import datetime
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+from decimal import Decimal
+from typing import Callable, TypeVar
+
+from money.exchange import RateHistory
+from money.exchange.rate_table import CurrencyPair, Rate
+
+T = TypeVar("T")
+
+CODES = ["USD", "JPY", "GBP", "CHF", "SEK", "NOK", "DKK", "PLN", "CZK", "HUF"]
+DAYS = 10 * 365
+LOOKUPS = 200_000
+
+START = datetime.date(2015, 1, 1)
+DATES = [START + datetime.timedelta(days=day) for day in range(DAYS)]
+
+
+def build_rates() -> dict[CurrencyPair, list[tuple[datetime.date, Rate]]]:
+    generator = random.Random(4217)
+    return {
+        ("EUR", code): [
+            (when, Decimal(generator.randint(10_000, 2_000_000)).scaleb(-4))
+            for when in DATES
+        ]
+        for code in CODES
+    }
+
+
+def retained(build: Callable[[], T]) -> tuple[T, int]:
+    """The result of ``build`` and the bytes it keeps alive"""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    result = build()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    return result, sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+
+
+def main() -> None:
+    rates = build_rates()
+    nested, nested_bytes = retained(
+        lambda: {
+            pair: {when: Decimal(str(rate)) for when, rate in points}
+            for pair, points in rates.items()
+        }
+    )
+    history, history_bytes = retained(lambda: RateHistory(rates, "EUR"))
+
+    generator = random.Random(0)
+    # Postings fall on any day, the dict needs to walk back to the last quote
+    queries = [
+        (
+            generator.choice(CODES),
+            START + datetime.timedelta(days=generator.randrange(DAYS)),
+        )
+        for _ in range(LOOKUPS)
+    ]
+
+    def dict_lookup(code: str, when: datetime.date) -> Decimal:
+        points = nested[("EUR", code)]
+        while when not in points:
+            when -= datetime.timedelta(days=1)
+        rate: Decimal = points[when]
+        return rate
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "rates.bin")
+        history.save(path)
+        start = time.perf_counter()
+        mapped = RateHistory.open(path)
+        opened = time.perf_counter() - start
+
+        print("{:,} rates over {} pairs".format(len(history), len(CODES)))
+        print("dict of dicts      {:>10,} bytes in memory".format(nested_bytes))
+        print("RateHistory        {:>10,} bytes in memory".format(history_bytes))
+        print(
+            "file               {:>10,} bytes, opened in {:.3f} ms".format(
+                os.path.getsize(path), opened * 1e3
+            )
+        )
+
+        lookups: dict[str, Callable[[str, datetime.date], Decimal]] = {
+            "dict of dicts": dict_lookup,
+            "RateHistory": lambda code, when: history.rate("EUR", code, when),
+            "RateHistory mmap": lambda code, when: mapped.rate("EUR", code, when),
+        }
+        for name, lookup in lookups.items():
+            start = time.perf_counter()
+            for code, when in queries:
+                lookup(code, when)
+            elapsed = time.perf_counter() - start
+            print("{:<18} {:>8.1f} ns/lookup".format(name, elapsed / LOOKUPS * 1e9))
+        mapped.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+Import time of the money package, measured with ``python -X importtime``
+
+Run from the repository root:
+
+    python -m benchmarks.bench_import
+"""
+
+import statistics
+import subprocess
+import sys
+
+RUNS = 15
+MODULES = ("money.constants", "money")
+
+
+def importtime() -> dict[str, tuple[int, int]]:
+    """Self and cumulative microseconds per module for one fresh interpreter"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import money"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        own, cumulative, name = line[len("import time:") :].split("|")
+        if own.strip().isdigit():
+            times[name.strip()] = (int(own), int(cumulative))
+    return times
+
+
+def main() -> None:
+    runs = [importtime() for _ in range(RUNS)]
+    for module in MODULES:
+        own = statistics.median(run[module][0] for run in runs)
+        cumulative = statistics.median(run[module][1] for run in runs)
+        print(
+            "{:<18} self {:>8.0f} us   cumulative {:>8.0f} us".format(
+                module, own, cumulative
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Per-operation latency and memory footprint of Money
+
+Run from the repository root:
+
+    python -m benchmarks.bench_money
+"""
+
+import timeit
+import tracemalloc
+from decimal import Decimal
+
+from money.constants import CURRENCY
+from money.dataclasses.money import Money
+
+INSTANCES = 100_000
+
+USD = CURRENCY["USD"]
+A = Money("123.45", USD)
+B = Money("67.89", USD)
+NAMESPACE = {"Money": Money, "USD": USD, "a": A, "b": B, "d": Decimal("1.5")}
+
+OPERATIONS = {
+    "Money(str, Currency)": "Money('123.45', USD)",
+    "a + b": "a + b",
+    "a - b": "a - b",
+    "a * d": "a * d",
+    "-a": "-a",
+    "a < b": "a < b",
+    "a == b": "a == b",
+}
+
+
+def latency(stmt: str, number: int = 200_000, repeat: int = 5) -> float:
+    """Best-of-repeat latency of ``stmt`` in nanoseconds"""
+    timer = timeit.Timer(stmt, globals=NAMESPACE)
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1e9
+
+
+def bytes_per_instance() -> float:
+    """Memory retained per Money, excluding the shared amount and currency"""
+    amount = Decimal("123.45")
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    instances = [A + amount for _ in range(INSTANCES)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    total = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    # The list itself and the per-result Decimal are not part of the Money
+    overhead = instances.__sizeof__() + INSTANCES * amount.__sizeof__()
+    return (total - overhead) / INSTANCES
+
+
+def main() -> None:
+    for name, stmt in OPERATIONS.items():
+        print("{:<24} {:>8.1f} ns/op".format(name, latency(stmt)))
+    print("{:<24} {:>8.1f} bytes".format("Money instance", bytes_per_instance()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Latency of parsing Money from strings
+
+Run from the repository root:
+
+    python -m benchmarks.bench_parse
+"""
+
+import random
+import time
+import timeit
+
+from money.dataclasses.money import Money
+from money.exceptions import IncorrectMoneyInputError
+
+INPUTS = {
+    "plain number": "123.45",
+    "prefixed code": "USD 123.45",
+    "lowercase, no space": "jpy-1200",
+    "invalid": "USD one hundred",
+}
+
+
+def parse(value: str) -> None:
+    try:
+        Money.from_string(value)
+    except IncorrectMoneyInputError:
+        pass
+
+
+def construct(value: str) -> None:
+    try:
+        Money(value)
+    except IncorrectMoneyInputError:
+        pass
+
+
+def latency(func: str, value: str, number: int = 100_000, repeat: int = 5) -> float:
+    """Best-of-repeat latency of ``func(value)`` in nanoseconds"""
+    timer = timeit.Timer(
+        "%s(value)" % func,
+        globals={"parse": parse, "construct": construct, "value": value},
+    )
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1e9
+
+
+def column(rows: int = 500_000) -> list[str]:
+    """A statement-like column: a few hundred distinct fees, some bad rows"""
+    rng = random.Random(0)
+    fees = [
+        "USD %d.%02d" % (rng.randrange(100), rng.randrange(100)) for _ in range(300)
+    ]
+    return ["n/a" if rng.random() < 0.001 else rng.choice(fees) for _ in range(rows)]
+
+
+def per_row(values: list[str]) -> None:
+    for value in values:
+        try:
+            Money.from_string(value)
+        except IncorrectMoneyInputError:
+            pass
+
+
+def bulk(values: list[str]) -> None:
+    Money.parse_many(values)
+
+
+def main() -> None:
+    for name, value in INPUTS.items():
+        print(
+            "{:<22} from_string {:>8.1f} ns/op   Money() {:>8.1f} ns/op".format(
+                name, latency("parse", value), latency("construct", value)
+            )
+        )
+
+    values = column()
+    for name, func in (("per-row from_string", per_row), ("parse_many", bulk)):
+        start = time.perf_counter()
+        func(values)
+        elapsed = time.perf_counter() - start
+        print("{:<22} {:>8.1f} ns/row".format(name, elapsed / len(values) * 1e9))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Pickled Money: the payload size and load time of the previous format, which
+wrote every Currency field and unpickled copies of the currencies, against
+the registry code format
+
+Run from the repository root:
+
+    python -m benchmarks.bench_pickle
+"""
+
+import copyreg
+import io
+import pickle
+import random
+import time
+from typing import Any
+
+from money.dataclasses.currency import Currency
+from money.dataclasses.money import Money
+
+ELEMENTS = 10_000
+REPEAT = 20_000
+
+CODES = ["USD", "EUR", "JPY", "GBP", "CHF"]
+
+
+class LegacyPickler(pickle.Pickler):
+    """Writes Money and Currency the way they were pickled before"""
+
+    def reducer_override(self, obj: Any) -> Any:
+        if isinstance(obj, Money):
+            return (Money, (obj.amount, obj.currency))
+        if isinstance(obj, Currency):
+            return (copyreg.__newobj__, (Currency,), dict(vars(obj)))  # type: ignore[attr-defined]
+        return NotImplemented
+
+
+def legacy_dumps(obj: object) -> bytes:
+    buffer = io.BytesIO()
+    LegacyPickler(buffer, pickle.HIGHEST_PROTOCOL).dump(obj)
+    return buffer.getvalue()
+
+
+def load_time(data: bytes, repeat: int) -> float:
+    """The best of five runs, per load"""
+    timings = []
+    for _ in range(5):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            pickle.loads(data)
+        timings.append((time.perf_counter() - start) / repeat)
+    return min(timings)
+
+
+def main() -> None:
+    generator = random.Random(0)
+    column = [
+        Money("%d.%02d" % (generator.randrange(10_000), generator.randrange(100)), code)
+        for code in (generator.choice(CODES) for _ in range(ELEMENTS))
+    ]
+    single = Money("12.34", "USD")
+
+    print("{:<22} {:>10} {:>12}".format("", "bytes", "load"))
+    for name, value, repeat in (
+        ("one Money", single, REPEAT),
+        ("%d Money" % ELEMENTS, column, 20),
+    ):
+        for format, data in (
+            ("previous", legacy_dumps(value)),
+            ("registry code", pickle.dumps(value, pickle.HIGHEST_PROTOCOL)),
+        ):
+            assert pickle.loads(data) == value
+            print(
+                "{:<22} {:>10} {:>9.2f} us".format(
+                    "%s, %s" % (name, format),
+                    len(data),
+                    load_time(data, repeat) * 1e6,
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Async conversion of a burst of requests against a remote source with latency
+and a pool of connections: every coroutine fetching its own rate, against a
+CachingRateProvider that coalesces them into one fetch per pair, then the same
+burst again once the rates are cached
+
+Run from the repository root:
+
+    python -m benchmarks.bench_providers
+"""
+
+import asyncio
+import datetime
+import time
+from decimal import Decimal
+
+from money.constants import CURRENCY
+from money.dataclasses.currency import Currency
+from money.dataclasses.money import Money
+from money.exchange import CachingRateProvider, RateTable, StaticRateProvider
+
+REQUESTS = 2_000
+LATENCY = 0.02
+CONNECTIONS = 10
+
+RATES = RateTable(
+    {("EUR", "USD"): "1.08", ("EUR", "JPY"): "160", ("EUR", "GBP"): "0.86"},
+    base="EUR",
+)
+SOURCES = ["USD", "JPY", "GBP", "EUR"]
+
+
+class Remote(StaticRateProvider):
+    """A source that serves a limited number of requests at a time"""
+
+    def __init__(self) -> None:
+        super().__init__(RATES, delay=LATENCY)
+        self._pool = asyncio.Semaphore(CONNECTIONS)
+
+    async def fetch_rate(
+        self, source: Currency, target: Currency, when: datetime.date | None = None
+    ) -> Decimal:
+        async with self._pool:
+            return await super().fetch_rate(source, target, when)
+
+
+async def uncoalesced(provider: Remote, values: list[Money]) -> None:
+    target = CURRENCY["EUR"]
+
+    async def convert(value: Money) -> Money:
+        rate = await provider.fetch_rate(value.currency, target)
+        return Money(value.amount * rate, target)
+
+    await asyncio.gather(*(convert(value) for value in values))
+
+
+async def coalesced(provider: CachingRateProvider, values: list[Money]) -> None:
+    await asyncio.gather(*(provider.convert(value, "EUR") for value in values))
+
+
+async def run() -> None:
+    values = [Money("12.34", code) for code in SOURCES] * (REQUESTS // len(SOURCES))
+
+    remote = Remote()
+    start = time.perf_counter()
+    await uncoalesced(remote, values)
+    timings = [("uncoalesced", time.perf_counter() - start, remote.fetches)]
+
+    remote = Remote()
+    provider = CachingRateProvider(remote, ttl=60)
+    for name in ("coalesced", "cached"):
+        start = time.perf_counter()
+        await coalesced(provider, values)
+        timings.append((name, time.perf_counter() - start, remote.fetches))
+
+    for name, elapsed, fetches in timings:
+        print("{:<12} {:>8.1f} ms {:>6} fetches".format(name, elapsed * 1e3, fetches))
+
+
+def main() -> None:
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Rounding a mixed-currency column to minor units: building the exponent on
+every call against Money.quantize and Money.quantize_many
+
+Run from the repository root:
+
+    python -m benchmarks.bench_quantize
+"""
+
+import time
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Callable
+
+from money.dataclasses.money import Money
+
+ELEMENTS = 100_000
+
+AMOUNTS = [Money("10.005", "USD"), Money("1200.5", "JPY"), Money("0.1235", "KWD")]
+
+
+def handwritten(values: list[Money]) -> list[Money]:
+    """The pattern callers use today, a fresh exponent Decimal per value"""
+    return [
+        Money(
+            value.amount.quantize(
+                Decimal(10) ** -value.currency.decimals, rounding=ROUND_HALF_UP
+            ),
+            value.currency,
+        )
+        for value in values
+    ]
+
+
+def seconds(run: Callable[[], list[Money]], repeat: int = 5) -> float:
+    """Best-of-repeat wall time of ``run``"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    values = AMOUNTS * (ELEMENTS // len(AMOUNTS))
+    expected = handwritten(values)
+    assert Money.quantize_many(values, ROUND_HALF_UP) == expected
+
+    runs = {
+        "handwritten": lambda: handwritten(values),
+        "quantize()": lambda: [value.quantize(ROUND_HALF_UP) for value in values],
+        "quantize_many()": lambda: Money.quantize_many(values, ROUND_HALF_UP),
+    }
+    for name, run in runs.items():
+        elapsed = seconds(run)
+        print(
+            "{:<16} {:>7.3f} s {:>8.1f} ns/value".format(
+                name, elapsed, elapsed / len(values) * 1e9
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Currency lookups by numeric code, country and symbol: registry indexes
+against a linear scan of CURRENCY_LIST
+
+Run from the repository root:
+
+    python -m benchmarks.bench_registry
+"""
+
+import timeit
+
+from money.constants import CURRENCY, CURRENCY_LIST
+from money.dataclasses.currency import Currency
+
+
+def scan_numeric(numeric: str) -> Currency:
+    for currency in CURRENCY_LIST:
+        if currency.numeric == numeric:
+            return currency
+    raise KeyError(numeric)
+
+
+def scan_country(country: str) -> tuple[Currency, ...]:
+    return tuple(c for c in CURRENCY_LIST if country in c.countries)
+
+
+def scan_symbol(symbol: str) -> tuple[Currency, ...]:
+    return tuple(c for c in CURRENCY_LIST if c.symbol == symbol)
+
+
+LOOKUPS = {
+    "numeric '932' (ZWL)": (scan_numeric, CURRENCY.by_numeric, "932"),
+    "country 'JAPAN'": (scan_country, CURRENCY.currencies_for_country, "JAPAN"),
+    "symbol '$'": (scan_symbol, CURRENCY.currencies_for_symbol, "$"),
+}
+
+
+def latency(stmt: str, namespace: dict[str, object], number: int = 20_000) -> float:
+    """Best-of-5 latency of ``stmt`` in nanoseconds"""
+    timer = timeit.Timer(stmt, globals=namespace)
+    return min(timer.repeat(repeat=5, number=number)) / number * 1e9
+
+
+def main() -> None:
+    for name, (scan, index, value) in LOOKUPS.items():
+        namespace = {"scan": scan, "index": index, "value": value}
+        print(
+            "{:<22} scan {:>9.1f} ns/op   index {:>7.1f} ns/op".format(
+                name,
+                latency("scan(value)", namespace),
+                latency("index(value)", namespace),
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Per-worker cost of a large rate table: every process building its own
+RateTable against a SharedRateTable reading one published snapshot, for the
+memory each process keeps, picking up new rates and bulk conversion
+
+Run from the repository root:
+
+    python -m benchmarks.bench_shared
+"""
+
+import random
+import time
+import tracemalloc
+import uuid
+from decimal import Decimal
+from typing import Callable, TypeVar
+
+from money.constants import CURRENCY
+from money.dataclasses.money import Money
+from money.exchange import RateTable, SharedRatePublisher, SharedRateTable
+from money.exchange.rate_table import CurrencyPair, Rate
+
+T = TypeVar("T")
+
+CURRENCIES = 150
+ELEMENTS = 100_000
+
+
+CODES = sorted(CURRENCY)[:CURRENCIES]
+
+
+def build_rates(seed: int) -> dict[CurrencyPair, Rate]:
+    """Every pair of currencies quoted, as a full cross matrix"""
+    generator = random.Random(seed)
+    return {
+        (source, target): str(Decimal(generator.randint(1, 10**8)).scaleb(-4))
+        for source in CODES
+        for target in CODES
+        if source < target
+    }
+
+
+def retained(build: Callable[[], T]) -> tuple[T, int]:
+    """The result of ``build`` and the bytes it keeps alive"""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    result = build()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    return result, sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+
+
+def main() -> None:
+    rates, updated = build_rates(1), build_rates(2)
+    generator = random.Random(0)
+    values = [Money("12.34", generator.choice(CODES)) for _ in range(ELEMENTS)]
+
+    table, table_bytes = retained(lambda: RateTable(rates))
+    start = time.perf_counter()
+    RateTable(updated)
+    rebuild = time.perf_counter() - start
+
+    with SharedRatePublisher("pmr-%s" % uuid.uuid4().hex[:8]) as publisher:
+        publisher.publish(RateTable(rates))
+
+        def attach() -> SharedRateTable:
+            reader = SharedRateTable(publisher.name)
+            reader.version
+            return reader
+
+        shared, shared_bytes = retained(attach)
+        with shared:
+            start = time.perf_counter()
+            expected = table.convert_many(values, CODES[0])
+            private = time.perf_counter() - start
+            start = time.perf_counter()
+            assert shared.convert_many(values, CODES[0]) == expected
+            reading = time.perf_counter() - start
+
+            publisher.publish(RateTable(updated))
+            start = time.perf_counter()
+            shared.version
+            swap = time.perf_counter() - start
+
+    print("{} quoted pairs".format(len(rates)))
+    print(
+        "{:<16} {:>10} {:>14} {:>16}".format(
+            "", "bytes/proc", "new rates", "convert_many()"
+        )
+    )
+    for name, size, refresh, elapsed in (
+        ("RateTable", table_bytes, rebuild, private),
+        ("SharedRateTable", shared_bytes, swap, reading),
+    ):
+        print(
+            "{:<16} {:>10} {:>11.1f} us {:>10.1f} ns/value".format(
+                name, size, refresh * 1e6, elapsed / ELEMENTS * 1e9
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Totalling a long single-currency column: the builtin sum() against sum_money
+
+Run from the repository root, optionally with the number of elements:
+
+    python -m benchmarks.bench_sum [elements]
+"""
+
+import sys
+import time
+from typing import Callable
+
+from money.dataclasses.money import Money, sum_money
+
+ELEMENTS = 10_000_000
+
+# A handful of distinct values repeated, so the list costs only its pointers
+DISTINCT = [Money(amount, "USD") for amount in ("12.34", "0.99", "1500", "-7.5")]
+
+
+def seconds(total: Callable[[], Money], repeat: int = 3) -> tuple[float, Money]:
+    """Best-of-repeat wall time of ``total`` and its result"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = total()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main() -> None:
+    elements = int(sys.argv[1]) if len(sys.argv) > 1 else ELEMENTS
+    values = DISTINCT * (elements // len(DISTINCT))
+    start = Money(0, "USD")
+
+    builtin, expected = seconds(lambda: sum(values, start))
+    fast, result = seconds(lambda: sum_money(values))
+    assert result == expected
+
+    print("{:,} elements, total {}".format(len(values), result))
+    for name, elapsed in (("sum()", builtin), ("sum_money()", fast)):
+        print(
+            "{:<12} {:>7.2f} s {:>8.1f} ns/element".format(
+                name, elapsed, elapsed / len(values) * 1e9
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,6 @@
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from money.constants import CURRENCY, CURRENCY_LIST, DEFAULT_CURRENCY
 from money.dataclasses.currency import Currency
 from money.dataclasses.money import Money
@@ -6,10 +9,14 @@ from money.exceptions import (
     IncorrectMoneyInputError,
     InvalidOperationException,
     NotSupportedLookup,
+    PrecisionLossException,
+    RateNotFoundException,
 )
 
 __all__ = [
     "Money",
+    "MoneyBag",
+    "FastMoney",
     "Currency",
     "DEFAULT_CURRENCY",
     "CURRENCY_LIST",
@@ -18,4 +25,29 @@ __all__ = [
     "CurrencyMismatchException",
     "InvalidOperationException",
     "NotSupportedLookup",
+    "PrecisionLossException",
+    "RateNotFoundException",
+    "sum_money",
 ]
+
+if TYPE_CHECKING:
+    from money.dataclasses.fast_money import FastMoney
+    from money.dataclasses.money import sum_money
+    from money.dataclasses.money_bag import MoneyBag
+
+# Imported on first use, they aren't needed to work with Money
+_LAZY = {
+    "FastMoney": "money.dataclasses.fast_money",
+    "MoneyBag": "money.dataclasses.money_bag",
+    "sum_money": "money.dataclasses.money",
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module = _LAZY[name]
+    except KeyError:
+        raise AttributeError("module %r has no attribute %r" % (__name__, name))
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
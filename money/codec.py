@@ -0,0 +1,368 @@
+"""
+A compact binary encoding for streams of Money values
+
+    with open('ledger.bin', 'wb') as f, MoneyEncoder(f) as encoder:
+        encoder.write_many(values)
+
+    with open('ledger.bin', 'rb') as f:
+        for value in MoneyDecoder(f):
+            ...
+
+A stream is a header followed by blocks of up to block_size values, so
+neither side holds more than a block in memory. Currencies are dictionary
+encoded: each block lists the codes that are new to the stream and every
+value refers to one by index. Amounts are written either exactly, as a sign,
+coefficient and exponent, or with minor_units as a whole number of the
+currency's minor unit.
+"""
+
+import dataclasses
+import io
+import struct
+import sys
+from array import array
+from decimal import Decimal
+from typing import TYPE_CHECKING, BinaryIO, Iterable, Iterator
+
+from money.constants import CURRENCY
+from money.dataclasses.currency import Currency
+from money.dataclasses.money import Money, _from_minor_units, _minor_units
+
+if TYPE_CHECKING:
+    from money.dataclasses.money_array import MoneyArray
+
+# Stream layout, all little-endian:
+#   header  magic, format version, layout (0 exact, 1 minor units)
+#   blocks  number of values, number of new currencies, the new codes, then
+#           columns of uint16 currency indexes and either uint8 signs, int8
+#           exponents and uint64 coefficients or int64 minor units
+_MAGIC = b"PMNC"
+_VERSION = 1
+_HEADER = struct.Struct("<4sBB2x")
+_BLOCK = struct.Struct("<IH")
+
+_EXACT = 0
+_MINOR_UNITS = 1
+
+# Values per block written by a MoneyEncoder
+_BLOCK_SIZE = 65_536
+
+_UINT64_MAX = 2**64 - 1
+
+
+def _to_bytes(values: "array[int]") -> bytes:
+    if sys.byteorder != "little":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _from_bytes(typecode: str, data: bytes) -> "array[int]":
+    values = array(typecode, data)
+    if sys.byteorder != "little":
+        values.byteswap()
+    return values
+
+
+def _exact(amount: Decimal) -> tuple[int, int, int]:
+    """The sign, coefficient and exponent of a finite amount"""
+    # Going through str is quicker than as_tuple, which needs its digits joined
+    text = str(amount)
+    if "E" not in text:
+        whole, _, fraction = text.partition(".")
+        try:
+            return text[0] == "-", abs(int(whole + fraction)), -len(fraction)
+        except ValueError:
+            raise ValueError("%s can't be encoded" % amount)
+    sign, _, exponent = amount.as_tuple()
+    assert isinstance(exponent, int)
+    return sign, int(amount.scaleb(-exponent).copy_abs()), exponent
+
+
+@dataclasses.dataclass(frozen=True)
+class MoneyColumns:
+    """
+    Values decoded into columns, without building a Money for each
+
+    The currency of every value is an index into currencies. The amounts are
+    either units, whole numbers of each currency's minor unit, or the signs,
+    exponents and coefficients of the exact amounts, depending on how the
+    stream was written. Money instances are only built for the values that
+    are looked at.
+
+        columns = MoneyDecoder(f).read_columns()
+        columns[0]             # USD 1.50
+        columns.to_money()     # [USD 1.50, ...]
+    """
+
+    currencies: tuple[Currency, ...]
+    indexes: "array[int]"
+    units: "array[int] | None" = None
+    signs: "array[int] | None" = None
+    exponents: "array[int] | None" = None
+    coefficients: "array[int] | None" = None
+
+    def __len__(self) -> int:
+        return len(self.indexes)
+
+    def __getitem__(self, index: int) -> Money:
+        currency = self.currencies[self.indexes[index]]
+        if self.units is not None:
+            return _from_minor_units(self.units[index], currency)
+        assert self.signs is not None and self.exponents is not None
+        assert self.coefficients is not None
+        amount = Decimal(self.coefficients[index]).scaleb(self.exponents[index])
+        if self.signs[index]:
+            amount = amount.copy_negate()
+        return Money._from_parts(amount, currency)
+
+    def __iter__(self) -> Iterator[Money]:
+        currencies = self.currencies
+        from_parts = Money._from_parts
+        if self.units is not None:
+            exponents = [-currency.decimals for currency in currencies]
+            for code, units in zip(self.indexes, self.units):
+                yield from_parts(
+                    Decimal(units).scaleb(exponents[code]), currencies[code]
+                )
+            return
+        assert self.signs is not None and self.exponents is not None
+        assert self.coefficients is not None
+        columns = zip(self.indexes, self.signs, self.exponents, self.coefficients)
+        for code, sign, exponent, coefficient in columns:
+            amount = Decimal(coefficient).scaleb(exponent)
+            yield from_parts(amount.copy_negate() if sign else amount, currencies[code])
+
+    def to_money(self) -> list[Money]:
+        return list(self)
+
+    def to_array(self) -> "MoneyArray":
+        """
+        The values as a MoneyArray. Requires numpy. Columns of minor units are
+        taken over as they are, exact amounts must be whole minor units.
+        """
+        from money.dataclasses.money_array import MoneyArray
+
+        if self.units is None:
+            return MoneyArray(self)
+
+        import numpy as np
+
+        return MoneyArray._from_parts(
+            np.frombuffer(self.units, dtype=np.int64),
+            np.frombuffer(self.indexes, dtype=np.uint16).astype(np.intp),
+            self.currencies,
+        )
+
+
+class MoneyEncoder:
+    """
+    Writes Money values to a binary stream, a block at a time
+
+    By default amounts are written exactly, as a sign, an exponent and a
+    coefficient of up to 64 bits, so USD 1.5 and USD 1.50 stay distinct.
+    With minor_units each amount is a single int64 of the currency's minor
+    unit, which is smaller and decodes faster. Amounts finer than the minor
+    unit then raise PrecisionLossException, and decoded values carry the
+    currency's number of decimals.
+
+    Only currencies of the registry can be written. The stream itself is not
+    closed, flush (or leaving the with block) writes what is buffered.
+    """
+
+    def __init__(
+        self,
+        stream: BinaryIO,
+        minor_units: bool = False,
+        block_size: int = _BLOCK_SIZE,
+    ):
+        self._stream = stream
+        self._minor_units = minor_units
+        self._block_size = block_size
+        self._index: dict[str, int] = {}
+        self._new_codes: list[str] = []
+        self._indexes: array[int] = array("H")
+        self._units: array[int] = array("q")
+        self._signs: array[int] = array("B")
+        self._exponents: array[int] = array("b")
+        self._coefficients: array[int] = array("Q")
+        stream.write(
+            _HEADER.pack(_MAGIC, _VERSION, _MINOR_UNITS if minor_units else _EXACT)
+        )
+
+    def _code_index(self, currency: Currency) -> int:
+        index = self._index.get(currency.code)
+        if index is None:
+            if CURRENCY.get(currency.code) is None:
+                raise ValueError("Unknown currency %s can't be encoded" % currency)
+            if len(self._index) > 0xFFFF:
+                raise ValueError("Too many currencies in one stream")
+            index = self._index[currency.code] = len(self._index)
+            self._new_codes.append(currency.code)
+        return index
+
+    def write(self, value: Money) -> None:
+        self.write_many((value,))
+
+    def write_many(self, values: Iterable[Money]) -> None:
+        index = self._index
+        indexes = self._indexes
+        units = self._units
+        signs = self._signs
+        exponents = self._exponents
+        coefficients = self._coefficients
+        for value in values:
+            currency = value._currency
+            code = index.get(currency.code)
+            if code is None:
+                code = self._code_index(currency)
+            if self._minor_units:
+                units.append(_minor_units(value._amount, currency, None))
+            else:
+                sign, coefficient, exponent = _exact(value._amount)
+                if coefficient > _UINT64_MAX or not -128 <= exponent <= 127:
+                    raise ValueError("%s has too many digits to encode" % value)
+                signs.append(sign)
+                exponents.append(exponent)
+                coefficients.append(coefficient)
+            indexes.append(code)
+            if len(indexes) >= self._block_size:
+                self.flush()
+
+    def flush(self) -> None:
+        """Writes the buffered values as a block"""
+        if not self._indexes:
+            return
+        columns = (
+            [self._indexes, self._units]
+            if self._minor_units
+            else [self._indexes, self._signs, self._exponents, self._coefficients]
+        )
+        self._stream.write(
+            b"".join(
+                [
+                    _BLOCK.pack(len(self._indexes), len(self._new_codes)),
+                    "".join(self._new_codes).encode(),
+                    *(_to_bytes(column) for column in columns),
+                ]
+            )
+        )
+        self._new_codes = []
+        for column in columns:
+            del column[:]
+
+    def __enter__(self) -> "MoneyEncoder":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.flush()
+
+
+class MoneyDecoder:
+    """
+    Reads Money values from a stream written by MoneyEncoder
+
+    Iterating yields Money values, reading one block at a time. blocks
+    yields each block as MoneyColumns instead, and read_columns reads the
+    rest of the stream into one. Truncated or foreign streams raise
+    ValueError.
+    """
+
+    def __init__(self, stream: BinaryIO):
+        self._stream = stream
+        header = stream.read(_HEADER.size)
+        if len(header) < _HEADER.size or header[:4] != _MAGIC:
+            raise ValueError("Not a Money stream")
+        _, version, layout = _HEADER.unpack(header)
+        if version != _VERSION or layout not in (_EXACT, _MINOR_UNITS):
+            raise ValueError("Unsupported Money stream version %s" % version)
+        self._minor_units = bool(layout == _MINOR_UNITS)
+        self._currencies: tuple[Currency, ...] = ()
+
+    @property
+    def minor_units(self) -> bool:
+        return self._minor_units
+
+    def _read(self, size: int) -> bytes:
+        data = self._stream.read(size)
+        if len(data) != size:
+            raise ValueError("Truncated Money stream")
+        return data
+
+    def blocks(self) -> Iterator[MoneyColumns]:
+        while True:
+            header = self._stream.read(_BLOCK.size)
+            if not header:
+                return
+            if len(header) != _BLOCK.size:
+                raise ValueError("Truncated Money stream")
+            count, new = _BLOCK.unpack(header)
+            if new:
+                codes = self._read(3 * new).decode()
+                self._currencies += tuple(
+                    CURRENCY[codes[i : i + 3]] for i in range(0, len(codes), 3)
+                )
+            indexes = _from_bytes("H", self._read(2 * count))
+            if self._minor_units:
+                yield MoneyColumns(
+                    self._currencies, indexes, _from_bytes("q", self._read(8 * count))
+                )
+            else:
+                yield MoneyColumns(
+                    self._currencies,
+                    indexes,
+                    signs=_from_bytes("B", self._read(count)),
+                    exponents=_from_bytes("b", self._read(count)),
+                    coefficients=_from_bytes("Q", self._read(8 * count)),
+                )
+
+    def read_columns(self) -> MoneyColumns:
+        """The rest of the stream as one set of columns"""
+        indexes: array[int] = array("H")
+        if self._minor_units:
+            units: array[int] = array("q")
+            for block in self.blocks():
+                assert block.units is not None
+                indexes.extend(block.indexes)
+                units.extend(block.units)
+            return MoneyColumns(self._currencies, indexes, units)
+
+        signs: array[int] = array("B")
+        exponents: array[int] = array("b")
+        coefficients: array[int] = array("Q")
+        for block in self.blocks():
+            assert block.signs is not None and block.exponents is not None
+            assert block.coefficients is not None
+            indexes.extend(block.indexes)
+            signs.extend(block.signs)
+            exponents.extend(block.exponents)
+            coefficients.extend(block.coefficients)
+        return MoneyColumns(
+            self._currencies,
+            indexes,
+            signs=signs,
+            exponents=exponents,
+            coefficients=coefficients,
+        )
+
+    def __iter__(self) -> Iterator[Money]:
+        for block in self.blocks():
+            yield from block
+
+
+def encode(values: Iterable[Money], minor_units: bool = False) -> bytes:
+    """The values as a Money stream, see MoneyEncoder"""
+    stream = io.BytesIO()
+    with MoneyEncoder(stream, minor_units) as encoder:
+        encoder.write_many(values)
+    return stream.getvalue()
+
+
+def decode(data: bytes) -> list[Money]:
+    """The values of a Money stream"""
+    return list(MoneyDecoder(io.BytesIO(data)))
+
+
+def decode_columns(data: bytes) -> MoneyColumns:
+    """The values of a Money stream as columns, see MoneyColumns"""
+    return MoneyDecoder(io.BytesIO(data)).read_columns()
@@ -0,0 +1,69 @@
+from typing import Any
+
+from django.db.models import Avg, Max, Min, Sum
+from django.db.models.constants import LOOKUP_SEP
+
+from money.contrib.django.models.utils import currency_field_name
+
+__all__ = ("MoneyAggregateMixin", "MoneyAvg", "MoneyMax", "MoneyMin", "MoneySum")
+
+
+class MoneyAggregateMixin:
+    """
+    Mixin for aggregates of a MoneyField that are computed per currency.
+
+    The aggregate itself only covers the amount column, so it must be grouped
+    by the currency column to mean anything. MoneyQuerySet.aggregate does the
+    grouping, in one GROUP BY query for all the aggregates of a field, and
+    returns a mapping of each currency to a Money:
+
+        Invoice.objects.aggregate(total=MoneySum('total'))
+        # {'total': {USD: USD 1250.00, EUR: EUR 80.00}}
+
+    They can also be used in annotate() on a queryset grouped by the currency
+    column. Passing one to a plain QuerySet.aggregate, which would add up
+    amounts of different currencies, raises TypeError.
+    """
+
+    def __init__(self, field_name: str, **extra: Any):
+        self.field_name = field_name
+        super().__init__(field_name, **extra)  # type: ignore[call-arg]
+
+    @property
+    def currency_field_name(self) -> str:
+        """The currency column to group by, following any relations"""
+        *path, name = self.field_name.split(LOOKUP_SEP)
+        return LOOKUP_SEP.join([*path, currency_field_name(name)])
+
+    def resolve_expression(
+        self,
+        query: Any = None,
+        allow_joins: bool = True,
+        reuse: Any = None,
+        summarize: bool = False,
+        for_save: bool = False,
+    ) -> Any:
+        if summarize:
+            raise TypeError(
+                "%s is computed per currency, use MoneyQuerySet.aggregate()"
+                % type(self).__name__
+            )
+        return super().resolve_expression(  # type: ignore[misc]
+            query, allow_joins, reuse, summarize, for_save
+        )
+
+
+class MoneySum(MoneyAggregateMixin, Sum):
+    pass
+
+
+class MoneyMin(MoneyAggregateMixin, Min):
+    pass
+
+
+class MoneyMax(MoneyAggregateMixin, Max):
+    pass
+
+
+class MoneyAvg(MoneyAggregateMixin, Avg):
+    pass
@@ -177,8 +177,12 @@ class MoneyField(InfiniteDecimalField):
                 blank=self.blankable,
                 db_column=currency_db_column,
             )
-            # Use this field's creation counter for the currency field. This
-            # field will get a +1 when we call super
+            # Use this field's creation counter for the currency field. Django
+            # compares fields by their creation counter, so from Django 4.2 on
+            # the two fields are one entry in a queryset's select mask: only()
+            # or defer() of either name loads both columns, and they are only
+            # left out together. Earlier versions select one of the two
+            # columns, MoneyQuerySet selects both there.
             c_field.creation_counter = self.creation_counter
             cls.add_to_class(self.currency_field_name, c_field)
 
@@ -188,6 +192,16 @@ class MoneyField(InfiniteDecimalField):
         # As we are not using SubfieldBase, we need to set our proxy class here
         setattr(cls, self.name, MoneyFieldProxy(self))
 
+    def pre_save(self, model_instance: models.Model, add: bool) -> Any:
+        """
+        The amount to save, as the proxy holds it. Reading the attribute
+        would build a Money only for get_db_prep_save to take it apart.
+        """
+        try:
+            return model_instance.__dict__[self.attname]
+        except KeyError:
+            return super().pre_save(model_instance, add)
+
     def get_db_prep_save(self, value: Any, connection: BaseDatabaseWrapper) -> Any:
         """
         Called when the Field value must be saved to the database. As the
@@ -195,9 +209,15 @@ class MoneyField(InfiniteDecimalField):
         need to implement this method unless your custom field needs a special
         conversion when being saved that is not the same as the conversion used
         for normal query parameters
+
+        save() and bulk_create call this for every row, so amounts, Money and
+        None are returned straight away. They come out of the generic path
+        unchanged anyway, as to_python leaves them alone.
         """
+        if isinstance(value, Decimal) or value is None:
+            return value
         if isinstance(value, Money):
-            value = value.amount
+            return value.amount
 
         return super().get_db_prep_save(value, connection)
 
@@ -3,6 +3,7 @@ from typing import TYPE_CHECKING, Any
 
 from django.db import models
 
+from money.constants import CURRENCY
 from money.dataclasses.currency import Currency
 from money.dataclasses.money import Money
 
@@ -21,6 +22,16 @@ class MoneyFieldProxy:
     whenever something is assigned. If the attribute is read, it builds the
     instance "on-demand" with the current data.
 
+    The Money built is cached on the instance together with the amount and
+    currency it was built from. Reads return the cached Money for as long as
+    both of those are still the ones in the instance, so assigning to the
+    amount or currency attributes directly (as refresh_from_db does) is
+    picked up on the next read.
+
+    The two columns are deferred together (see MoneyField), and reading the
+    attribute of an instance loaded without them fetches both in a single
+    query instead of building a Money without its currency.
+
     See: http://blog.elsdoerfer.name/2008/01/08/fuzzydates-or-one-django-model-field-multiple-database-columns/
     """
 
@@ -28,6 +39,7 @@ class MoneyFieldProxy:
         self.field = field
         self.amount_field_name: str = field.name
         self.currency_field_name: str = field.currency_field_name
+        self.cache_name: str = "_%s_money_cache" % field.name
 
     def _get_values(self, obj: models.Model) -> tuple[Decimal | None, str | None]:
         return (
@@ -43,29 +55,81 @@ class MoneyFieldProxy:
     ) -> None:
         obj.__dict__[self.amount_field_name] = amount
         obj.__dict__[self.currency_field_name] = currency
+        obj.__dict__.pop(self.cache_name, None)
+
+    def _set_amount(self, obj: models.Model, amount: Decimal) -> None:
+        """
+        Sets the amount alone, keeping the currency that is currently set. A
+        deferred currency stays deferred rather than becoming None.
+        """
+        values = obj.__dict__
+        values[self.amount_field_name] = amount
+        values.pop(self.cache_name, None)
+
+    def _load_deferred(self, obj: models.Model) -> None:
+        """Loads whichever of the two columns were deferred, in one query"""
+        missing = [
+            name
+            for name in (self.amount_field_name, self.currency_field_name)
+            if name not in obj.__dict__
+        ]
+        if missing:
+            deferred = obj.get_deferred_fields()
+            fields = [name for name in missing if name in deferred]
+            if fields:
+                # Not refresh_from_db, which would reload the other column too
+                # and lose an amount assigned since the instance was loaded
+                manager = type(obj)._base_manager.db_manager(
+                    obj._state.db, hints={"instance": obj}
+                )
+                row = manager.filter(pk=obj.pk).values_list(*fields).get()
+                obj.__dict__.update(zip(fields, row))
 
     def __get__(self, obj: models.Model, *args: Any) -> Any:
         if obj is None:
             return self
-        amount, currency = self._get_values(obj)
-        if amount is None:
-            return None
-        return Money(amount, currency)
+        values = obj.__dict__
+        amount = values.get(self.amount_field_name)
+        currency = values.get(self.currency_field_name)
+        if amount is None or currency is None:
+            self._load_deferred(obj)
+            amount = values.get(self.amount_field_name)
+            currency = values.get(self.currency_field_name)
+            if amount is None:
+                return None
+        # Identity is enough, the amount and currency are immutable
+        cached = values.get(self.cache_name)
+        if cached is not None and cached[0] is amount and cached[1] is currency:
+            return cached[2]
+        resolved = currency
+        if isinstance(currency, str):
+            # Loaded rows hold the code, look it up once per cached Money
+            resolved = CURRENCY.get(currency)
+        if isinstance(amount, Decimal) and isinstance(resolved, Currency):
+            money = Money._from_parts(amount, resolved)
+        else:
+            money = Money(amount, currency)
+        values[self.cache_name] = (amount, currency, money)
+        return money
 
     def __set__(self, obj: models.Model, value: Any) -> Any:
-        if value is None:  # Money(0) is False
+        if isinstance(value, Decimal):
+            # Every row loaded from the database comes through here
+            self._set_amount(obj, value)
+        elif value is None:  # Money(0) is False
             self._set_values(obj, None, "")
         elif isinstance(value, Money):
             self._set_values(obj, value.amount, value.currency.code)
-        elif isinstance(value, Decimal):
-            _, currency = self._get_values(obj)  # use what is currently set
-            self._set_values(obj, value, currency)
+            # Reading the attribute back gives the Money that was assigned
+            obj.__dict__[self.cache_name] = (
+                value.amount,
+                value.currency.code,
+                value,
+            )
         else:
             # It could be an int, or some other python native type
             try:
-                amount = Decimal(str(value))
-                _, currency = self._get_values(obj)  # use what is currently set
-                self._set_values(obj, amount, currency)
+                self._set_amount(obj, Decimal(str(value)))
             except TypeError:
                 # Lastly, assume string type 'XXX 123' or something Money can
                 # handle.
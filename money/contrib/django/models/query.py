@@ -0,0 +1,167 @@
+from typing import Any, Iterable, TypeVar
+
+from django.db import models
+from django.db.models import QuerySet
+from django.db.models.sql import Query
+
+from money.contrib.django.models.aggregates import MoneyAggregateMixin
+from money.contrib.django.models.fields import MoneyField
+from money.dataclasses.currency import Currency
+from money.dataclasses.money import Money
+
+__all__ = ("MoneyQuerySet", "money_field_names")
+
+T = TypeVar("T", bound=models.Model)
+
+
+def money_field_names(model: type[models.Model], names: Iterable[str]) -> list[str]:
+    """
+    The field names with the currency field of every MoneyField among them
+    added after it, so that writing one writes both of its columns
+    """
+    expanded: list[str] = []
+    for name in names:
+        if name not in expanded:
+            expanded.append(name)
+        field = model._meta.get_field(name)
+        if isinstance(field, MoneyField) and field.add_currency_field:
+            if field.currency_field_name not in expanded:
+                expanded.append(field.currency_field_name)
+    return expanded
+
+
+def _money_field_pairs(model: type[models.Model]) -> dict[str, str]:
+    """The amount and currency field names of every MoneyField, both ways"""
+    pairs: dict[str, str] = {}
+    for field in model._meta.get_fields():
+        if isinstance(field, MoneyField) and field.add_currency_field:
+            pairs[field.name] = field.currency_field_name
+            pairs[field.currency_field_name] = field.name
+    return pairs
+
+
+class _MoneyQuery(Query):
+    """
+    Loads or leaves out the two columns of a MoneyField together
+
+    Django 4.2 does this by itself, the two fields share a creation counter
+    and are one entry in the select mask. Earlier versions keep only one of
+    the two equal fields: only() naming one selects a single column, and
+    defer() naming one leaves out both. Either way reading the Money then
+    takes a query per row.
+    """
+
+    def deferred_to_data(self, target: dict[Any, set[str]], *args: Any) -> None:
+        # Django 4.0 passes a callback too, 4.2 no longer calls this
+        super().deferred_to_data(target, *args)
+        field_names, defer = self.deferred_loading
+        for model, names in target.items():
+            pairs = _money_field_pairs(model)
+            if defer:
+                # Left out only when both are named, as in Django 4.2
+                names.update(
+                    name
+                    for name, partner in pairs.items()
+                    if (name in field_names) != (partner in field_names)
+                )
+            else:
+                names.update([pairs[name] for name in names if name in pairs])
+
+
+class MoneyQuerySet(QuerySet[T]):
+    """
+    A QuerySet whose bulk operations write each MoneyField as a whole
+
+    bulk_update(objs, ['price']) updates price_currency as well, as does
+    bulk_create with update_conflicts and update_fields=['price']. Without it
+    the currency column has to be listed next to the amount, and leaving it
+    out silently keeps the old currencies.
+
+    only() and defer() treat the two columns of a MoneyField as one on every
+    supported Django version: only() naming either loads both, and defer()
+    leaves them out only when it names both. Plain querysets do the same from
+    Django 4.2 on. Before that they leave out a column on its own, and reading
+    the Money then takes a query per row.
+
+    aggregate computes MoneySum, MoneyMin, MoneyMax and MoneyAvg per
+    currency, see MoneyAggregateMixin.
+
+        class Invoice(models.Model):
+            total = MoneyField(max_digits=12, decimal_places=2)
+
+            objects = MoneyQuerySet.as_manager()
+
+    Custom QuerySets can subclass it.
+    """
+
+    def __init__(
+        self,
+        model: type[T] | None = None,
+        query: Query | None = None,
+        using: str | None = None,
+        hints: dict[str, models.Model] | None = None,
+    ):
+        super().__init__(model, query or _MoneyQuery(model), using, hints)
+
+    def bulk_create(self, objs: Iterable[T], *args: Any, **kwargs: Any) -> list[T]:
+        # Only update_conflicts needs this, the currency columns are always
+        # inserted. Keyword only, the argument is new in Django 4.1
+        if kwargs.get("update_fields"):
+            kwargs["update_fields"] = money_field_names(
+                self.model, kwargs["update_fields"]
+            )
+        return super().bulk_create(objs, *args, **kwargs)
+
+    def bulk_update(
+        self, objs: Iterable[T], fields: Iterable[str], batch_size: int | None = None
+    ) -> int:
+        return super().bulk_update(
+            objs, money_field_names(self.model, fields), batch_size
+        )
+
+    def aggregate(self, *args: Any, **kwargs: Any) -> dict[str, Any]:
+        """
+        Like QuerySet.aggregate, except that each Money aggregate is a
+        mapping of currency to Money. All the Money aggregates of a field are
+        computed together, in one query grouped by its currency column.
+        Currencies without a value (only null amounts) are left out.
+        """
+        for arg in args:
+            if isinstance(arg, MoneyAggregateMixin):
+                kwargs[arg.default_alias] = arg  # type: ignore[attr-defined]
+        money = {
+            alias: aggregate
+            for alias, aggregate in kwargs.items()
+            if isinstance(aggregate, MoneyAggregateMixin)
+        }
+        others = [arg for arg in args if not isinstance(arg, MoneyAggregateMixin)]
+        for alias in money:
+            del kwargs[alias]
+        results = super().aggregate(*others, **kwargs) if others or kwargs else {}
+
+        by_currency: dict[str, dict[str, MoneyAggregateMixin]] = {}
+        for alias, aggregate in money.items():
+            by_currency.setdefault(aggregate.currency_field_name, {})[alias] = aggregate
+        for currency_field, aggregates in by_currency.items():
+            # Annotated under names of our own, the aliases could clash with
+            # the model's fields
+            columns = {"_money_%d" % i: alias for i, alias in enumerate(aggregates)}
+            totals: dict[str, dict[Currency, Money]] = {
+                alias: {} for alias in aggregates
+            }
+            rows = (
+                self.order_by()
+                .values(currency_field)
+                .annotate(
+                    **{column: aggregates[alias] for column, alias in columns.items()}
+                )
+            )
+            for row in rows:
+                currency = row[currency_field]
+                for column, alias in columns.items():
+                    amount = row[column]
+                    if amount is not None:
+                        value = Money(amount, currency)
+                        totals[alias][value.currency] = value
+            results.update(totals)
+        return results
@@ -1,8 +1,26 @@
 import dataclasses
+from typing import Any
+
+
+def _registered(code: str) -> "Currency":
+    """Unpickles a currency of the registry as the registry's instance"""
+    from money.constants import CURRENCY
+
+    return CURRENCY[code]
 
 
 @dataclasses.dataclass(frozen=True)
 class Currency:
+    """
+    An ISO 4217 currency
+
+    The instances in money.constants.CURRENCY are the canonical ones and Money
+    always refers to those when it is given a currency code, so comparisons
+    between them are usually decided by identity. Currencies hash on their
+    code, which makes them usable as dict keys and set members. A registry
+    currency pickles as just its code and unpickles as the registry instance.
+    """
+
     code: str = "XXX"
     numeric: str = "999"
     name: str = ""
@@ -13,7 +31,31 @@ class Currency:
     def __repr__(self) -> str:
         return self.code
 
+    @classmethod
+    def by_numeric(cls, numeric: str | int) -> "Currency":
+        """
+        The registry currency with the given ISO 4217 numeric code. Raises
+        KeyError for unknown codes.
+        """
+        from money.constants import CURRENCY
+
+        return CURRENCY.by_numeric(numeric)
+
+    def __reduce__(self) -> tuple[Any, tuple[Any, ...]]:
+        from money.constants import CURRENCY
+
+        if CURRENCY.get(self.code) is self:
+            return (_registered, (self.code,))
+        return (self.__class__, dataclasses.astuple(self))
+
+    def __hash__(self) -> int:
+        # Must agree with __eq__, which only looks at the code and also accepts
+        # the bare code as a string
+        return hash(self.code)
+
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         if isinstance(other, Currency):
             return bool(self.code and other.code and (self.code == other.code))
         if isinstance(other, str):
@@ -0,0 +1,275 @@
+import dataclasses
+from decimal import ROUND_CEILING, ROUND_FLOOR, Decimal
+from typing import Any, Union
+
+from money.constants import CURRENCY
+from money.dataclasses.currency import Currency
+from money.dataclasses.money import (
+    Money,
+    _from_minor_units,
+    _minor_units,
+    _pickled_currency,
+    _unpickled_currency,
+)
+from money.exceptions import (
+    CurrencyMismatchException,
+    InvalidOperationException,
+    PrecisionLossException,
+)
+
+CompareWithFastMoney = Union["FastMoney", Decimal | int | float | str]
+
+
+def _scale(currency: Currency) -> int:
+    """The number of minor units in one major unit of the currency"""
+    scale: int = 10**currency.decimals
+    return scale
+
+
+def _unpickle(
+    cls: type["FastMoney"], units: int, currency: str | Currency
+) -> "FastMoney":
+    return cls._from_parts(units, _unpickled_currency(currency))
+
+
+@dataclasses.dataclass(frozen=True, eq=False)
+class FastMoney:
+    """
+    An amount of money held as a whole number of its currency's minor unit
+
+    FastMoney stores cents for USD, yen for JPY and so on as a plain int, so
+    arithmetic and comparisons are int operations instead of Decimal ones.
+    It is built from the same input as Money and follows the same rules:
+    mixing currencies raises CurrencyMismatchException and multiplying or
+    dividing by money raises InvalidOperationException. Anything that would
+    leave a fraction of a minor unit raises PrecisionLossException instead of
+    rounding.
+
+        FastMoney('1.50', 'USD') * 3          # USD 4.50
+        FastMoney('1.50', 'USD') / 4          # Raises PrecisionLossException
+        FastMoney('0.001', 'USD')             # Raises PrecisionLossException
+        FastMoney.from_money(Money('2', 'USD')).to_money()  # USD 2.00
+
+    FastMoney and Money don't mix in operations, convert explicitly with
+    from_money and to_money. Instances are immutable.
+    """
+
+    # Declared by hand, dataclass(slots=True) breaks frozen classes on 3.10
+    __slots__ = ("_units", "_currency")
+
+    _units: int
+    _currency: Currency
+
+    def __init__(
+        self,
+        amount: str | Decimal | int | float | None = None,
+        currency: str | Currency | None = None,
+    ):
+        money = Money(amount, currency)
+        _set_units(self, _minor_units(money._amount, money._currency, None))
+        _set_currency(self, money._currency)
+
+    @classmethod
+    def _from_parts(cls, units: int, currency: Currency) -> "FastMoney":
+        """Trusted constructor for the results of arithmetic"""
+        money = _new(cls)
+        _set_units(money, units)
+        _set_currency(money, currency)
+        return money
+
+    @classmethod
+    def from_units(cls, units: int, currency: str | Currency) -> "FastMoney":
+        """A whole number of minor units, e.g. from_units(150, 'USD') is USD 1.50"""
+        if not isinstance(currency, Currency):
+            currency = CURRENCY[currency.upper()]
+        return cls._from_parts(int(units), currency)
+
+    @classmethod
+    def from_money(cls, value: Money, rounding: str | None = None) -> "FastMoney":
+        """
+        Converts a Money. Amounts finer than the currency's minor unit raise
+        PrecisionLossException unless a decimal rounding mode is given, e.g.
+        ROUND_HALF_EVEN.
+        """
+        return cls._from_parts(
+            _minor_units(value._amount, value._currency, rounding), value._currency
+        )
+
+    def to_money(self) -> Money:
+        return _from_minor_units(self._units, self._currency)
+
+    def __reduce__(
+        self,
+    ) -> tuple[Any, tuple[type["FastMoney"], int, str | Currency]]:
+        # As Money, only the units and the code of a registry currency
+        return (
+            _unpickle,
+            (self.__class__, self._units, _pickled_currency(self._currency)),
+        )
+
+    @property
+    def amount(self) -> Decimal:
+        return Decimal(self._units).scaleb(-self._currency.decimals)
+
+    @property
+    def currency(self) -> Currency:
+        return self._currency
+
+    @property
+    def units(self) -> int:
+        return self._units
+
+    def _currency_check(self, other: "FastMoney") -> None:
+        """Compare the currencies matches and raise if not"""
+        if self._currency is not other._currency and self._currency != other._currency:
+            raise CurrencyMismatchException(
+                "Currency mismatch: %s != %s" % (self._currency, other._currency)
+            )
+
+    def _operand_units(
+        self, other: CompareWithFastMoney, rounding: str | None = None
+    ) -> int:
+        """The other operand in this currency's minor unit"""
+        if isinstance(other, FastMoney):
+            self._currency_check(other)
+            return other._units
+        if isinstance(other, Money):
+            raise InvalidOperationException(
+                "Cannot mix Money and FastMoney, convert with FastMoney.from_money"
+            )
+        if isinstance(other, int):
+            return other * _scale(self._currency)
+        return _minor_units(Decimal(str(other)), self._currency, rounding)
+
+    def _scaled(self, numerator: int, denominator: int) -> "FastMoney":
+        if denominator < 0:
+            numerator, denominator = -numerator, -denominator
+        units, remainder = divmod(self._units * numerator, denominator)
+        if remainder:
+            raise PrecisionLossException("Result can't be represented in minor units")
+        return FastMoney._from_parts(units, self._currency)
+
+    def __str__(self) -> str:
+        return "{} {}".format(self._currency, self.amount)
+
+    def __repr__(self) -> str:
+        return str(self)
+
+    def __float__(self) -> float:
+        return self._units / _scale(self._currency)
+
+    def __int__(self) -> int:
+        return int(self.amount)
+
+    def __pos__(self) -> "FastMoney":
+        return FastMoney._from_parts(self._units, self._currency)
+
+    def __neg__(self) -> "FastMoney":
+        return FastMoney._from_parts(-self._units, self._currency)
+
+    # The operators handle FastMoney in the same canonical currency inline, it
+    # is by far the most common operand
+    def __add__(self, other: CompareWithFastMoney) -> "FastMoney":
+        if isinstance(other, FastMoney) and other._currency is self._currency:
+            units = other._units
+        else:
+            units = self._operand_units(other)
+        return FastMoney._from_parts(self._units + units, self._currency)
+
+    def __sub__(self, other: CompareWithFastMoney) -> "FastMoney":
+        if isinstance(other, FastMoney) and other._currency is self._currency:
+            units = other._units
+        else:
+            units = self._operand_units(other)
+        return FastMoney._from_parts(self._units - units, self._currency)
+
+    def __rsub__(self, other: CompareWithFastMoney) -> None:
+        raise TypeError("Cannot subtract FastMoney from %r" % other)
+
+    def __mul__(self, other: CompareWithFastMoney) -> "FastMoney":
+        if isinstance(other, (Money, FastMoney)):
+            raise InvalidOperationException("Cannot multiply monetary quantities")
+        if isinstance(other, int):
+            return FastMoney._from_parts(self._units * other, self._currency)
+        return self._scaled(*Decimal(str(other)).as_integer_ratio())
+
+    def __truediv__(self, other: int | Decimal) -> "FastMoney":
+        """
+        We allow division by non-money numeric values but dividing by
+        another money value is undefined
+        """
+        if isinstance(other, (Money, FastMoney)):
+            raise InvalidOperationException("Cannot divide two monetary quantities")
+        if not isinstance(other, (int, Decimal)):
+            return NotImplemented
+        numerator, denominator = Decimal(other).as_integer_ratio()
+        if not numerator:
+            raise ZeroDivisionError("Division of FastMoney by zero")
+        return self._scaled(denominator, numerator)
+
+    def __floordiv__(self, other: CompareWithFastMoney) -> None:
+        raise InvalidOperationException(
+            "Floor division not supported for monetary quantities"
+        )
+
+    def __rtruediv__(self, other: CompareWithFastMoney) -> None:
+        raise InvalidOperationException("Cannot divide by monetary quantities")
+
+    # Commutative operations
+    __radd__ = __add__
+    __rmul__ = __mul__
+
+    # Boolean
+    def __bool__(self) -> bool:
+        return self._units != 0
+
+    # Comparison operators
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, FastMoney):
+            return self._units == other._units and (
+                self._currency is other._currency or self._currency == other._currency
+            )
+
+        if isinstance(other, (Decimal, int, float, str)):
+            # Allow comparison to 0
+            if (other == 0) and (self._units == 0):
+                return True
+        return False
+
+    def __ne__(self, other: object) -> bool:
+        return not self.__eq__(other)
+
+    def __hash__(self) -> int:
+        # Must agree with __eq__, all zeros hash like 0 does
+        if not self._units:
+            return 0
+        return hash((self._units, self._currency.code))
+
+    # Comparing whole units against a finer amount is the same as comparing
+    # against that amount rounded in the right direction
+    def __lt__(self, other: CompareWithFastMoney) -> bool:
+        if isinstance(other, FastMoney) and other._currency is self._currency:
+            return self._units < other._units
+        return self._units < self._operand_units(other, ROUND_CEILING)
+
+    def __le__(self, other: CompareWithFastMoney) -> bool:
+        if isinstance(other, FastMoney) and other._currency is self._currency:
+            return self._units <= other._units
+        return self._units <= self._operand_units(other, ROUND_FLOOR)
+
+    def __gt__(self, other: CompareWithFastMoney) -> bool:
+        if isinstance(other, FastMoney) and other._currency is self._currency:
+            return self._units > other._units
+        return self._units > self._operand_units(other, ROUND_FLOOR)
+
+    def __ge__(self, other: CompareWithFastMoney) -> bool:
+        if isinstance(other, FastMoney) and other._currency is self._currency:
+            return self._units >= other._units
+        return self._units >= self._operand_units(other, ROUND_CEILING)
+
+
+# FastMoney is frozen, so its own constructors write straight to the slots
+# instead of going through the dataclass generated __setattr__
+_new = object.__new__
+_set_units = FastMoney.__dict__["_units"].__set__
+_set_currency = FastMoney.__dict__["_currency"].__set__
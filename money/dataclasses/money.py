@@ -1,6 +1,7 @@
 import dataclasses
-from decimal import Decimal
-from typing import Union
+import heapq
+from decimal import Decimal, InvalidOperation, getcontext
+from typing import TYPE_CHECKING, Any, Iterable, Union
 
 from money.constants import CURRENCY, DEFAULT_CURRENCY
 from money.dataclasses.currency import Currency
@@ -8,12 +9,155 @@ from money.exceptions import (
     CurrencyMismatchException,
     IncorrectMoneyInputError,
     InvalidOperationException,
+    PrecisionLossException,
 )
 
+if TYPE_CHECKING:
+    from money.dataclasses.parse_result import MoneyParseResult
+
 CompareWithMoney = Union["Money", Decimal | int | float | str]
+Ratio = Decimal | int | float | str
+
+# Distinct strings remembered by a single Money.parse_many call
+_PARSE_MANY_CACHE_SIZE = 10_000
+
+# Quantize exponents by number of decimals, e.g. 2 -> Decimal('0.01')
+_QUANTUMS: dict[int, Decimal] = {}
+
+
+def _quantum(currency: Currency) -> Decimal:
+    """The exponent of the currency's minor unit, built once per decimals"""
+    quantum = _QUANTUMS.get(currency.decimals)
+    if quantum is None:
+        quantum = _QUANTUMS.setdefault(
+            currency.decimals, Decimal(1).scaleb(-currency.decimals)
+        )
+    return quantum
+
+
+def _parse(value: str) -> tuple[Decimal, Currency | None]:
+    """
+    Parses '123.45' or 'USD 123.45' (any case, space optional) in a single pass
+    without raising for valid input. The currency is None when the string has
+    no code.
+    """
+    s = value.strip()
+    code = s[:3]
+    currency = CURRENCY.get(code.upper()) if code.isalpha() else None
+    try:
+        return Decimal(s if currency is None else s[3:]), currency
+    except InvalidOperation:
+        raise IncorrectMoneyInputError(
+            "The value '%s' is not properly formatted as 'XXX 123.45' " % s
+        )
+
+
+def _minor_units(amount: Decimal, currency: Currency, rounding: str | None) -> int:
+    """
+    The amount as a whole number of the currency's minor unit. Without a
+    rounding mode anything finer than the minor unit raises.
+    """
+    scaled = amount.scaleb(currency.decimals)
+    integral = scaled.to_integral_value(rounding=rounding)
+    if rounding is None and integral != scaled:
+        raise PrecisionLossException(
+            "%s %s can't be represented in minor units" % (currency, amount)
+        )
+    return int(integral)
+
+
+def _from_minor_units(units: int, currency: Currency) -> "Money":
+    return Money._from_parts(Decimal(units).scaleb(-currency.decimals), currency)
+
+
+def _pickled_currency(currency: Currency) -> str | Currency:
+    """The code of a registry currency, which is all a pickle needs"""
+    return currency.code if CURRENCY.get(currency.code) is currency else currency
 
 
-@dataclasses.dataclass
+def _unpickled_currency(currency: str | Currency) -> Currency:
+    return CURRENCY[currency] if isinstance(currency, str) else currency
+
+
+def _legacy_currency(currency: Currency) -> Currency:
+    """
+    A currency from a pickle written before currencies pickled by code. It
+    carries every field, so it only becomes the registry instance if those
+    all match.
+    """
+    registered = CURRENCY.get(currency.code)
+    if registered is not None and dataclasses.astuple(
+        registered
+    ) == dataclasses.astuple(currency):
+        return registered
+    return currency
+
+
+def _unpickle(cls: type["Money"], amount: str, currency: str | Currency) -> "Money":
+    # _from_parts inlined, this runs once per value of a pickled column
+    money = _new(cls)
+    _set_amount(money, Decimal(amount))
+    _set_currency(money, CURRENCY[currency] if isinstance(currency, str) else currency)
+    return money
+
+
+def _ratio_weights(ratios: Iterable[Ratio]) -> list[int]:
+    """The ratios as whole numbers in the same proportions"""
+    ratios = list(ratios)
+    weights = [ratio for ratio in ratios if isinstance(ratio, int)]
+    if len(weights) != len(ratios):
+        decimals = [Decimal(str(ratio)) for ratio in ratios]
+        if not all(ratio.is_finite() for ratio in decimals):
+            raise ValueError("Allocation ratios must be finite numbers")
+        exponent = min([0, *(int(ratio.as_tuple().exponent) for ratio in decimals)])
+        weights = [int(ratio.scaleb(-exponent)) for ratio in decimals]
+
+    if any(weight < 0 for weight in weights):
+        raise ValueError("Allocation ratios must not be negative")
+    if not sum(weights):
+        raise ValueError("Allocation ratios must add up to more than zero")
+    return weights
+
+
+def _allocate_units(units: int, weights: list[int], total: int) -> list[int]:
+    """
+    Splits whole units in proportion to the weights. Each part is rounded
+    down and the units left over go one each to the parts with the largest
+    remainders, the earlier part winning a tie.
+    """
+    negative = units < 0
+    units = abs(units)
+    parts = []
+    remainders = []
+    for weight in weights:
+        part, remainder = divmod(units * weight, total)
+        parts.append(part)
+        remainders.append(remainder)
+
+    leftover = units - sum(parts)
+    if leftover:
+        # Fewer units are left over than there are parts. nlargest is
+        # equivalent to a stable sort, so equal remainders keep their order.
+        for index in heapq.nlargest(
+            leftover, range(len(parts)), key=remainders.__getitem__
+        ):
+            parts[index] += 1
+    return [-part for part in parts] if negative else parts
+
+
+def _allocated_money(parts: list[int], currency: Currency) -> list["Money"]:
+    """Money for each allocated part, equal parts share one instance"""
+    cache: dict[int, Money] = {}
+    results = []
+    for part in parts:
+        money = cache.get(part)
+        if money is None:
+            money = cache[part] = _from_minor_units(part, currency)
+        results.append(money)
+    return results
+
+
+@dataclasses.dataclass(frozen=True, eq=False)
 class Money:
     """
     An amount of money with an optional currency
@@ -43,26 +187,31 @@ class Money:
         # native types
         Money(Decimal('123.0'), Currency(code='AAA', name=u'My Currency')  # AAA 123.0
 
+    Instances are immutable. Every operation returns a new Money.
     """
 
+    # Declared by hand, dataclass(slots=True) breaks frozen classes on 3.10
+    __slots__ = ("_amount", "_currency")
+
     _amount: Decimal
     _currency: Currency
 
     @classmethod
     def _from_string(cls, value: str | int | float) -> tuple[Decimal, Currency]:
-        s = str(value).strip()
-        try:
-            amount = Decimal(s)
-            currency = DEFAULT_CURRENCY
-        except:  # noqa: E722
-            try:
-                currency = CURRENCY[s[:3].upper()]
-                amount = Decimal(s[3:].strip())
-            except:  # noqa: E722
-                raise IncorrectMoneyInputError(
-                    "The value '%s' is not properly formatted as 'XXX 123.45' " % s
-                )
-        return amount, currency
+        amount, currency = _parse(str(value))
+        return amount, currency or DEFAULT_CURRENCY
+
+    @classmethod
+    def _from_parts(cls, amount: Decimal, currency: Currency) -> "Money":
+        """
+        Trusted constructor that skips all of the input handling of __init__.
+        Only use it when the amount is already a Decimal and the currency is
+        already a Currency, e.g. for the results of arithmetic.
+        """
+        money = _new(cls)
+        _set_amount(money, amount)
+        _set_currency(money, currency)
+        return money
 
     @classmethod
     def from_string(cls, value: str) -> "Money":
@@ -70,11 +219,100 @@ class Money:
         Parses a properly formatted string. The string should be formatted as
         given by the repr function: 'USD 123.45'
         """
-        return Money(*cls._from_string(value))
+        return Money._from_parts(*cls._from_string(value))
+
+    @classmethod
+    def parse_many(
+        cls,
+        values: Iterable[str],
+        default_currency: str | Currency | None = None,
+    ) -> "MoneyParseResult":
+        """
+        Parses a column of strings formatted as from_string expects, using
+        default_currency for the ones without a code. Rows that can't be parsed
+        don't raise, they are collected in the result's errors along with their
+        index, and so are rows that aren't strings. Repeated strings are only
+        parsed once.
+
+            result = Money.parse_many(['USD 1.50', '2', 'oops'], 'USD')
+            result.values   # [USD 1.50, USD 2, None]
+            result.errors   # [(2, "The value 'oops' is not properly ...")]
+        """
+        if default_currency is None:
+            default_currency = DEFAULT_CURRENCY
+        elif not isinstance(default_currency, Currency):
+            default_currency = CURRENCY[default_currency.upper()]
+
+        # Money is immutable, so rows with the same string can share one
+        cache: dict[str, Money | str] = {}
+        parsed: list[Money | None] = []
+        errors: list[tuple[int, str]] = []
+        for index, value in enumerate(values):
+            if not isinstance(value, str):
+                errors.append((index, "Expected a string, got %r" % (value,)))
+                parsed.append(None)
+                continue
+            result = cache.get(value)
+            if result is None:
+                try:
+                    amount, currency = _parse(value)
+                    result = Money._from_parts(amount, currency or default_currency)
+                except IncorrectMoneyInputError as e:
+                    result = str(e)
+                if len(cache) < _PARSE_MANY_CACHE_SIZE:
+                    cache[value] = result
+
+            if isinstance(result, Money):
+                parsed.append(result)
+            else:
+                parsed.append(None)
+                errors.append((index, result))
+        from money.dataclasses.parse_result import MoneyParseResult
+
+        return MoneyParseResult(parsed, errors)
+
+    @classmethod
+    def quantize_many(
+        cls, values: Iterable["Money"], rounding: str | None = None
+    ) -> list["Money"]:
+        """
+        Rounds every value to its currency's minor unit, as quantize does. All
+        of the values are rounded with one decimal context.
+        """
+        context = getcontext().copy()
+        if rounding is not None:
+            context.rounding = rounding
+        quantums = _QUANTUMS
+        results = []
+        for value in values:
+            currency = value._currency
+            quantum = quantums.get(currency.decimals) or _quantum(currency)
+            results.append(
+                Money._from_parts(
+                    value._amount.quantize(quantum, context=context), currency
+                )
+            )
+        return results
+
+    @classmethod
+    def allocate_many(
+        cls, values: Iterable["Money"], ratios: Iterable[Ratio]
+    ) -> list[list["Money"]]:
+        """Allocates each of the values by the same ratios, as allocate does"""
+        weights = _ratio_weights(ratios)
+        total = sum(weights)
+        results = []
+        for value in values:
+            currency = value._currency
+            units = _minor_units(value._amount, currency, None)
+            parts = _allocate_units(units, weights, total)
+            results.append(_allocated_money(parts, currency))
+        return results
 
     def _currency_check(self, other: "Money") -> None:
         """Compare the currencies matches and raise if not"""
-        if self._currency != other.currency:
+        # Currencies are nearly always the canonical instances from CURRENCY
+        if self._currency is not other._currency and self._currency != other._currency:
             raise CurrencyMismatchException(
                 "Currency mismatch: %s != %s" % (self._currency, other.currency)
             )
@@ -85,26 +323,29 @@ class Money:
         currency: str | Currency | None = None,
     ):
         if isinstance(amount, Decimal):
-            self._amount = amount
+            _amount = amount
+        elif isinstance(amount, str) and amount:
+            _amount, parsed_currency = _parse(amount)
+            if parsed_currency is not None:
+                # check for the odd case of Money("USD 123.00", "JPY")
+                if currency:
+                    raise IncorrectMoneyInputError(
+                        "Initialized with conflicting currencies %s %s"
+                        % (
+                            currency.code
+                            if isinstance(currency, Currency)
+                            else currency,
+                            amount,
+                        )
+                    )
+                currency = parsed_currency
         else:
             try:
-                self._amount = Decimal(amount or 0)
+                _amount = Decimal(amount or 0)
             except:  # noqa: E722
                 # Decimal couldn't initialize it
                 try:
-                    # check for the odd case of Money("USD 123.00", "JPY")
-                    if currency:
-                        raise IncorrectMoneyInputError(
-                            "Initialized with conflicting currencies %s %s"
-                            % (
-                                currency.code
-                                if isinstance(currency, Currency)
-                                else currency,
-                                self._amount,
-                            )
-                        )
-
-                    self._amount, currency = self._from_string(amount or 0)
+                    _amount, currency = self._from_string(amount or 0)
                 except:  # noqa: E722
                     raise IncorrectMoneyInputError(
                         "Cannot initialize with amount %s" % amount
@@ -117,9 +358,25 @@ class Money:
         if not isinstance(currency, Currency):
             currency = CURRENCY[str(currency).upper()]
 
-        self._currency = currency
-        assert isinstance(self._amount, Decimal)
-        assert isinstance(self._currency, Currency)
+        assert isinstance(_amount, Decimal)
+        assert isinstance(currency, Currency)
+        _set_amount(self, _amount)
+        _set_currency(self, currency)
+
+    def __reduce__(
+        self,
+    ) -> tuple[Any, tuple[type["Money"], str, str | Currency]]:
+        # The default slots pickling would go through the frozen __setattr__,
+        # and a Currency pickled whole would be unpickled as a copy
+        return (
+            _unpickle,
+            (self.__class__, str(self._amount), _pickled_currency(self._currency)),
+        )
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        # Pickles written by 2.0.0 and earlier hold the instance __dict__
+        _set_amount(self, state["_amount"])
+        _set_currency(self, _legacy_currency(state["_currency"]))
 
     @property
     def amount(self) -> Decimal:
@@ -129,6 +386,40 @@ class Money:
     def currency(self) -> Currency:
         return self._currency
 
+    def quantize(self, rounding: str | None = None) -> "Money":
+        """
+        The amount rounded to the currency's minor unit: cents for USD, whole
+        yen for JPY, fils for KWD. Takes any of the decimal module's rounding
+        modes, e.g. ROUND_HALF_UP, and rounds like the current decimal context
+        when none is given.
+
+            Money('1.005', 'USD').quantize(ROUND_HALF_UP)  # USD 1.01
+            Money('1.5', 'JPY').quantize()                 # JPY 2
+        """
+        return Money._from_parts(
+            self._amount.quantize(_quantum(self._currency), rounding=rounding),
+            self._currency,
+        )
+
+    def allocate(self, ratios: Iterable[Ratio]) -> list["Money"]:
+        """
+        Splits the amount in proportion to the ratios without losing any minor
+        units. Parts are whole minor units of the currency and always add up
+        to exactly the original amount, the units that don't divide evenly go
+        to the parts with the largest remainders. Amounts finer than the minor
+        unit raise PrecisionLossException, quantize them first.
+
+            Money('100', 'USD').allocate([1, 1, 1])
+            # [USD 33.34, USD 33.33, USD 33.33]
+            Money('5', 'JPY').allocate([70, 30])
+            # [JPY 4, JPY 1]
+        """
+        weights = _ratio_weights(ratios)
+        currency = self._currency
+        units = _minor_units(self._amount, currency, None)
+        parts = _allocate_units(units, weights, sum(weights))
+        return _allocated_money(parts, currency)
+
     def __str__(self) -> str:
         return "{} {}".format(self._currency, self._amount)
 
@@ -142,28 +433,24 @@ class Money:
         return int(self._amount)
 
     def __pos__(self) -> "Money":
-        return Money(amount=self._amount, currency=self._currency)
+        return Money._from_parts(self._amount, self._currency)
 
     def __neg__(self) -> "Money":
-        return Money(amount=-self._amount, currency=self._currency)
+        return Money._from_parts(-self._amount, self._currency)
 
     def __add__(self, other: CompareWithMoney) -> "Money":
         if isinstance(other, Money):
             self._currency_check(other)
-            return Money(amount=self._amount + other.amount, currency=self._currency)
+            return Money._from_parts(self._amount + other._amount, self._currency)
         else:
-            return Money(
-                amount=self._amount + Decimal(str(other)), currency=self._currency
-            )
+            return Money._from_parts(self._amount + Decimal(str(other)), self._currency)
 
     def __sub__(self, other: CompareWithMoney) -> "Money":
         if isinstance(other, Money):
             self._currency_check(other)
-            return Money(amount=self._amount - other.amount, currency=self._currency)
+            return Money._from_parts(self._amount - other._amount, self._currency)
         else:
-            return Money(
-                amount=self._amount - Decimal(str(other)), currency=self._currency
-            )
+            return Money._from_parts(self._amount - Decimal(str(other)), self._currency)
 
     def __rsub__(self, other: CompareWithMoney) -> None:
         # In the case where both values are Money, the left hand one will be
@@ -174,7 +461,7 @@ class Money:
     def __mul__(self, other: CompareWithMoney) -> "Money":
         if isinstance(other, Money):
             raise InvalidOperationException("Cannot multiply monetary quantities")
-        return Money(amount=self._amount * Decimal(str(other)), currency=self._currency)
+        return Money._from_parts(self._amount * Decimal(str(other)), self._currency)
 
     def __truediv__(self, other: int | Decimal) -> "Money":
         """
@@ -183,7 +470,7 @@ class Money:
         """
         if isinstance(other, Money):
             raise InvalidOperationException("Cannot divide two monetary quantities")
-        return Money(amount=self._amount / other, currency=self._currency)
+        return Money._from_parts(self._amount / other, self._currency)
 
     __div__ = __truediv__
 
@@ -211,7 +498,11 @@ class Money:
     def __eq__(self, other: object) -> bool:
         if isinstance(other, Money):
             return bool(
-                (self._amount == other.amount) and (self._currency == other.currency)
+                (self._amount == other._amount)
+                and (
+                    self._currency is other._currency
+                    or self._currency == other._currency
+                )
             )
 
         if isinstance(other, (Decimal, int, float, str)):
@@ -223,6 +514,13 @@ class Money:
     def __ne__(self, other: object) -> bool:
         return not self.__eq__(other)
 
+    def __hash__(self) -> int:
+        # Must agree with __eq__. Any zero amount is equal to 0 whatever its
+        # currency, so all zeros hash like 0 does.
+        if not self._amount:
+            return 0
+        return hash((self._amount, self._currency.code))
+
     def __lt__(self, other: CompareWithMoney) -> bool:
         if isinstance(other, Money):
             self._currency_check(other)
@@ -242,3 +540,41 @@ class Money:
 
     def __ge__(self, other: CompareWithMoney) -> bool:
         return self > other or self == other
+
+
+# Money is frozen, so its own constructors write straight to the slots instead
+# of going through the dataclass generated __setattr__
+_new = object.__new__
+_set_amount = Money.__dict__["_amount"].__set__
+_set_currency = Money.__dict__["_currency"].__set__
+
+
+def sum_money(values: Iterable[Money], currency: str | Currency | None = None) -> Money:
+    """
+    Adds up Money values that share a currency, like sum() but without building
+    a Money for every intermediate total. The currency of each value is checked
+    as it is added and a mismatch raises CurrencyMismatchException, just as
+    adding them one by one would.
+
+    An empty iterable sums to zero in the given currency, or Money(0) when no
+    currency is given.
+
+        sum_money([Money('1.50', 'USD'), Money('2', 'USD')])  # USD 3.50
+        sum_money([], 'USD')                                   # USD 0
+    """
+    if currency is not None and not isinstance(currency, Currency):
+        currency = CURRENCY[currency.upper()]
+
+    total = Decimal(0)
+    for value in values:
+        value_currency = value._currency
+        # Currencies are nearly always the canonical instances from CURRENCY
+        if value_currency is not currency:
+            if currency is None:
+                currency = value_currency
+            elif value_currency != currency:
+                raise CurrencyMismatchException(
+                    "Currency mismatch: %s != %s" % (currency, value_currency)
+                )
+        total += value._amount
+    return Money._from_parts(total, DEFAULT_CURRENCY if currency is None else currency)
@@ -0,0 +1,355 @@
+"""
+Columnar storage for large numbers of Money values. Requires numpy, which is
+available through the ``numpy`` extra: pip install python-money[numpy]
+"""
+
+import operator
+from decimal import ROUND_CEILING, ROUND_FLOOR, Decimal
+from typing import Any, Callable, Iterable, Iterator, Union, overload
+
+import numpy as np
+import numpy.typing as npt
+
+from money.constants import DEFAULT_CURRENCY
+from money.dataclasses.currency import Currency
+from money.dataclasses.money import Money, _from_minor_units, _minor_units
+from money.exceptions import (
+    CurrencyMismatchException,
+    InvalidOperationException,
+    PrecisionLossException,
+)
+
+Units = npt.NDArray[np.int64]
+Codes = npt.NDArray[np.intp]
+Mask = npt.NDArray[np.bool_]
+Number = Decimal | int | float | str
+CompareWithMoneyArray = Union["MoneyArray", Money, Number]
+
+_INT64_MIN = int(np.iinfo(np.int64).min)
+_INT64_MAX = int(np.iinfo(np.int64).max)
+
+
+def _overflow() -> OverflowError:
+    return OverflowError("Result doesn't fit in int64 minor units")
+
+
+def _checked_add(units: Units, other: Units | int) -> Units:
+    result: Units = units + other
+    # Only operands of the same sign overflow, into a result of the other sign
+    if (((units ^ result) & (other ^ result)) < 0).any():
+        raise _overflow()
+    return result
+
+
+def _checked_sub(units: Units, other: Units | int) -> Units:
+    result: Units = units - other
+    if (((units ^ other) & (units ^ result)) < 0).any():
+        raise _overflow()
+    return result
+
+
+def _checked_mul(units: Units, factor: int) -> Units:
+    # The product is linear, so its extremes come from the extremes of units
+    if len(units) and factor:
+        for extreme in (int(units.min()), int(units.max())):
+            if not _INT64_MIN <= extreme * factor <= _INT64_MAX:
+                raise _overflow()
+    result: Units = units * factor
+    return result
+
+
+def _total(units: Units) -> int:
+    """
+    The exact sum of the units. The int64 sum is used whenever it can't
+    wrap around, Python ints otherwise.
+    """
+    if not len(units):
+        return 0
+    largest = max(-int(units.min()), int(units.max()))
+    if largest * len(units) <= _INT64_MAX:
+        return int(units.sum())
+    return sum(units.tolist())
+
+
+class MoneyArray:
+    """
+    A column of Money values
+
+    Amounts are held in an int64 numpy array as whole numbers of each
+    currency's minor unit (cents for USD, yen for JPY) next to a dictionary
+    encoded currency column. Arithmetic, comparisons and reductions are
+    vectorized and follow the same rules as Money: mixing currencies raises
+    CurrencyMismatchException and multiplying or dividing by money raises
+    InvalidOperationException. Amounts that are not a whole number of minor
+    units raise PrecisionLossException. Results that don't fit in int64 raise
+    OverflowError, while sum() and groupby_currency() are exact at any size.
+
+        prices = MoneyArray([Money('1.50', 'USD'), Money('2', 'USD')])
+        (prices * 2).sum()                  # USD 7.00
+        prices[prices > Money(1.5, 'USD')]  # MoneyArray([USD 2.00])
+        list(prices)                        # [USD 1.50, USD 2.00]
+
+    Instances are immutable. Every operation returns a new MoneyArray.
+    """
+
+    __slots__ = ("_units", "_codes", "_currencies")
+
+    _units: Units
+    _codes: Codes
+    _currencies: tuple[Currency, ...]
+
+    def __init__(self, values: Iterable[Money] = ()):
+        index: dict[Currency, int] = {}
+        units: list[int] = []
+        codes: list[int] = []
+        for value in values:
+            currency = value.currency
+            code = index.get(currency)
+            if code is None:
+                code = index[currency] = len(index)
+            units.append(_minor_units(value.amount, currency, None))
+            codes.append(code)
+
+        self._units = np.array(units, dtype=np.int64)
+        self._codes = np.array(codes, dtype=np.intp)
+        self._currencies = tuple(index)
+
+    @classmethod
+    def _from_parts(
+        cls, units: Units, codes: Codes, currencies: tuple[Currency, ...]
+    ) -> "MoneyArray":
+        """Trusted constructor for results of operations on existing arrays"""
+        array = object.__new__(cls)
+        array._units = units
+        array._codes = codes
+        array._currencies = currencies
+        return array
+
+    def _with_units(self, units: Units) -> "MoneyArray":
+        return MoneyArray._from_parts(units, self._codes, self._currencies)
+
+    def to_money(self) -> list[Money]:
+        return list(self)
+
+    def _currency_check(self, codes: Codes | int, other: "MoneyArray | Money") -> None:
+        """Compare the currencies match element by element and raise if not"""
+        mismatches = self._codes != codes
+        if mismatches.any():
+            position = int(np.argmax(mismatches))
+            raise CurrencyMismatchException(
+                "Currency mismatch: %s != %s"
+                % (
+                    self._currencies[self._codes[position]],
+                    other.currency
+                    if isinstance(other, Money)
+                    else other._currencies[other._codes[position]],
+                )
+            )
+
+    def _aligned_codes(self, other: "MoneyArray") -> Codes:
+        """
+        The currency column of other, translated into this array's dictionary.
+        Currencies this array doesn't know about become -1.
+        """
+        if len(self) != len(other):
+            raise ValueError(
+                "MoneyArray length mismatch: %s != %s" % (len(self), len(other))
+            )
+        if other._currencies == self._currencies:
+            return other._codes
+        index = {currency: code for code, currency in enumerate(self._currencies)}
+        translation = np.array(
+            [index.get(currency, -1) for currency in other._currencies] or [-1],
+            dtype=np.intp,
+        )
+        return translation[other._codes]
+
+    def _code_of(self, currency: Currency) -> int:
+        for code, known in enumerate(self._currencies):
+            if known is currency or known == currency:
+                return code
+        return -1
+
+    def _number_units(self, value: Number, rounding: str | None) -> Units:
+        """A plain number in the minor unit of each element's currency"""
+        amount = Decimal(str(value))
+        per_currency = np.zeros(len(self._currencies), dtype=np.int64)
+        for code in np.unique(self._codes):
+            per_currency[code] = _minor_units(amount, self._currencies[code], rounding)
+        return per_currency[self._codes]
+
+    def _operand_units(
+        self, other: CompareWithMoneyArray, rounding: str | None = None
+    ) -> Units | int:
+        """
+        The units of the other operand lined up with this array, after checking
+        that the currencies match
+        """
+        if isinstance(other, MoneyArray):
+            self._currency_check(self._aligned_codes(other), other)
+            return other._units
+        if isinstance(other, Money):
+            if len(self):
+                self._currency_check(self._code_of(other.currency), other)
+            return _minor_units(other.amount, other.currency, rounding)
+        return self._number_units(other, rounding)
+
+    def _scaled(self, numerator: int, denominator: int) -> "MoneyArray":
+        if denominator < 0:
+            numerator, denominator = -numerator, -denominator
+        units = _checked_mul(self._units, numerator)
+        if denominator != 1:
+            if (units % denominator).any():
+                raise PrecisionLossException(
+                    "Result can't be represented in minor units"
+                )
+            units //= denominator
+        return self._with_units(units)
+
+    def __len__(self) -> int:
+        return len(self._units)
+
+    def __iter__(self) -> Iterator[Money]:
+        currencies = self._currencies
+        for units, code in zip(self._units.tolist(), self._codes.tolist()):
+            yield _from_minor_units(units, currencies[code])
+
+    @overload
+    def __getitem__(self, key: int) -> Money: ...
+
+    @overload
+    def __getitem__(self, key: slice | Mask | Codes) -> "MoneyArray": ...
+
+    def __getitem__(self, key: int | slice | Mask | Codes) -> "Money | MoneyArray":
+        if isinstance(key, (int, np.integer)):
+            return _from_minor_units(
+                int(self._units[key]), self._currencies[self._codes[key]]
+            )
+        return MoneyArray._from_parts(
+            self._units[key], self._codes[key], self._currencies
+        )
+
+    def __str__(self) -> str:
+        return "MoneyArray([%s])" % ", ".join(str(value) for value in self)
+
+    def __repr__(self) -> str:
+        return str(self)
+
+    def __pos__(self) -> "MoneyArray":
+        return self._with_units(self._units.copy())
+
+    def __neg__(self) -> "MoneyArray":
+        if len(self) and int(self._units.min()) == _INT64_MIN:
+            raise _overflow()
+        return self._with_units(-self._units)
+
+    def __add__(self, other: CompareWithMoneyArray) -> "MoneyArray":
+        return self._with_units(_checked_add(self._units, self._operand_units(other)))
+
+    def __sub__(self, other: CompareWithMoneyArray) -> "MoneyArray":
+        return self._with_units(_checked_sub(self._units, self._operand_units(other)))
+
+    def __rsub__(self, other: CompareWithMoneyArray) -> None:
+        raise TypeError("Cannot subtract MoneyArray from %r" % other)
+
+    def __mul__(self, other: Number) -> "MoneyArray":
+        if isinstance(other, (Money, MoneyArray)):
+            raise InvalidOperationException("Cannot multiply monetary quantities")
+        if isinstance(other, (int, np.integer)):
+            return self._with_units(_checked_mul(self._units, int(other)))
+        return self._scaled(*Decimal(str(other)).as_integer_ratio())
+
+    def __truediv__(self, other: int | Decimal) -> "MoneyArray":
+        if isinstance(other, (Money, MoneyArray)):
+            raise InvalidOperationException("Cannot divide two monetary quantities")
+        numerator, denominator = Decimal(str(other)).as_integer_ratio()
+        if not numerator:
+            raise ZeroDivisionError("Division of MoneyArray by zero")
+        return self._scaled(denominator, numerator)
+
+    def __floordiv__(self, other: CompareWithMoneyArray) -> None:
+        raise InvalidOperationException(
+            "Floor division not supported for monetary quantities"
+        )
+
+    def __rtruediv__(self, other: CompareWithMoneyArray) -> None:
+        raise InvalidOperationException("Cannot divide by monetary quantities")
+
+    # Commutative operations
+    __radd__ = __add__
+    __rmul__ = __mul__
+
+    # Comparison operators, returning boolean masks
+    def __eq__(self, other: object) -> Mask:  # type: ignore[override]
+        codes: Codes | int
+        units: Units | int
+        if isinstance(other, MoneyArray):
+            codes, units = self._aligned_codes(other), other._units
+        elif isinstance(other, Money):
+            scaled = other.amount.scaleb(other.currency.decimals)
+            if scaled != scaled.to_integral_value():
+                return np.zeros(len(self), dtype=np.bool_)
+            codes, units = self._code_of(other.currency), int(scaled)
+        elif isinstance(other, (Decimal, int, float, str)) and other == 0:
+            # Allow comparison to 0
+            codes, units = self._codes, 0
+        else:
+            return np.zeros(len(self), dtype=np.bool_)
+        matches: Mask = (self._codes == codes) & (self._units == units)
+        return matches
+
+    def __ne__(self, other: object) -> Mask:  # type: ignore[override]
+        matches: Mask = ~self.__eq__(other)
+        return matches
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def _compare(
+        self,
+        other: CompareWithMoneyArray,
+        compare: Callable[[Any, Any], Mask],
+        rounding: str,
+    ) -> Mask:
+        # Comparing integer units against a finer amount is the same as
+        # comparing against that amount rounded in the right direction
+        return compare(self._units, self._operand_units(other, rounding))
+
+    def __lt__(self, other: CompareWithMoneyArray) -> Mask:
+        return self._compare(other, operator.lt, ROUND_CEILING)
+
+    def __le__(self, other: CompareWithMoneyArray) -> Mask:
+        return self._compare(other, operator.le, ROUND_FLOOR)
+
+    def __gt__(self, other: CompareWithMoneyArray) -> Mask:
+        return self._compare(other, operator.gt, ROUND_FLOOR)
+
+    def __ge__(self, other: CompareWithMoneyArray) -> Mask:
+        return self._compare(other, operator.ge, ROUND_CEILING)
+
+    # Reductions
+    def sum(self) -> Money:
+        """
+        The total of all values, which must share a currency. An empty array
+        sums to Money(0).
+        """
+        codes = np.unique(self._codes)
+        if len(codes) > 1:
+            position = int(np.argmax(self._codes != codes[0]))
+            raise CurrencyMismatchException(
+                "Currency mismatch: %s != %s"
+                % (
+                    self._currencies[codes[0]],
+                    self._currencies[self._codes[position]],
+                )
+            )
+        currency = self._currencies[codes[0]] if len(codes) else DEFAULT_CURRENCY
+        return _from_minor_units(_total(self._units), currency)
+
+    def groupby_currency(self) -> dict[Currency, Money]:
+        """The total for each currency present in the array"""
+        return {
+            self._currencies[code]: _from_minor_units(
+                _total(self._units[self._codes == code]), self._currencies[code]
+            )
+            for code in np.unique(self._codes).tolist()
+        }
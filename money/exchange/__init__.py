@@ -0,0 +1,21 @@
+from money.exchange.graph import ConversionGraph, PathCacheInfo
+from money.exchange.history import RateHistory
+from money.exchange.providers import (
+    CachingRateProvider,
+    RateProvider,
+    StaticRateProvider,
+)
+from money.exchange.rate_table import RateTable
+from money.exchange.shared import SharedRatePublisher, SharedRateTable
+
+__all__ = [
+    "CachingRateProvider",
+    "ConversionGraph",
+    "PathCacheInfo",
+    "RateHistory",
+    "RateProvider",
+    "RateTable",
+    "SharedRatePublisher",
+    "SharedRateTable",
+    "StaticRateProvider",
+]
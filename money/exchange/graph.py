@@ -0,0 +1,166 @@
+import heapq
+from decimal import Decimal
+from typing import Iterable, Mapping, NamedTuple
+
+from money.constants import CURRENCY
+from money.dataclasses.currency import Currency
+from money.dataclasses.money import Money
+from money.exceptions import RateNotFoundException
+from money.exchange.rate_table import CurrencyPair, Rate, RateTable, _currency
+
+Path = tuple[tuple[Currency, ...], Decimal]
+
+_ONE = Decimal(1)
+_ZERO = Decimal(0)
+
+
+class PathCacheInfo(NamedTuple):
+    """Counters of a ConversionGraph's path cache, like functools' CacheInfo"""
+
+    hits: int
+    misses: int
+    currsize: int
+    invalidations: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ConversionGraph:
+    """
+    Converts between currencies that have no direct rate by chaining rates
+
+    Currencies are the nodes and the quoted rates of a RateTable are edges,
+    usable in both directions. The path taken between two currencies is the
+    one with the fewest hops, or when spreads are given for the pairs, the one
+    with the lowest total spread (then the fewest hops). Pairs without a
+    spread count as no spread.
+
+        rates = RateTable({('USD', 'ZMK'): '5300', ('USD', 'JPY'): '150'})
+        graph = ConversionGraph(rates)
+        graph.path('ZMK', 'JPY')                   # (ZMK, USD, JPY)
+        graph.convert(Money(5300, 'ZMK'), 'JPY')   # JPY 150.0...
+
+    Resolved paths and their rates are cached until update switches the graph
+    to a new snapshot of rates, so converting a column costs one dict lookup
+    per value once its currencies have been seen. cache_info reports how well
+    the cache is doing.
+    """
+
+    def __init__(
+        self,
+        rates: RateTable,
+        spreads: Mapping[CurrencyPair, Rate] | None = None,
+    ):
+        self._spreads: dict[tuple[str, str], Decimal] = {}
+        for (source, target), spread in (spreads or {}).items():
+            source, target = _currency(source), _currency(target)
+            spread = Decimal(str(spread))
+            if not spread.is_finite() or spread < 0:
+                raise ValueError(
+                    "Invalid spread %s for %s/%s" % (spread, source, target)
+                )
+            self._spreads[source.code, target.code] = spread
+            self._spreads[target.code, source.code] = spread
+
+        self._hits = self._misses = self._invalidations = 0
+        self._paths: dict[tuple[str, str], Path] = {}
+        self.update(rates)
+
+    def update(self, rates: RateTable) -> None:
+        """Switches to a new snapshot of rates, forgetting every resolved path"""
+        edges: dict[str, dict[str, Decimal]] = {}
+        for (source, target), rate in rates.rates.items():
+            edges.setdefault(source.code, {})[target.code] = rate
+            # A quote for the inverse pair wins over the implied inverse
+            edges.setdefault(target.code, {}).setdefault(source.code, _ONE / rate)
+
+        if self._paths:
+            self._invalidations += 1
+        self._rates = rates
+        self._edges = edges
+        self._paths = {}
+
+    @property
+    def rates(self) -> RateTable:
+        """The snapshot of rates in use"""
+        return self._rates
+
+    def cache_info(self) -> PathCacheInfo:
+        return PathCacheInfo(
+            self._hits, self._misses, len(self._paths), self._invalidations
+        )
+
+    def _search(self, source: str, target: str) -> list[str] | None:
+        """The cheapest path by total spread then hops, Dijkstra's algorithm"""
+        edges = self._edges
+        spreads = self._spreads
+        best = {source: (_ZERO, 0)}
+        previous: dict[str, str] = {}
+        queue = [(_ZERO, 0, source)]
+        while queue:
+            spread, hops, node = heapq.heappop(queue)
+            if node == target:
+                path = [node]
+                while node != source:
+                    node = previous[node]
+                    path.append(node)
+                return path[::-1]
+            if (spread, hops) > best[node]:
+                continue
+            for neighbor in edges.get(node, ()):
+                candidate = (spread + spreads.get((node, neighbor), _ZERO), hops + 1)
+                known = best.get(neighbor)
+                if known is None or candidate < known:
+                    best[neighbor] = candidate
+                    previous[neighbor] = node
+                    heapq.heappush(queue, (*candidate, neighbor))
+        return None
+
+    def _resolve(self, source: str, target: str) -> Path:
+        resolved = self._paths.get((source, target))
+        if resolved is not None:
+            self._hits += 1
+            return resolved
+
+        self._misses += 1
+        codes = self._search(source, target)
+        if codes is None:
+            raise RateNotFoundException(
+                "No conversion path from %s to %s" % (source, target)
+            )
+        rate = _ONE
+        for step, next_step in zip(codes, codes[1:]):
+            rate *= self._edges[step][next_step]
+        resolved = tuple(CURRENCY[code] for code in codes), rate
+        self._paths[source, target] = resolved
+        return resolved
+
+    def path(
+        self, source: Currency | str, target: Currency | str
+    ) -> tuple[Currency, ...]:
+        """The currencies a conversion goes through, source and target included"""
+        return self._resolve(_currency(source).code, _currency(target).code)[0]
+
+    def rate(self, source: Currency | str, target: Currency | str) -> Decimal:
+        """The price of one unit of source in target, along the path"""
+        return self._resolve(_currency(source).code, _currency(target).code)[1]
+
+    def convert(self, value: Money, to: Currency | str) -> Money:
+        """The value in another currency, along the path"""
+        target = _currency(to)
+        rate = self._resolve(value.currency.code, target.code)[1]
+        return Money._from_parts(value.amount * rate, target)
+
+    def convert_many(self, values: Iterable[Money], to: Currency | str) -> list[Money]:
+        """Converts every value to one currency, along the path for each"""
+        target = _currency(to)
+        resolve = self._resolve
+        return [
+            Money._from_parts(
+                value.amount * resolve(value.currency.code, target.code)[1], target
+            )
+            for value in values
+        ]
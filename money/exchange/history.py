@@ -0,0 +1,284 @@
+import bisect
+import datetime
+import functools
+import mmap
+import os
+import struct
+import sys
+from array import array
+from decimal import Decimal
+from typing import Iterable, Mapping, NamedTuple, Sequence
+
+from money.constants import CURRENCY
+from money.dataclasses.currency import Currency
+from money.dataclasses.money import Money
+from money.exceptions import RateNotFoundException
+from money.exchange.rate_table import (
+    CurrencyPair,
+    Rate,
+    RateTable,
+    _currency,
+    _derive_rate,
+)
+
+# File layout, all little-endian:
+#   header    magic, version, number of pairs, base code (blank for none)
+#   directory one entry per pair: source, target, number of rates, offset
+#   data      per pair, 8 byte aligned: int64 timestamps, int64 rate
+#             coefficients, int8 rate exponents
+_MAGIC = b"PMRH"
+_VERSION = 1
+_HEADER = struct.Struct("<4sHI3s2x")
+_ENTRY = struct.Struct("<3s3s2xQQ")
+
+_INT64_MAX = 2**63 - 1
+_EPOCH_ORDINAL = datetime.date(1970, 1, 1).toordinal()
+
+
+class _Series(NamedTuple):
+    """The rates of one pair, sorted by time"""
+
+    timestamps: Sequence[int]
+    coefficients: Sequence[int]
+    exponents: Sequence[int]
+
+    def rate_at(self, timestamp: int) -> Decimal | None:
+        index = bisect.bisect_right(self.timestamps, timestamp) - 1
+        if index < 0:
+            return None
+        return Decimal(self.coefficients[index]).scaleb(self.exponents[index])
+
+
+def _timestamp(when: datetime.date) -> int:
+    """Seconds since the epoch, dates are midnight and naive times are UTC"""
+    if isinstance(when, datetime.datetime):
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=datetime.timezone.utc)
+        return int(when.timestamp())
+    return (when.toordinal() - _EPOCH_ORDINAL) * 86400
+
+
+def _coefficient(rate: Decimal) -> tuple[int, int]:
+    """The rate as an integer coefficient and exponent that fit the file"""
+    _, digits, exponent = rate.as_tuple()
+    coefficient = int("".join(map(str, digits)))
+    if coefficient > _INT64_MAX or not isinstance(exponent, int):
+        raise ValueError("Exchange rate %s has too many digits" % rate)
+    if not -128 <= exponent <= 127:
+        raise ValueError("Exchange rate %s is out of range" % rate)
+    return coefficient, exponent
+
+
+def _padding(size: int) -> int:
+    return -size % 8
+
+
+class RateHistory:
+    """
+    Exchange rates over time
+
+    Each pair of currencies keeps its rates in arrays sorted by time, so the
+    rate as of any moment is a binary search away. Like RateTable, a rate is
+    the price of one unit of the first currency in the second, inverse pairs
+    are implied and other pairs are crossed through the base currency.
+
+        history = RateHistory(
+            {('EUR', 'USD'): [(date(2023, 1, 2), '1.07'), (date(2024, 1, 2), '1.09')]},
+        )
+        history.rate('EUR', 'USD', date(2023, 6, 30))   # Decimal('1.07')
+        history.convert(Money(10, 'EUR'), 'USD', date(2024, 2, 1))  # USD 10.90
+        history.at(date(2023, 6, 30))                    # RateTable as of then
+
+    Dates are taken as midnight UTC and naive datetimes as UTC. Asking for a
+    rate before the first one known raises RateNotFoundException.
+
+    A history can be saved to a compact binary file and opened again with
+    RateHistory.open, which maps the file into memory instead of reading it.
+    """
+
+    def __init__(
+        self,
+        rates: Mapping[CurrencyPair, Iterable[tuple[datetime.date, Rate]]],
+        base: Currency | str | None = None,
+    ):
+        self._series: dict[tuple[str, str], _Series] = {}
+        for (source, target), history in rates.items():
+            source, target = _currency(source), _currency(target)
+            points = sorted(
+                ((_timestamp(when), Decimal(str(rate))) for when, rate in history),
+                key=lambda point: point[0],
+            )
+            timestamps, coefficients, exponents = array("q"), array("q"), array("b")
+            for timestamp, rate in points:
+                if not rate.is_finite() or rate <= 0:
+                    raise ValueError(
+                        "Invalid exchange rate %s for %s/%s" % (rate, source, target)
+                    )
+                coefficient, exponent = _coefficient(rate)
+                timestamps.append(timestamp)
+                coefficients.append(coefficient)
+                exponents.append(exponent)
+            if source is not target:
+                self._series[source.code, target.code] = _Series(
+                    timestamps, coefficients, exponents
+                )
+
+        self._base = None if base is None else _currency(base)
+        self._mmap: mmap.mmap | None = None
+        self._views: list[memoryview] = []
+
+    @classmethod
+    def open(cls, path: str | os.PathLike[str]) -> "RateHistory":
+        """
+        Opens a file written by save. Only the directory of pairs is read, the
+        rates stay in the file and are paged in as they are looked up.
+        """
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(mapped) < _HEADER.size or mapped[:4] != _MAGIC:
+            mapped.close()
+            raise ValueError("%s is not a rate history file" % path)
+        _, version, count, base = _HEADER.unpack_from(mapped, 0)
+        if version != _VERSION:
+            mapped.close()
+            raise ValueError("Unsupported rate history file version %s" % version)
+
+        history = cls({}, base.decode() if base.strip() else None)
+        history._mmap = mapped
+        data = memoryview(mapped)
+        history._views.append(data)
+        for index in range(count):
+            source, target, size, offset = _ENTRY.unpack_from(
+                mapped, _HEADER.size + index * _ENTRY.size
+            )
+            timestamps = data[offset : offset + 8 * size]
+            coefficients = data[offset + 8 * size : offset + 16 * size]
+            exponents = data[offset + 16 * size : offset + 17 * size]
+            series = [timestamps.cast("q"), coefficients.cast("q"), exponents.cast("b")]
+            history._views.extend([timestamps, coefficients, exponents, *series])
+            if sys.byteorder != "little":
+                # The file is little-endian, big-endian hosts get a swapped copy
+                swapped = [array(view.format, view) for view in series]
+                for values in swapped[:2]:
+                    values.byteswap()
+                series = [memoryview(values) for values in swapped]
+            history._series[source.decode(), target.decode()] = _Series(*series)
+        return history
+
+    def save(self, path: str | os.PathLike[str]) -> None:
+        """Writes the history to a file that RateHistory.open can map"""
+        directory_size = _HEADER.size + len(self._series) * _ENTRY.size
+        offset = directory_size + _padding(directory_size)
+        entries = []
+        for (source, target), series in self._series.items():
+            size = len(series.timestamps)
+            entries.append(_ENTRY.pack(source.encode(), target.encode(), size, offset))
+            offset += 17 * size + _padding(17 * size)
+
+        base = self._base.code.encode() if self._base is not None else b"   "
+        with open(path, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, _VERSION, len(self._series), base))
+            f.write(b"".join(entries))
+            f.write(bytes(_padding(directory_size)))
+            for series in self._series.values():
+                for typecode, values in zip("qqb", series):
+                    data = array(typecode, values)
+                    if sys.byteorder != "little":
+                        data.byteswap()
+                    f.write(data.tobytes())
+                f.write(bytes(_padding(17 * len(series.timestamps))))
+
+    def close(self) -> None:
+        """Releases the file of a history opened with RateHistory.open"""
+        self._series.clear()
+        for view in reversed(self._views):
+            view.release()
+        self._views.clear()
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def __enter__(self) -> "RateHistory":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    @property
+    def base(self) -> Currency | None:
+        return self._base
+
+    @property
+    def pairs(self) -> list[tuple[Currency, Currency]]:
+        return [(CURRENCY[source], CURRENCY[target]) for source, target in self._series]
+
+    def __len__(self) -> int:
+        """The number of rates held, over all pairs"""
+        return sum(len(series.timestamps) for series in self._series.values())
+
+    def _lookup(self, source: str, target: str, timestamp: int) -> Decimal | None:
+        series = self._series.get((source, target))
+        if series is None:
+            return None
+        return series.rate_at(timestamp)
+
+    def _rate(self, source: str, target: str, timestamp: int) -> Decimal:
+        rate = _derive_rate(
+            functools.partial(self._lookup, timestamp=timestamp),
+            source,
+            target,
+            self._base,
+        )
+        if rate is None:
+            raise RateNotFoundException(
+                "No exchange rate from %s to %s at %s"
+                % (
+                    source,
+                    target,
+                    datetime.datetime.fromtimestamp(timestamp, datetime.timezone.utc),
+                )
+            )
+        return rate
+
+    def rate(
+        self, source: Currency | str, target: Currency | str, when: datetime.date
+    ) -> Decimal:
+        """The price of one unit of source in target, as of when"""
+        return self._rate(
+            _currency(source).code, _currency(target).code, _timestamp(when)
+        )
+
+    def at(self, when: datetime.date) -> RateTable:
+        """A RateTable of every pair's rate as of when"""
+        timestamp = _timestamp(when)
+        rates: dict[CurrencyPair, Rate] = {}
+        for (source, target), series in self._series.items():
+            rate = series.rate_at(timestamp)
+            if rate is not None:
+                rates[source, target] = rate
+        return RateTable(rates, self._base)
+
+    def convert(self, value: Money, to: Currency | str, when: datetime.date) -> Money:
+        """The value in another currency, at the rate as of when"""
+        target = _currency(to)
+        rate = self._rate(value.currency.code, target.code, _timestamp(when))
+        return Money._from_parts(value.amount * rate, target)
+
+    def convert_many(
+        self, postings: Iterable[tuple[Money, datetime.date]], to: Currency | str
+    ) -> list[Money]:
+        """
+        Converts dated values to one currency, each at the rate as of its own
+        date. Rates are looked up once per currency and date.
+        """
+        target = _currency(to)
+        rates: dict[tuple[str, datetime.date], Decimal] = {}
+        results = []
+        for value, when in postings:
+            key = (value.currency.code, when)
+            rate = rates.get(key)
+            if rate is None:
+                rate = rates[key] = self._rate(key[0], target.code, _timestamp(when))
+            results.append(Money._from_parts(value.amount * rate, target))
+        return results
@@ -0,0 +1,187 @@
+import asyncio
+import datetime
+import functools
+import os
+import time
+from decimal import Decimal
+from typing import Callable, Iterable, Protocol
+
+from money.dataclasses.currency import Currency
+from money.dataclasses.money import Money
+from money.exchange.history import RateHistory
+from money.exchange.rate_table import RateTable, _currency
+
+# source code, target code, as of (None for the latest rate)
+RateKey = tuple[str, str, datetime.date | None]
+
+
+class RateProvider(Protocol):
+    """Anything that can look up an exchange rate without blocking"""
+
+    async def fetch_rate(
+        self, source: Currency, target: Currency, when: datetime.date | None = None
+    ) -> Decimal:
+        """
+        The price of one unit of source in target, as of when or the latest
+        one when it is None. Raises RateNotFoundException for unknown rates.
+        """
+        ...
+
+
+class StaticRateProvider:
+    """
+    A RateProvider answering from a RateTable or RateHistory, for tests and
+    for services that load their rates from a local file
+
+        provider = StaticRateProvider(RateTable({('EUR', 'USD'): '1.08'}))
+        provider = StaticRateProvider.from_file('rates.bin', delay=0.05)
+
+    A table ignores the date asked for and a history needs one. The delay
+    simulates the latency of a remote source, and fetches counts every lookup.
+    """
+
+    def __init__(self, rates: RateTable | RateHistory, delay: float = 0):
+        self._rates = rates
+        self._delay = delay
+        self.fetches = 0
+
+    @classmethod
+    def from_file(
+        cls, path: str | os.PathLike[str], delay: float = 0
+    ) -> "StaticRateProvider":
+        """Serves the rates of a file written by RateHistory.save"""
+        return cls(RateHistory.open(path), delay)
+
+    async def fetch_rate(
+        self, source: Currency, target: Currency, when: datetime.date | None = None
+    ) -> Decimal:
+        self.fetches += 1
+        if self._delay:
+            await asyncio.sleep(self._delay)
+        if isinstance(self._rates, RateHistory):
+            if when is None:
+                raise ValueError("A date is needed to look up a historical rate")
+            return self._rates.rate(source, target, when)
+        return self._rates.rate(source, target)
+
+
+class CachingRateProvider:
+    """
+    Caches the rates of another provider for async code
+
+    Concurrent requests for the same pair and date share a single fetch, so a
+    burst of coroutines missing the cache costs one round trip. Rates are kept
+    for ttl seconds. With stale_while_revalidate, a rate up to that many
+    seconds past its ttl is still returned straight away while a fresh one is
+    fetched in the background. Failed fetches are not cached.
+
+        rates = CachingRateProvider(remote, ttl=60, stale_while_revalidate=300)
+        await rates.convert(Money(10, 'EUR'), 'USD')
+        await rates.convert_many(prices, 'JPY', date(2024, 1, 2))
+
+    A CachingRateProvider is a RateProvider itself. It must be used from a
+    single event loop.
+    """
+
+    def __init__(
+        self,
+        provider: RateProvider,
+        ttl: float,
+        stale_while_revalidate: float = 0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._provider = provider
+        self._ttl = ttl
+        self._stale_while_revalidate = stale_while_revalidate
+        self._clock = clock
+        self._rates: dict[RateKey, tuple[Decimal, float]] = {}
+        self._inflight: dict[RateKey, asyncio.Task[Decimal]] = {}
+
+    def _fetch(self, key: RateKey) -> "asyncio.Task[Decimal]":
+        """The fetch in flight for a key, starting one if there is none"""
+        task = self._inflight.get(key)
+        # A finished task waits for its done callback to be forgotten
+        if task is None or task.done():
+            task = asyncio.ensure_future(self._refresh(key))
+            self._inflight[key] = task
+            task.add_done_callback(functools.partial(self._fetched, key))
+        return task
+
+    async def _refresh(self, key: RateKey) -> Decimal:
+        source, target, when = key
+        rate = await self._provider.fetch_rate(
+            _currency(source), _currency(target), when
+        )
+        self._rates[key] = (rate, self._clock())
+        return rate
+
+    def _fetched(self, key: RateKey, task: "asyncio.Task[Decimal]") -> None:
+        # Done callbacks run however the task ended, even when it was
+        # cancelled before its first step and _refresh never ran
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Background refreshes may fail with nobody waiting on them, the
+        # stale rate is kept and the next request tries again
+        if not task.cancelled():
+            task.exception()
+
+    async def _rate(self, key: RateKey) -> Decimal:
+        cached = self._rates.get(key)
+        if cached is not None:
+            rate, fetched_at = cached
+            age = self._clock() - fetched_at
+            if age < self._ttl:
+                return rate
+            if age < self._ttl + self._stale_while_revalidate:
+                self._fetch(key)
+                return rate
+        # Shielded so a cancelled caller doesn't cancel the fetch for the rest
+        return await asyncio.shield(self._fetch(key))
+
+    async def fetch_rate(
+        self, source: Currency, target: Currency, when: datetime.date | None = None
+    ) -> Decimal:
+        return await self._rate((source.code, target.code, when))
+
+    async def rate(
+        self,
+        source: Currency | str,
+        target: Currency | str,
+        when: datetime.date | None = None,
+    ) -> Decimal:
+        """The price of one unit of source in target, as of when or the latest"""
+        return await self._rate((_currency(source).code, _currency(target).code, when))
+
+    async def convert(
+        self, value: Money, to: Currency | str, when: datetime.date | None = None
+    ) -> Money:
+        """The value in another currency, at the rate as of when or the latest"""
+        target = _currency(to)
+        rate = await self._rate((value.currency.code, target.code, when))
+        return Money._from_parts(value.amount * rate, target)
+
+    async def convert_many(
+        self,
+        values: Iterable[Money],
+        to: Currency | str,
+        when: datetime.date | None = None,
+    ) -> list[Money]:
+        """
+        Converts every value to one currency, fetching the rates for all the
+        currencies present concurrently
+        """
+        target = _currency(to)
+        values = list(values)
+        codes = list({value.currency.code: None for value in values})
+        fetched = await asyncio.gather(
+            *(self._rate((code, target.code, when)) for code in codes)
+        )
+        rates = dict(zip(codes, fetched))
+        return [
+            Money._from_parts(value.amount * rates[value.currency.code], target)
+            for value in values
+        ]
+
+    def clear(self) -> None:
+        """Forgets every cached rate"""
+        self._rates.clear()
@@ -0,0 +1,146 @@
+import functools
+from decimal import Decimal
+from typing import Callable, Iterable, Mapping
+
+from money.constants import CURRENCY
+from money.dataclasses.currency import Currency
+from money.dataclasses.money import Money
+from money.exceptions import RateNotFoundException
+
+CurrencyPair = tuple[Currency | str, Currency | str]
+Rate = Decimal | int | float | str
+
+# Cross rates remembered by each table
+_CROSS_RATE_CACHE_SIZE = 1024
+
+_ONE = Decimal(1)
+
+
+def _currency(currency: Currency | str) -> Currency:
+    """The registry instance of a currency or code"""
+    code = currency.code if isinstance(currency, Currency) else currency.upper()
+    return CURRENCY[code]
+
+
+def _derive_rate(
+    lookup: Callable[[str, str], Decimal | None],
+    source: str,
+    target: str,
+    base: Currency | None,
+) -> Decimal | None:
+    """
+    The rate for a pair of codes from lookup, which gives the rate quoted for
+    a pair or None. Tries the pair, its inverse, then crossing through base.
+    """
+
+    def quoted(source: str, target: str) -> Decimal | None:
+        if source == target:
+            return _ONE
+        rate = lookup(source, target)
+        if rate is None:
+            inverse = lookup(target, source)
+            if inverse is not None:
+                rate = _ONE / inverse
+        return rate
+
+    rate = quoted(source, target)
+    if rate is None and base is not None:
+        to_base = quoted(source, base.code)
+        from_base = quoted(base.code, target)
+        if to_base is not None and from_base is not None:
+            rate = to_base * from_base
+    return rate
+
+
+class RateTable:
+    """
+    An immutable snapshot of exchange rates
+
+    Rates are given per pair of currencies as the price of one unit of the
+    first in the second, so (EUR, USD): '1.08' means EUR 1 buys USD 1.08. The
+    inverse pair is implied. Pairs that aren't quoted directly are crossed
+    through the base currency, and cross rates are remembered in a bounded
+    LRU cache.
+
+        rates = RateTable({('EUR', 'USD'): '1.08', ('EUR', 'JPY'): '160'}, 'EUR')
+        rates.rate('USD', 'JPY')                 # Decimal('148.148...')
+        rates.convert(Money(10, 'EUR'), 'USD')   # USD 10.80
+        rates.convert_many(prices, 'JPY')        # [JPY ..., ...]
+
+    Money never converts implicitly, a table has to be asked. Missing rates
+    raise RateNotFoundException. Converted amounts are not rounded, see
+    Money.quantize.
+    """
+
+    def __init__(
+        self,
+        rates: Mapping[CurrencyPair, Rate],
+        base: Currency | str | None = None,
+        cache_size: int = _CROSS_RATE_CACHE_SIZE,
+    ):
+        # Keyed by currency code, as MoneyBag's totals are
+        self._rates: dict[tuple[str, str], Decimal] = {}
+        for (source, target), rate in rates.items():
+            source, target = _currency(source), _currency(target)
+            rate = Decimal(str(rate))
+            if not rate.is_finite() or rate <= 0:
+                raise ValueError(
+                    "Invalid exchange rate %s for %s/%s" % (rate, source, target)
+                )
+            if source is not target:
+                self._rates[source.code, target.code] = rate
+
+        self._base = None if base is None else _currency(base)
+        self._cross_rate = functools.lru_cache(maxsize=cache_size)(self._derive)
+
+    @property
+    def base(self) -> Currency | None:
+        return self._base
+
+    @property
+    def rates(self) -> dict[tuple[Currency, Currency], Decimal]:
+        """The quoted rates, without implied inverses or crosses"""
+        return {
+            (CURRENCY[source], CURRENCY[target]): rate
+            for (source, target), rate in self._rates.items()
+        }
+
+    def _lookup(self, source: str, target: str) -> Decimal | None:
+        return self._rates.get((source, target))
+
+    def _derive(self, source: str, target: str) -> Decimal:
+        rate = _derive_rate(self._lookup, source, target, self._base)
+        if rate is None:
+            raise RateNotFoundException(
+                "No exchange rate from %s to %s" % (source, target)
+            )
+        return rate
+
+    def rate(self, source: Currency | str, target: Currency | str) -> Decimal:
+        """The price of one unit of source in target"""
+        return self._cross_rate(_currency(source).code, _currency(target).code)
+
+    def convert(self, value: Money, to: Currency | str) -> Money:
+        """The value in another currency, at this table's rate"""
+        target = _currency(to)
+        rate = self._cross_rate(value.currency.code, target.code)
+        return Money._from_parts(value.amount * rate, target)
+
+    def convert_many(self, values: Iterable[Money], to: Currency | str) -> list[Money]:
+        """Converts every value to one currency, looking up each rate once"""
+        target = _currency(to)
+        rates: dict[str, Decimal] = {}
+        results = []
+        for value in values:
+            code = value.currency.code
+            rate = rates.get(code)
+            if rate is None:
+                rate = rates[code] = self._cross_rate(code, target.code)
+            results.append(Money._from_parts(value.amount * rate, target))
+        return results
+
+    def __repr__(self) -> str:
+        return "RateTable(%s)" % ", ".join(
+            "%s/%s %s" % (source, target, rate)
+            for (source, target), rate in self._rates.items()
+        )
@@ -0,0 +1,299 @@
+import bisect
+import functools
+import struct
+import sys
+from decimal import Decimal
+from multiprocessing import resource_tracker, shared_memory
+from typing import Iterable
+
+from money.constants import CURRENCY
+from money.dataclasses.currency import Currency
+from money.dataclasses.money import Money
+from money.exceptions import RateNotFoundException
+from money.exchange.history import _coefficient
+from money.exchange.rate_table import (
+    _CROSS_RATE_CACHE_SIZE,
+    CurrencyPair,
+    Rate,
+    RateTable,
+    _currency,
+    _derive_rate,
+)
+
+# Snapshot layout, in native byte order as it never leaves the host:
+#   header magic, format version, number of pairs, base code (blank for
+#          none), snapshot version
+#   data   uint64 pair keys sorted, int64 rate coefficients, int8 rate
+#          exponents
+# The control segment holds only the version of the current snapshot, whose
+# segment is named after it.
+_MAGIC = b"PMRS"
+_FORMAT = 1
+_HEADER = struct.Struct("=4sHI3s3xQ")
+_VERSION = struct.Struct("=Q")
+
+# Segments created by this process, which its resource tracker already knows
+_created: set[str] = set()
+
+
+def _key(source: str, target: str) -> int:
+    """A pair of codes as an integer that sorts like the codes"""
+    return int.from_bytes((source + target).encode(), "big")
+
+
+def _snapshot_name(name: str, version: int) -> str:
+    return "%s.%d" % (name, version)
+
+
+def _create(name: str, size: int) -> shared_memory.SharedMemory:
+    segment = shared_memory.SharedMemory(name, create=True, size=size)
+    _created.add(segment._name)  # type: ignore[attr-defined]
+    return segment
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """
+    Attaches to a segment without handing it to this process' resource
+    tracker, which would otherwise unlink it when the process exits
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name, track=False)
+    segment = shared_memory.SharedMemory(name)
+    if segment._name not in _created:  # type: ignore[attr-defined]
+        resource_tracker.unregister(segment._name, "shared_memory")  # type: ignore[attr-defined]
+    return segment
+
+
+class SharedRatePublisher:
+    """
+    Publishes RateTable snapshots to shared memory for SharedRateTable readers
+
+        publisher = SharedRatePublisher('rates')
+        publisher.publish(RateTable({('EUR', 'USD'): '1.08'}, 'EUR'))
+
+    Every publish writes the whole snapshot to a new segment, then swaps it in
+    by bumping the version in the control segment with a single aligned 8
+    byte write. Readers see either the old snapshot or the new one, never a
+    mix. The previous segment is unlinked straight away, readers that still
+    map it keep it alive until they move on.
+
+    close (or leaving the with block) unlinks every segment, so the publisher
+    should live as long as its readers need rates.
+    """
+
+    def __init__(self, name: str):
+        self._name = name
+        self._control = _create(name, _VERSION.size)
+        _VERSION.pack_into(self._control.buf, 0, 0)
+        self._version = 0
+        self._snapshot: shared_memory.SharedMemory | None = None
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def version(self) -> int:
+        """The version of the current snapshot, 0 before the first publish"""
+        return self._version
+
+    def publish(self, rates: RateTable) -> int:
+        """Makes rates the current snapshot and returns its version"""
+        quotes = sorted(
+            (_key(source.code, target.code), *_coefficient(rate))
+            for (source, target), rate in rates.rates.items()
+        )
+        count = len(quotes)
+        version = self._version + 1
+        segment = _create(
+            _snapshot_name(self._name, version),
+            # SharedMemory refuses empty segments
+            max(_HEADER.size + 17 * count, 1),
+        )
+        base = rates.base.code.encode() if rates.base is not None else b"   "
+        _HEADER.pack_into(segment.buf, 0, _MAGIC, _FORMAT, count, base, version)
+        struct.pack_into(
+            "=%dQ%dq%db" % (count, count, count),
+            segment.buf,
+            _HEADER.size,
+            *(quote[0] for quote in quotes),
+            *(quote[1] for quote in quotes),
+            *(quote[2] for quote in quotes),
+        )
+
+        # The swap, from here on readers attach to the new segment
+        _VERSION.pack_into(self._control.buf, 0, version)
+        self._version = version
+        if self._snapshot is not None:
+            self._snapshot.close()
+            self._snapshot.unlink()
+        self._snapshot = segment
+        return version
+
+    def close(self) -> None:
+        """Unlinks the current snapshot and the control segment"""
+        for segment in (self._snapshot, self._control):
+            if segment is not None:
+                segment.close()
+                segment.unlink()
+        self._snapshot = None
+
+    def __enter__(self) -> "SharedRatePublisher":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+class SharedRateTable:
+    """
+    Reads the rate snapshots of a SharedRatePublisher in another process
+
+        rates = SharedRateTable('rates')
+        rates.convert(Money(10, 'EUR'), 'USD')   # USD 10.80
+        rates.convert_many(prices, 'JPY')
+
+    It converts like a RateTable, inverse pairs are implied and other pairs
+    are crossed through the base currency. The rates are read in place from
+    shared memory, so every worker of a server shares one copy. Each lookup
+    first checks the published version, and when a new snapshot has been
+    published the table switches to it, dropping its cached cross rates.
+    Lookups before the first publish raise RateNotFoundException.
+    """
+
+    def __init__(self, name: str):
+        self._name = name
+        self._control = _attach(name)
+        self._version_view = self._control.buf[: _VERSION.size].cast("Q")
+        self._snapshot: shared_memory.SharedMemory | None = None
+        self._views: list[memoryview] = []
+        self._version = 0
+        self._base: Currency | None = None
+        self._keys: memoryview | None = None
+        self._coefficients: memoryview | None = None
+        self._exponents: memoryview | None = None
+        self._cross_rate = functools.lru_cache(maxsize=_CROSS_RATE_CACHE_SIZE)(
+            self._derive
+        )
+
+    def _release(self) -> None:
+        self._keys = self._coefficients = self._exponents = None
+        for view in reversed(self._views):
+            view.release()
+        self._views.clear()
+        if self._snapshot is not None:
+            self._snapshot.close()
+            self._snapshot = None
+
+    def _refresh(self) -> None:
+        """Switches to the current snapshot if another was published"""
+        version = self._version_view[0]
+        while version != self._version:
+            try:
+                segment = _attach(_snapshot_name(self._name, version))
+            except FileNotFoundError:
+                # Replaced between reading the version and attaching
+                version = self._version_view[0]
+                continue
+            magic, _, count, base, published = _HEADER.unpack_from(segment.buf, 0)
+            if magic != _MAGIC or published != version:
+                segment.close()
+                raise ValueError("%s is not a rate snapshot" % segment.name)
+
+            self._release()
+            self._snapshot = segment
+            data = segment.buf
+            keys = data[_HEADER.size : _HEADER.size + 8 * count]
+            coefficients = data[_HEADER.size + 8 * count : _HEADER.size + 16 * count]
+            exponents = data[_HEADER.size + 16 * count : _HEADER.size + 17 * count]
+            self._keys = keys.cast("Q")
+            self._coefficients = coefficients.cast("q")
+            self._exponents = exponents.cast("b")
+            self._views.extend(
+                [keys, coefficients, exponents]
+                + [self._keys, self._coefficients, self._exponents]
+            )
+            self._base = CURRENCY[base.decode()] if base.strip() else None
+            self._version = version
+            self._cross_rate.cache_clear()
+
+    @property
+    def version(self) -> int:
+        """The version of the snapshot in use, 0 before the first publish"""
+        self._refresh()
+        return self._version
+
+    @property
+    def base(self) -> Currency | None:
+        self._refresh()
+        return self._base
+
+    def _lookup(self, source: str, target: str) -> Decimal | None:
+        keys = self._keys
+        if keys is None or self._coefficients is None or self._exponents is None:
+            return None
+        key = _key(source, target)
+        index = bisect.bisect_left(keys, key)
+        if index == len(keys) or keys[index] != key:
+            return None
+        return Decimal(self._coefficients[index]).scaleb(self._exponents[index])
+
+    def _derive(self, source: str, target: str) -> Decimal:
+        rate = _derive_rate(self._lookup, source, target, self._base)
+        if rate is None:
+            raise RateNotFoundException(
+                "No exchange rate from %s to %s" % (source, target)
+            )
+        return rate
+
+    def rate(self, source: Currency | str, target: Currency | str) -> Decimal:
+        """The price of one unit of source in target"""
+        self._refresh()
+        return self._cross_rate(_currency(source).code, _currency(target).code)
+
+    def convert(self, value: Money, to: Currency | str) -> Money:
+        """The value in another currency, at the current snapshot's rate"""
+        self._refresh()
+        target = _currency(to)
+        rate = self._cross_rate(value.currency.code, target.code)
+        return Money._from_parts(value.amount * rate, target)
+
+    def convert_many(self, values: Iterable[Money], to: Currency | str) -> list[Money]:
+        """
+        Converts every value to one currency, looking up each rate once. All
+        the values are converted with the same snapshot.
+        """
+        self._refresh()
+        target = _currency(to)
+        rates: dict[str, Decimal] = {}
+        results = []
+        for value in values:
+            code = value.currency.code
+            rate = rates.get(code)
+            if rate is None:
+                rate = rates[code] = self._cross_rate(code, target.code)
+            results.append(Money._from_parts(value.amount * rate, target))
+        return results
+
+    def snapshot(self) -> RateTable:
+        """A private RateTable copy of the current snapshot"""
+        self._refresh()
+        rates: dict[CurrencyPair, Rate] = {}
+        if self._keys is not None and self._coefficients and self._exponents:
+            quotes = zip(self._keys, self._coefficients, self._exponents)
+            for key, coefficient, exponent in quotes:
+                codes = key.to_bytes(6, "big").decode()
+                rates[codes[:3], codes[3:]] = Decimal(coefficient).scaleb(exponent)
+        return RateTable(rates, self._base)
+
+    def close(self) -> None:
+        """Detaches from the shared memory, without unlinking anything"""
+        self._release()
+        self._version_view.release()
+        self._control.close()
+
+    def __enter__(self) -> "SharedRateTable":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
@@ -0,0 +1,153 @@
+import functools
+from typing import Iterable, Iterator, Mapping, Sequence, TypeVar, overload
+
+from money.dataclasses.currency import Currency
+
+T = TypeVar("T")
+
+# code, numeric, decimals, symbol, name, countries
+CurrencyRow = tuple[str, str, int, str, str, tuple[str, ...]]
+
+
+class CurrencyRegistry(Mapping[str, Currency]):
+    """
+    A read-only mapping of ISO 4217 code to Currency
+
+    Each Currency is built from its table row the first time it is looked up,
+    and that same instance is returned from then on. Programs that only ever
+    touch a couple of currencies never pay for building the rest.
+
+    Currencies can also be found by ISO numeric code, country or symbol. Those
+    indexes are built from the table rows once, on first use.
+    """
+
+    def __init__(self, rows: Iterable[CurrencyRow]):
+        self._rows: dict[str, CurrencyRow] = {row[0]: row for row in rows}
+        self._currencies: dict[str, Currency] = {}
+
+    def _build(self, code: str) -> Currency:
+        code, numeric, decimals, symbol, name, countries = self._rows[code]
+        currency = Currency(
+            code=code,
+            numeric=numeric,
+            decimals=decimals,
+            symbol=symbol,
+            name=name,
+            countries=list(countries),
+        )
+        # setdefault keeps a single instance if two threads race to build it
+        return self._currencies.setdefault(code, currency)
+
+    def __getitem__(self, code: str) -> Currency:
+        try:
+            return self._currencies[code]
+        except KeyError:
+            return self._build(code)
+
+    @overload
+    def get(self, code: str) -> Currency | None: ...
+
+    @overload
+    def get(self, code: str, default: Currency | T) -> Currency | T: ...
+
+    def get(
+        self, code: str, default: Currency | T | None = None
+    ) -> Currency | T | None:
+        # Mapping.get would go through a KeyError for every miss
+        currency = self._currencies.get(code)
+        if currency is None and code in self._rows:
+            currency = self._build(code)
+        return default if currency is None else currency
+
+    @functools.cached_property
+    def _numeric_index(self) -> dict[str, str]:
+        return {row[1]: row[0] for row in self._rows.values()}
+
+    @functools.cached_property
+    def _country_index(self) -> dict[str, tuple[str, ...]]:
+        index: dict[str, tuple[str, ...]] = {}
+        for code, *_, countries in self._rows.values():
+            for country in countries:
+                index[country.upper()] = index.get(country.upper(), ()) + (code,)
+        return index
+
+    @functools.cached_property
+    def _symbol_index(self) -> dict[str, tuple[str, ...]]:
+        index: dict[str, tuple[str, ...]] = {}
+        for code, _, _, symbol, *_ in self._rows.values():
+            if symbol:
+                index[symbol] = index.get(symbol, ()) + (code,)
+        return index
+
+    def by_numeric(self, numeric: str | int) -> Currency:
+        """
+        The currency with the given ISO 4217 numeric code, e.g. '392' or 392
+        for JPY. Raises KeyError for unknown codes.
+        """
+        return self[self._numeric_index[str(numeric).zfill(3)]]
+
+    def currencies_for_country(self, country: str) -> tuple[Currency, ...]:
+        """
+        The currencies used in a country, matched case-insensitively against
+        the ISO 4217 country names, e.g. 'JAPAN' or 'Korea, Republic of'
+        """
+        return tuple(
+            self[code] for code in self._country_index.get(country.upper(), ())
+        )
+
+    def currencies_for_symbol(self, symbol: str) -> tuple[Currency, ...]:
+        """The currencies written with a symbol, e.g. '$' or '£'"""
+        return tuple(self[code] for code in self._symbol_index.get(symbol, ()))
+
+    def __contains__(self, code: object) -> bool:
+        return code in self._rows
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._rows)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __repr__(self) -> str:
+        return "%s(%s)" % (type(self).__name__, ", ".join(self._rows))
+
+
+class CurrencyList(Sequence[Currency]):
+    """
+    Every currency of a registry in table order. Accessing any of them builds
+    all of them.
+    """
+
+    def __init__(self, registry: CurrencyRegistry):
+        self._registry = registry
+        self._currencies: tuple[Currency, ...] | None = None
+
+    def _materialize(self) -> tuple[Currency, ...]:
+        if self._currencies is None:
+            self._currencies = tuple(self._registry[code] for code in self._registry)
+        return self._currencies
+
+    @overload
+    def __getitem__(self, index: int) -> Currency: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> tuple[Currency, ...]: ...
+
+    def __getitem__(self, index: int | slice) -> Currency | tuple[Currency, ...]:
+        return self._materialize()[index]
+
+    def __iter__(self) -> Iterator[Currency]:
+        return iter(self._materialize())
+
+    def __len__(self) -> int:
+        return len(self._registry)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, CurrencyList):
+            other = other._materialize()
+        return self._materialize() == other
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return repr(self._materialize())
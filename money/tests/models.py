@@ -5,6 +5,7 @@ from django.db.models import QuerySet
 from typing_extensions import Self
 
 from money.contrib.django.models import fields
+from money.contrib.django.models.query import MoneyQuerySet
 from money.dataclasses.money import Money
 
 T = TypeVar("T", bound=models.Model)
@@ -78,6 +79,18 @@ class NullableMoneyModel(models.Model):
         app_label = "tests"
 
 
+class BulkMoneyModel(models.Model):
+    name = models.CharField(max_length=100)
+
+    price = fields.MoneyField(max_digits=12, decimal_places=3)
+    price_currency: fields.CurrencyField
+
+    objects: ClassVar[models.Manager["BulkMoneyModel"]] = MoneyQuerySet.as_manager()
+
+    class Meta:
+        app_label = "tests"
+
+
 class CustomQuerySet(QuerySet[T]):
     def only_usd(self, *args: Any, **kwargs: Any) -> Self:
         return self.filter(price_currency="USD", *args, **kwargs)
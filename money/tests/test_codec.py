@@ -0,0 +1,108 @@
+import io
+from decimal import Decimal
+
+import pytest
+
+from money.codec import (
+    MoneyDecoder,
+    MoneyEncoder,
+    decode,
+    decode_columns,
+    encode,
+)
+from money.constants import CURRENCY
+from money.dataclasses.currency import Currency
+from money.dataclasses.money import Money
+from money.exceptions import PrecisionLossException
+
+VALUES = [
+    Money("1.50", "USD"),
+    Money("1.5", "USD"),
+    Money("-0.00", "EUR"),
+    Money("-12345.678", "JPY"),
+    Money("1E+3", "USD"),
+    Money("18446744073709551615", "GBP"),
+]
+
+
+def test_exact_round_trip() -> None:
+    decoded = decode(encode(VALUES))
+    assert [str(value) for value in decoded] == [str(value) for value in VALUES]
+    assert all(
+        value.amount.as_tuple() == original.amount.as_tuple()
+        for value, original in zip(decoded, VALUES)
+    )
+    assert all(value.currency is CURRENCY[value.currency.code] for value in decoded)
+    assert decode(encode([])) == []
+
+
+def test_minor_units_round_trip() -> None:
+    values = [Money("1.5", "USD"), Money("-7", "JPY"), Money("0.001", "BHD")]
+    data = encode(values, minor_units=True)
+    assert [str(value) for value in decode(data)] == [
+        "USD 1.50",
+        "JPY -7",
+        "BHD 0.001",
+    ]
+    assert len(data) < len(encode(values))
+    with pytest.raises(PrecisionLossException):
+        encode([Money("0.001", "USD")], minor_units=True)
+
+
+def test_unencodable_values() -> None:
+    with pytest.raises(ValueError):
+        encode([Money("NaN", "USD")])
+    with pytest.raises(ValueError):
+        encode([Money("18446744073709551616", "USD")])
+    with pytest.raises(ValueError):
+        encode([Money(1, Currency(code="AAA"))])
+
+
+def test_streaming_blocks() -> None:
+    stream = io.BytesIO()
+    with MoneyEncoder(stream, block_size=2) as encoder:
+        encoder.write(VALUES[0])
+        encoder.write_many(VALUES[1:])
+    stream.seek(0)
+    blocks = list(MoneyDecoder(stream).blocks())
+    assert [len(block) for block in blocks] == [2, 2, 2]
+    # Each block only carries the currencies new to the stream
+    assert [block.currencies for block in blocks][-1] == (
+        CURRENCY["USD"],
+        CURRENCY["EUR"],
+        CURRENCY["JPY"],
+        CURRENCY["GBP"],
+    )
+    stream.seek(0)
+    assert list(MoneyDecoder(stream)) == VALUES
+
+
+@pytest.mark.parametrize("minor_units", [False, True])
+def test_columns(minor_units: bool) -> None:
+    values = [Money("1.50", "USD"), Money("-3", "JPY"), Money("2.25", "USD")]
+    columns = decode_columns(encode(values, minor_units))
+    assert len(columns) == 3
+    assert columns[1] == Money("-3", "JPY")
+    assert columns.to_money() == values
+    assert [columns.currencies[index] for index in columns.indexes] == [
+        value.currency for value in values
+    ]
+    if minor_units:
+        assert list(columns.units or ()) == [150, -3, 225]
+    else:
+        assert list(columns.exponents or ()) == [-2, 0, -2]
+        assert columns[2].amount == Decimal("2.25")
+
+
+def test_columns_to_array() -> None:
+    pytest.importorskip("numpy")
+    values = [Money("1.50", "USD"), Money("-3", "JPY"), Money("2.25", "USD")]
+    for minor_units in (False, True):
+        array = decode_columns(encode(values, minor_units)).to_array()
+        assert array.to_money() == values
+
+
+def test_rejects_other_streams() -> None:
+    for data in (b"", b"not a money stream", encode(VALUES)[:-1]):
+        with pytest.raises(ValueError):
+            decode(data)
@@ -1,4 +1,8 @@
+import pickle
+
+from money.constants import CURRENCY, CURRENCY_LIST, DEFAULT_CURRENCY
 from money.dataclasses.currency import Currency
+from money.dataclasses.money import Money
 
 currency = Currency(
     code="ABC",
@@ -55,3 +59,46 @@ def test_currency_equality_against_other() -> None:
     """
 
     assert currency != 1000
+
+
+def test_currency_hash_matches_equality() -> None:
+    """
+    Equal currencies hash the same, including against the bare code
+    """
+    assert hash(currency) == hash(Currency(code="ABC", numeric="1001"))
+    assert hash(currency) == hash("ABC")
+
+
+def test_currency_as_dict_key() -> None:
+    totals = {CURRENCY["USD"]: 1, CURRENCY["JPY"]: 2}
+    assert totals[CURRENCY["USD"]] == 1
+    assert totals[CURRENCY["JPY"]] == 2
+    assert "JPY" in totals
+    assert {CURRENCY["USD"], CURRENCY["USD"], CURRENCY["EUR"]} == {
+        CURRENCY["USD"],
+        CURRENCY["EUR"],
+    }
+
+
+def test_currency_registry_is_canonical() -> None:
+    """
+    Money resolves codes to the registry instances themselves
+    """
+    assert (
+        CURRENCY["USD"] is CURRENCY_LIST[[c.code for c in CURRENCY_LIST].index("USD")]
+    )
+    assert Money(1, "usd").currency is CURRENCY["USD"]
+    assert Money("JPY 1").currency is CURRENCY["JPY"]
+    assert Money(1).currency is DEFAULT_CURRENCY
+
+
+def test_currency_pickles_to_registry_instance() -> None:
+    data = pickle.dumps(CURRENCY["EUR"])
+    assert b"Euro" not in data
+    assert pickle.loads(data) is CURRENCY["EUR"]
+    # Currencies outside the registry keep all their fields
+    loaded = pickle.loads(pickle.dumps(currency))
+    assert loaded == currency
+    assert (loaded.name, loaded.countries) == ("ABC Currency", ["My Country"])
+    renamed = Currency(code="USD", name="Not the dollar")
+    assert pickle.loads(pickle.dumps(renamed)).name == "Not the dollar"
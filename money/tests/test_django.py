@@ -1,11 +1,18 @@
+import json
+from decimal import Decimal
+from typing import Any
+
+import django
 import pytest
-from django.db import IntegrityError
+from django.db import IntegrityError, connection
 from django.test import TestCase
 
 from money.constants import CURRENCY
+from money.contrib.django.models.query import money_field_names
 from money.dataclasses.money import Money
 from money.exceptions import NotSupportedLookup
 from money.tests.models import (
+    BulkMoneyModel,
     MoneyModelDefaultMoneyUSD,
     MoneyModelDefaults,
     SimpleMoneyModel,
@@ -206,6 +213,166 @@ def test_currency_accessor() -> None:
     assert created.price.currency == "EUR"
 
 
+@pytest.mark.django_db
+def test_price_is_cached_per_instance() -> None:
+    created = SimpleMoneyModel.objects.create(name="cached", price=Money(5, "USD"))
+    entry = SimpleMoneyModel.objects.get(pk=created.pk)
+    assert entry.price is entry.price
+    assert SimpleMoneyModel.objects.get(pk=created.pk).price is not entry.price
+
+    price = Money(7, "EUR")
+    entry.price = price
+    assert entry.price is price
+
+    # Changes to the underlying attributes are picked up
+    entry.price_currency = "JPY"
+    assert entry.price == Money(7, "JPY")
+    entry.price = Decimal("8")  # type: ignore[assignment]
+    assert entry.price == Money(8, "JPY")
+
+    entry.refresh_from_db()
+    assert entry.price == Money(5, "USD")
+    assert entry.price is entry.price
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "model",
+    [
+        BulkMoneyModel,
+        pytest.param(
+            SimpleMoneyModel,
+            marks=pytest.mark.skipif(
+                django.VERSION < (4, 2),
+                reason="Plain querysets pair the columns from Django 4.2 on",
+            ),
+        ),
+    ],
+)
+@pytest.mark.parametrize(
+    "fields",
+    [
+        {"only": ["price"]},
+        {"only": ["name", "price_currency"]},
+        {"defer": ["price"]},
+        {"defer": ["price_currency"]},
+    ],
+)
+def test_deferred_columns_load_together(
+    model: type[BulkMoneyModel] | type[SimpleMoneyModel],
+    fields: dict[str, list[str]],
+    django_assert_num_queries: Any,
+) -> None:
+    for i in range(10):
+        model.objects.create(name=str(i), price=Money(i, "EUR"))
+    queryset = model.objects.order_by("pk")
+    if "only" in fields:
+        queryset = queryset.only(*fields["only"])
+    else:
+        queryset = queryset.defer(*fields["defer"])
+    with django_assert_num_queries(1):
+        assert [entry.price for entry in queryset] == [
+            Money(i, "EUR") for i in range(10)
+        ]
+
+
+@pytest.mark.django_db
+def test_money_queryset_defers_both_columns() -> None:
+    BulkMoneyModel.objects.create(name="deferred", price=Money(5, "EUR"))
+    entry = BulkMoneyModel.objects.defer("price_currency", "price").get()
+    assert entry.get_deferred_fields() == {"price", "price_currency"}
+    entry = BulkMoneyModel.objects.only("name").get()
+    assert entry.get_deferred_fields() == {"price", "price_currency"}
+    entry = BulkMoneyModel.objects.defer("price").defer("price_currency").get()
+    assert entry.get_deferred_fields() == {"price", "price_currency"}
+    entry = BulkMoneyModel.objects.defer("price").defer(None).get()
+    assert entry.get_deferred_fields() == set()
+
+
+@pytest.mark.django_db
+def test_deferred_price(django_assert_num_queries: Any) -> None:
+    SimpleMoneyModel.objects.create(name="deferred", price=Money(5, "EUR"))
+    entry = SimpleMoneyModel.objects.only("name").get()
+    assert entry.get_deferred_fields() == {"price", "price_currency"}
+    # Both columns in a single query, not one each
+    with django_assert_num_queries(1):
+        assert entry.price == Money(5, "EUR")
+        assert type(entry.__dict__["price"]) is Decimal
+        assert entry.price_currency == "EUR"
+
+    # Assigning an amount leaves a deferred currency deferred
+    entry = SimpleMoneyModel.objects.only("name").get()
+    entry.price = 7  # type: ignore[assignment]
+    assert entry.get_deferred_fields() == {"price_currency"}
+    entry.save()
+    assert SimpleMoneyModel.objects.get().price == Money(7, "EUR")
+    assert entry.price == Money(7, "EUR")
+
+
+@pytest.mark.django_db
+def test_bulk_update_writes_currency() -> None:
+    BulkMoneyModel.objects.bulk_create(
+        BulkMoneyModel(name=str(i), price=Money(i, "USD")) for i in range(3)
+    )
+    entries = list(BulkMoneyModel.objects.order_by("pk"))
+    for entry in entries:
+        entry.price = Money(entry.price.amount + 1, "EUR")
+    assert BulkMoneyModel.objects.bulk_update(entries, ["price"]) == 3
+    assert [entry.price for entry in BulkMoneyModel.objects.order_by("pk")] == [
+        Money(1, "EUR"),
+        Money(2, "EUR"),
+        Money(3, "EUR"),
+    ]
+
+
+@pytest.mark.django_db
+@pytest.mark.skipif(
+    django.VERSION < (4, 1), reason="update_conflicts is new in Django 4.1"
+)
+def test_bulk_create_update_conflicts_writes_currency() -> None:
+    entry = BulkMoneyModel.objects.create(name="conflict", price=Money(1, "USD"))
+    entry.price = Money(9, "JPY")
+    BulkMoneyModel.objects.bulk_create(
+        [entry],
+        update_conflicts=True,
+        unique_fields=["id"],
+        update_fields=["price"],
+    )
+    assert BulkMoneyModel.objects.get(pk=entry.pk).price == Money(9, "JPY")
+
+
+def test_money_field_names() -> None:
+    assert money_field_names(BulkMoneyModel, ["price", "name"]) == [
+        "price",
+        "price_currency",
+        "name",
+    ]
+    assert money_field_names(BulkMoneyModel, ["price_currency", "price"]) == [
+        "price_currency",
+        "price",
+    ]
+
+
+def test_get_db_prep_save() -> None:
+    field = BulkMoneyModel._meta.get_field("price")
+    assert field.get_db_prep_save(Money("1.50", "USD"), connection) == Decimal("1.50")
+    assert field.get_db_prep_save(Decimal("2"), connection) == Decimal("2")
+    assert field.get_db_prep_save(None, connection) is None
+    assert field.get_db_prep_save(3, connection) == Decimal("3")
+
+
+@pytest.mark.django_db
+def test_currency_loaded_as_code() -> None:
+    created = SimpleMoneyModel.objects.create(name="loaded", price=Money(5, "USD"))
+    entry = SimpleMoneyModel.objects.get(pk=created.pk)
+    assert type(entry.price_currency) is str
+    assert entry.price == Money(5, "USD")
+    assert entry.price.currency is CURRENCY["USD"]
+    values = list(SimpleMoneyModel.objects.values("price", "price_currency"))
+    assert values[0]["price_currency"] == "USD"
+    json.dumps(values, default=str)
+
+
 @pytest.mark.django_db
 class TestMoneyFieldFixtureLoading(TestCase):
     """
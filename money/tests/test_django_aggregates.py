@@ -0,0 +1,111 @@
+from decimal import Decimal
+from typing import Any
+
+import pytest
+from django.db.models import Count, Q
+
+from money.constants import CURRENCY
+from money.contrib.django.models.aggregates import (
+    MoneyAvg,
+    MoneyMax,
+    MoneyMin,
+    MoneySum,
+)
+from money.dataclasses.money import Money
+from money.tests.models import BulkMoneyModel, SimpleMoneyModel
+
+PRICES = [
+    Money("10.50", "USD"),
+    Money("4.50", "USD"),
+    Money("80", "EUR"),
+    Money("1000", "JPY"),
+    Money("3000", "JPY"),
+]
+
+
+@pytest.fixture
+def prices() -> None:
+    BulkMoneyModel.objects.bulk_create(
+        BulkMoneyModel(name=str(price), price=price) for price in PRICES
+    )
+
+
+@pytest.mark.django_db
+def test_aggregates_per_currency(prices: None, django_assert_num_queries: Any) -> None:
+    with django_assert_num_queries(1):
+        result = BulkMoneyModel.objects.aggregate(
+            total=MoneySum("price"),
+            lowest=MoneyMin("price"),
+            highest=MoneyMax("price"),
+            average=MoneyAvg("price"),
+        )
+    assert result == {
+        "total": {
+            CURRENCY["USD"]: Money(15, "USD"),
+            CURRENCY["EUR"]: Money(80, "EUR"),
+            CURRENCY["JPY"]: Money(4000, "JPY"),
+        },
+        "lowest": {
+            CURRENCY["USD"]: Money("4.50", "USD"),
+            CURRENCY["EUR"]: Money(80, "EUR"),
+            CURRENCY["JPY"]: Money(1000, "JPY"),
+        },
+        "highest": {
+            CURRENCY["USD"]: Money("10.50", "USD"),
+            CURRENCY["EUR"]: Money(80, "EUR"),
+            CURRENCY["JPY"]: Money(3000, "JPY"),
+        },
+        "average": {
+            CURRENCY["USD"]: Money("7.50", "USD"),
+            CURRENCY["EUR"]: Money(80, "EUR"),
+            CURRENCY["JPY"]: Money(2000, "JPY"),
+        },
+    }
+    assert all(
+        type(value.amount) is Decimal
+        for values in result.values()
+        for value in values.values()
+    )
+
+
+@pytest.mark.django_db
+def test_aggregates_with_others(prices: None) -> None:
+    result = BulkMoneyModel.objects.filter(name__startswith="USD").aggregate(
+        MoneySum("price"),
+        Count("pk"),
+        large=MoneySum("price", filter=Q(price__gt=Money(5, "USD"))),
+    )
+    assert result == {
+        "price__sum": {CURRENCY["USD"]: Money(15, "USD")},
+        "pk__count": 2,
+        "large": {CURRENCY["USD"]: Money("10.50", "USD")},
+    }
+
+    # Currencies without any amount are left out
+    result = BulkMoneyModel.objects.aggregate(
+        total=MoneySum("price", filter=Q(name__startswith="JPY"))
+    )
+    assert result == {"total": {CURRENCY["JPY"]: Money(4000, "JPY")}}
+    assert BulkMoneyModel.objects.none().aggregate(total=MoneySum("price")) == {
+        "total": {}
+    }
+
+
+@pytest.mark.django_db
+def test_annotate_grouped_by_currency(prices: None) -> None:
+    rows = (
+        BulkMoneyModel.objects.order_by("price_currency")
+        .values("price_currency")
+        .annotate(total=MoneySum("price"))
+    )
+    assert [(row["price_currency"], row["total"]) for row in rows] == [
+        (CURRENCY["EUR"], Decimal(80)),
+        (CURRENCY["JPY"], Decimal(4000)),
+        (CURRENCY["USD"], Decimal(15)),
+    ]
+
+
+@pytest.mark.django_db
+def test_plain_aggregate_refused() -> None:
+    with pytest.raises(TypeError):
+        SimpleMoneyModel.objects.aggregate(total=MoneySum("price"))
@@ -0,0 +1,102 @@
+from decimal import Decimal
+
+import pytest
+
+from money.constants import CURRENCY
+from money.dataclasses.currency import Currency
+from money.dataclasses.money import Money
+from money.exceptions import CurrencyMismatchException, RateNotFoundException
+from money.exchange import RateTable
+
+RATES = RateTable(
+    {
+        ("EUR", "USD"): "1.08",
+        (CURRENCY["EUR"], CURRENCY["JPY"]): Decimal("160"),
+        ("GBP", "EUR"): "1.17",
+    },
+    base="EUR",
+)
+
+
+def test_quoted_and_inverse_rates() -> None:
+    assert RATES.rate("EUR", "USD") == Decimal("1.08")
+    assert RATES.rate(CURRENCY["EUR"], "jpy") == Decimal("160")
+    assert RATES.rate("USD", "EUR") == Decimal(1) / Decimal("1.08")
+    assert RATES.rate("USD", "USD") == 1
+
+
+def test_cross_rates_through_base() -> None:
+    assert RATES.rate("USD", "JPY") == Decimal(1) / Decimal("1.08") * 160
+    assert RATES.rate("GBP", "JPY") == Decimal("1.17") * 160
+    assert RATES.rate("JPY", "GBP") == (
+        Decimal(1) / Decimal("160") * (Decimal(1) / Decimal("1.17"))
+    )
+
+
+def test_cross_rates_are_cached() -> None:
+    rates = RateTable({("EUR", "USD"): "1.08", ("EUR", "JPY"): "160"}, "EUR")
+    rates.rate("USD", "JPY")
+    rates.rate("USD", "JPY")
+    info = rates._cross_rate.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+
+
+def test_cross_rate_cache_is_bounded() -> None:
+    rates = RateTable({("EUR", "USD"): "1.08", ("EUR", "JPY"): "160"}, "EUR", 2)
+    for source in ("EUR", "USD", "JPY"):
+        rates.rate(source, "EUR")
+    assert rates._cross_rate.cache_info().currsize == 2
+
+
+def test_missing_rates() -> None:
+    with pytest.raises(RateNotFoundException, match="USD to CHF"):
+        RATES.rate("USD", "CHF")
+    unbased = RateTable({("EUR", "USD"): "1.08", ("EUR", "JPY"): "160"})
+    assert unbased.rate("USD", "EUR") == Decimal(1) / Decimal("1.08")
+    with pytest.raises(RateNotFoundException):
+        unbased.rate("USD", "JPY")
+
+
+def test_invalid_rates() -> None:
+    for rate in ("0", "-1", "NaN", "Infinity"):
+        with pytest.raises(ValueError):
+            RateTable({("EUR", "USD"): rate})
+    with pytest.raises(KeyError):
+        RateTable({("EUR", "ABC"): "1"})
+
+
+def test_convert() -> None:
+    converted = RATES.convert(Money("10", "EUR"), "USD")
+    assert converted == Money("10.80", "USD")
+    assert converted.currency is CURRENCY["USD"]
+    assert RATES.convert(Money("1.08", "USD"), CURRENCY["EUR"]) == Money(1, "EUR")
+    assert RATES.convert(Money("2", "GBP"), "JPY") == Money("374.40", "JPY")
+    assert RATES.convert(Money("5", "EUR"), "EUR") == Money(5, "EUR")
+
+
+def test_convert_returns_registry_currency() -> None:
+    custom = Currency(code="USD", name="Copy of USD")
+    assert RATES.convert(Money(1, "EUR"), custom).currency is CURRENCY["USD"]
+
+
+def test_convert_many() -> None:
+    values = [Money("10", "EUR"), Money("1", "GBP"), Money("10", "EUR")]
+    assert RATES.convert_many(values, "USD") == [
+        RATES.convert(value, "USD") for value in values
+    ]
+    assert RATES.convert_many([], "USD") == []
+    with pytest.raises(RateNotFoundException):
+        RATES.convert_many([Money(1, "CHF")], "USD")
+
+
+def test_no_implicit_conversion() -> None:
+    with pytest.raises(CurrencyMismatchException):
+        Money(10, "EUR") + RATES.convert(Money(10, "EUR"), "USD")
+
+
+def test_rates_snapshot() -> None:
+    rates = RATES.rates
+    assert rates[CURRENCY["EUR"], CURRENCY["USD"]] == Decimal("1.08")
+    rates.clear()
+    assert RATES.rate("EUR", "USD") == Decimal("1.08")
+    assert RATES.base is CURRENCY["EUR"]
@@ -0,0 +1,99 @@
+from decimal import Decimal
+
+import pytest
+
+from money.constants import CURRENCY
+from money.dataclasses.money import Money
+from money.exceptions import RateNotFoundException
+from money.exchange import ConversionGraph, RateTable
+from money.exchange.rate_table import CurrencyPair, Rate
+
+RATES = RateTable(
+    {
+        ("USD", "ZMK"): "5300",
+        ("USD", "EUR"): "0.92",
+        ("EUR", "JPY"): "160",
+        ("EUR", "CHF"): "0.96",
+        ("CHF", "JPY"): "170",
+        ("GBP", "CHF"): "1.12",
+    }
+)
+
+
+def codes(graph: ConversionGraph, source: str, target: str) -> list[str]:
+    return [currency.code for currency in graph.path(source, target)]
+
+
+def test_fewest_hops() -> None:
+    graph = ConversionGraph(RATES)
+    assert codes(graph, "USD", "EUR") == ["USD", "EUR"]
+    assert codes(graph, "EUR", "USD") == ["EUR", "USD"]
+    assert codes(graph, "ZMK", "JPY") == ["ZMK", "USD", "EUR", "JPY"]
+    assert codes(graph, "GBP", "JPY") == ["GBP", "CHF", "JPY"]
+    assert codes(graph, "USD", "USD") == ["USD"]
+    assert all(
+        currency is CURRENCY[currency.code] for currency in graph.path("ZMK", "GBP")
+    )
+
+
+def test_lowest_spread() -> None:
+    spreads: dict[CurrencyPair, Rate] = {
+        ("EUR", "JPY"): "0.002",
+        ("EUR", "CHF"): "0.0005",
+        ("CHF", "JPY"): 0,
+    }
+    graph = ConversionGraph(RATES, spreads)
+    assert codes(graph, "USD", "JPY") == ["USD", "EUR", "CHF", "JPY"]
+    assert codes(graph, "JPY", "EUR") == ["JPY", "CHF", "EUR"]
+
+
+def test_rates_along_path() -> None:
+    graph = ConversionGraph(RATES)
+    assert graph.rate("USD", "EUR") == Decimal("0.92")
+    assert graph.rate("JPY", "EUR") == 1 / Decimal("160")
+    assert graph.rate("ZMK", "JPY") == 1 / Decimal("5300") * Decimal("0.92") * 160
+    assert graph.rate("USD", "USD") == 1
+
+
+def test_convert() -> None:
+    graph = ConversionGraph(RATES)
+    converted = graph.convert(Money("100", "USD"), "JPY")
+    assert converted == Money("14720", "JPY")
+    assert converted.currency is CURRENCY["JPY"]
+    values = [Money("100", "USD"), Money("1", "GBP"), Money("100", "USD")]
+    assert graph.convert_many(values, "JPY") == [
+        graph.convert(value, "JPY") for value in values
+    ]
+
+
+def test_no_path() -> None:
+    graph = ConversionGraph(RATES)
+    with pytest.raises(RateNotFoundException, match="USD to SEK"):
+        graph.rate("USD", "SEK")
+
+
+def test_cache_info() -> None:
+    graph = ConversionGraph(RATES)
+    assert graph.cache_info().hit_rate == 0.0
+    graph.convert_many([Money(1, "USD")] * 9 + [Money(1, "GBP")], "JPY")
+    info = graph.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (8, 2, 2)
+    assert info.hit_rate == 0.8
+
+
+def test_update_invalidates_paths() -> None:
+    graph = ConversionGraph(RATES)
+    assert graph.rate("USD", "EUR") == Decimal("0.92")
+    updated = RateTable({("USD", "EUR"): "0.95"})
+    graph.update(updated)
+    assert graph.rates is updated
+    assert graph.rate("USD", "EUR") == Decimal("0.95")
+    info = graph.cache_info()
+    assert (info.misses, info.currsize, info.invalidations) == (2, 1, 1)
+    with pytest.raises(RateNotFoundException):
+        graph.rate("USD", "JPY")
+
+
+def test_invalid_spreads() -> None:
+    with pytest.raises(ValueError):
+        ConversionGraph(RATES, {("EUR", "JPY"): "-0.1"})
@@ -0,0 +1,135 @@
+import datetime
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+from money.constants import CURRENCY
+from money.dataclasses.money import Money
+from money.exceptions import RateNotFoundException
+from money.exchange import RateHistory
+from money.exchange.rate_table import CurrencyPair, Rate
+
+JAN_2023 = datetime.date(2023, 1, 2)
+JUL_2023 = datetime.date(2023, 7, 3)
+JAN_2024 = datetime.date(2024, 1, 2)
+
+HISTORY: dict[CurrencyPair, list[tuple[datetime.date, Rate]]] = {
+    ("EUR", "USD"): [(JAN_2024, "1.09"), (JAN_2023, "1.07"), (JUL_2023, "1.0875")],
+    ("EUR", "JPY"): [(JAN_2023, "140"), (JAN_2024, Decimal("156.5"))],
+    ("GBP", "EUR"): [(JUL_2023, 1.16)],
+}
+
+
+@pytest.fixture
+def history() -> RateHistory:
+    return RateHistory(HISTORY, base="EUR")
+
+
+def test_as_of_lookups(history: RateHistory) -> None:
+    assert history.rate("EUR", "USD", JAN_2023) == Decimal("1.07")
+    assert history.rate("EUR", "USD", datetime.date(2023, 7, 2)) == Decimal("1.07")
+    assert history.rate("EUR", "USD", JUL_2023) == Decimal("1.0875")
+    assert history.rate("EUR", "USD", datetime.date(2030, 1, 1)) == Decimal("1.09")
+    assert history.rate("EUR", "JPY", JAN_2024) == Decimal("156.5")
+    assert history.rate("GBP", "EUR", JAN_2024) == Decimal("1.16")
+
+
+def test_as_of_datetimes(history: RateHistory) -> None:
+    before = datetime.datetime(2023, 7, 2, 23, 59, 59)
+    assert history.rate("EUR", "USD", before) == Decimal("1.07")
+    tokyo = datetime.timezone(datetime.timedelta(hours=9))
+    assert history.rate(
+        "EUR", "USD", datetime.datetime(2023, 7, 3, 8, tzinfo=tokyo)
+    ) == Decimal("1.07")
+    assert history.rate(
+        "EUR", "USD", datetime.datetime(2023, 7, 3, 9, tzinfo=tokyo)
+    ) == Decimal("1.0875")
+
+
+def test_inverse_and_cross_rates(history: RateHistory) -> None:
+    assert history.rate("USD", "EUR", JAN_2023) == 1 / Decimal("1.07")
+    assert history.rate("USD", "JPY", JAN_2023) == 1 / Decimal("1.07") * 140
+    assert history.rate("GBP", "USD", JAN_2024) == Decimal("1.16") * Decimal("1.09")
+
+
+def test_inverse_quote_before_direct_one() -> None:
+    history = RateHistory(
+        {("EUR", "USD"): [(JUL_2023, "1.0875")], ("USD", "EUR"): [(JAN_2023, "0.8")]}
+    )
+    assert history.rate("EUR", "USD", JAN_2023) == 1 / Decimal("0.8")
+    assert history.rate("EUR", "USD", JUL_2023) == Decimal("1.0875")
+
+
+def test_missing_rates(history: RateHistory) -> None:
+    with pytest.raises(RateNotFoundException, match="EUR to USD"):
+        history.rate("EUR", "USD", datetime.date(2022, 12, 31))
+    with pytest.raises(RateNotFoundException):
+        history.rate("GBP", "USD", JAN_2023)
+    with pytest.raises(RateNotFoundException):
+        history.rate("EUR", "CHF", JAN_2024)
+
+
+def test_invalid_rates() -> None:
+    with pytest.raises(ValueError):
+        RateHistory({("EUR", "USD"): [(JAN_2023, "0")]})
+    with pytest.raises(ValueError):
+        RateHistory({("EUR", "USD"): [(JAN_2023, "1" * 30)]})
+
+
+def test_convert(history: RateHistory) -> None:
+    converted = history.convert(Money("10", "EUR"), "USD", JUL_2023)
+    assert converted == Money("10.875", "USD")
+    assert converted.currency is CURRENCY["USD"]
+    postings = [
+        (Money("10", "EUR"), JAN_2023),
+        (Money("10", "EUR"), JAN_2024),
+        (Money("10", "EUR"), JAN_2023),
+        (Money("1", "GBP"), JAN_2024),
+    ]
+    assert history.convert_many(postings, "USD") == [
+        history.convert(value, "USD", when) for value, when in postings
+    ]
+
+
+def test_at(history: RateHistory) -> None:
+    table = history.at(JUL_2023)
+    assert table.rate("EUR", "USD") == Decimal("1.0875")
+    assert table.rate("USD", "JPY") == history.rate("USD", "JPY", JUL_2023)
+    assert table.base is CURRENCY["EUR"]
+    assert history.at(JAN_2023).rates == {
+        (CURRENCY["EUR"], CURRENCY["USD"]): Decimal("1.07"),
+        (CURRENCY["EUR"], CURRENCY["JPY"]): Decimal("140"),
+    }
+
+
+def test_save_and_open(history: RateHistory, tmp_path: Path) -> None:
+    path = tmp_path / "rates.bin"
+    history.save(path)
+    with RateHistory.open(path) as opened:
+        assert opened.base is CURRENCY["EUR"]
+        assert opened.pairs == history.pairs
+        assert len(opened) == len(history) == 6
+        for when in (JUL_2023, JAN_2024):
+            for source, target in (("EUR", "USD"), ("JPY", "GBP"), ("USD", "EUR")):
+                assert opened.rate(source, target, when) == history.rate(
+                    source, target, when
+                )
+        assert str(opened.convert(Money("10", "EUR"), "USD", JUL_2023)) == "USD 10.8750"
+    assert opened.pairs == []
+
+
+def test_save_and_open_without_base(tmp_path: Path) -> None:
+    path = tmp_path / "rates.bin"
+    RateHistory({}).save(path)
+    with RateHistory.open(path) as opened:
+        assert opened.base is None
+        assert len(opened) == 0
+
+
+def test_open_rejects_other_files(tmp_path: Path) -> None:
+    path = tmp_path / "rates.bin"
+    for content in (b"not a rate history", b"PMRH"):
+        path.write_bytes(content)
+        with pytest.raises(ValueError):
+            RateHistory.open(path)
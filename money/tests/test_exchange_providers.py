@@ -0,0 +1,184 @@
+import asyncio
+import datetime
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+from money.constants import CURRENCY
+from money.dataclasses.money import Money
+from money.exceptions import RateNotFoundException
+from money.exchange import (
+    CachingRateProvider,
+    RateHistory,
+    RateProvider,
+    RateTable,
+    StaticRateProvider,
+)
+
+RATES = RateTable({("EUR", "USD"): "1.08", ("EUR", "JPY"): "160"}, base="EUR")
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FlakyProvider:
+    def __init__(self) -> None:
+        self.fetches = 0
+        self.failing = False
+
+    async def fetch_rate(
+        self, source: object, target: object, when: object = None
+    ) -> Decimal:
+        self.fetches += 1
+        await asyncio.sleep(0)
+        if self.failing:
+            raise ConnectionError("rates unavailable")
+        return Decimal(self.fetches)
+
+
+def test_static_provider(tmp_path: Path) -> None:
+    provider: RateProvider = StaticRateProvider(RATES)
+    rate = asyncio.run(provider.fetch_rate(CURRENCY["USD"], CURRENCY["JPY"]))
+    assert rate == 1 / Decimal("1.08") * 160
+
+    path = tmp_path / "rates.bin"
+    when = datetime.date(2024, 1, 2)
+    RateHistory({("EUR", "USD"): [(when, "1.09")]}).save(path)
+    from_file = StaticRateProvider.from_file(path)
+    assert asyncio.run(
+        from_file.fetch_rate(CURRENCY["EUR"], CURRENCY["USD"], when)
+    ) == Decimal("1.09")
+    with pytest.raises(ValueError):
+        asyncio.run(from_file.fetch_rate(CURRENCY["EUR"], CURRENCY["USD"]))
+    assert from_file.fetches == 2
+
+
+def test_concurrent_requests_share_one_fetch() -> None:
+    static = StaticRateProvider(RATES, delay=0.01)
+    provider = CachingRateProvider(static, ttl=60)
+
+    async def burst() -> list[Decimal]:
+        return await asyncio.gather(
+            *(provider.rate("EUR", "USD") for _ in range(50)),
+            *(provider.rate(CURRENCY["EUR"], "JPY") for _ in range(50)),
+        )
+
+    rates = asyncio.run(burst())
+    assert rates == [Decimal("1.08")] * 50 + [Decimal("160")] * 50
+    assert static.fetches == 2
+
+
+def test_ttl() -> None:
+    clock = Clock()
+    static = StaticRateProvider(RATES)
+    provider = CachingRateProvider(static, ttl=60, clock=clock)
+
+    async def lookups() -> None:
+        await provider.rate("EUR", "USD")
+        clock.now = 59
+        await provider.rate("EUR", "USD")
+        assert static.fetches == 1
+        clock.now = 60
+        await provider.rate("EUR", "USD")
+        assert static.fetches == 2
+        provider.clear()
+        await provider.rate("EUR", "USD")
+        assert static.fetches == 3
+
+    asyncio.run(lookups())
+
+
+def test_stale_while_revalidate() -> None:
+    clock = Clock()
+    flaky = FlakyProvider()
+    provider = CachingRateProvider(
+        flaky, ttl=60, stale_while_revalidate=30, clock=clock
+    )
+
+    async def lookups() -> None:
+        assert await provider.rate("EUR", "USD") == 1
+        clock.now = 70
+        # Stale, served at once while a refresh runs
+        assert await provider.rate("EUR", "USD") == 1
+        assert await provider.rate("EUR", "USD") == 1
+        await asyncio.sleep(0.01)
+        assert flaky.fetches == 2
+        assert await provider.rate("EUR", "USD") == 2
+
+        # A failed refresh keeps the stale rate
+        flaky.failing = True
+        clock.now = 140
+        assert await provider.rate("EUR", "USD") == 2
+        await asyncio.sleep(0.01)
+        assert flaky.fetches == 3
+        assert await provider.rate("EUR", "USD") == 2
+        await asyncio.sleep(0.01)
+        assert flaky.fetches == 4
+
+        # Too stale, waits for a fetch
+        clock.now = 1000
+        flaky.failing = False
+        assert await provider.rate("EUR", "USD") == 5
+
+    asyncio.run(lookups())
+
+
+def test_failures_reach_every_waiter_and_are_not_cached() -> None:
+    flaky = FlakyProvider()
+    flaky.failing = True
+    provider = CachingRateProvider(flaky, ttl=60)
+
+    async def lookups() -> None:
+        results = await asyncio.gather(
+            *(provider.rate("EUR", "USD") for _ in range(3)), return_exceptions=True
+        )
+        assert all(isinstance(result, ConnectionError) for result in results)
+        assert flaky.fetches == 1
+        flaky.failing = False
+        assert await provider.rate("EUR", "USD") == 2
+
+    asyncio.run(lookups())
+
+
+def test_fetch_cancelled_before_it_starts_is_forgotten() -> None:
+    flaky = FlakyProvider()
+    provider = CachingRateProvider(flaky, ttl=60)
+
+    async def lookups() -> None:
+        # Cancelled before its first step, so the fetch itself never runs
+        provider._fetch(("EUR", "USD", None)).cancel()
+        await asyncio.sleep(0)
+        assert await provider.rate("EUR", "USD") == 1
+        assert flaky.fetches == 1
+
+    asyncio.run(lookups())
+
+
+def test_convert() -> None:
+    static = StaticRateProvider(RATES)
+    provider = CachingRateProvider(static, ttl=60)
+    converted = asyncio.run(provider.convert(Money("10", "EUR"), "USD"))
+    assert converted == Money("10.8", "USD")
+    assert converted.currency is CURRENCY["USD"]
+
+    values = [Money("10", "EUR"), Money("1", "JPY"), Money("5", "EUR")]
+    assert asyncio.run(provider.convert_many(values, "USD")) == [
+        RATES.convert(value, "USD") for value in values
+    ]
+    assert static.fetches == 2
+
+    with pytest.raises(RateNotFoundException):
+        asyncio.run(provider.convert(Money("10", "EUR"), "CHF"))
+
+
+def test_caching_providers_compose() -> None:
+    static = StaticRateProvider(RATES)
+    provider = CachingRateProvider(CachingRateProvider(static, ttl=60), ttl=1)
+    assert asyncio.run(provider.rate("EUR", "USD")) == Decimal("1.08")
+    assert static.fetches == 1
@@ -0,0 +1,80 @@
+import subprocess
+import sys
+import uuid
+from decimal import Decimal
+from typing import Iterator
+
+import pytest
+
+from money.constants import CURRENCY
+from money.dataclasses.money import Money
+from money.exceptions import RateNotFoundException
+from money.exchange import RateTable, SharedRatePublisher, SharedRateTable
+
+RATES = RateTable({("EUR", "USD"): "1.08", ("EUR", "JPY"): "160"}, base="EUR")
+
+READER = """
+import sys
+from money.dataclasses.money import Money
+from money.exchange import SharedRateTable
+
+with SharedRateTable(sys.argv[1]) as rates:
+    print(rates.version, rates.convert(Money(10, "EUR"), "USD"))
+"""
+
+
+@pytest.fixture
+def publisher() -> Iterator[SharedRatePublisher]:
+    with SharedRatePublisher("pmr-%s" % uuid.uuid4().hex[:8]) as publisher:
+        yield publisher
+
+
+def test_read_published_rates(publisher: SharedRatePublisher) -> None:
+    assert publisher.publish(RATES) == 1
+    with SharedRateTable(publisher.name) as rates:
+        assert rates.version == 1
+        assert rates.base is CURRENCY["EUR"]
+        assert rates.rate("EUR", "USD") == Decimal("1.08")
+        assert rates.rate("JPY", "EUR") == 1 / Decimal("160")
+        assert rates.rate("USD", "JPY") == RATES.rate("USD", "JPY")
+        converted = rates.convert(Money("10", "EUR"), "USD")
+        assert converted == Money("10.8", "USD")
+        assert converted.currency is CURRENCY["USD"]
+        values = [Money("10", "EUR"), Money("1", "USD"), Money("5", "EUR")]
+        assert rates.convert_many(values, "JPY") == RATES.convert_many(values, "JPY")
+        assert rates.snapshot().rates == RATES.rates
+        with pytest.raises(RateNotFoundException):
+            rates.rate("EUR", "CHF")
+
+
+def test_swap(publisher: SharedRatePublisher) -> None:
+    with SharedRateTable(publisher.name) as rates:
+        assert rates.version == 0
+        with pytest.raises(RateNotFoundException):
+            rates.rate("EUR", "USD")
+
+        publisher.publish(RATES)
+        assert rates.rate("USD", "JPY") == RATES.rate("USD", "JPY")
+        assert publisher.publish(RateTable({("EUR", "USD"): "1.1"})) == 2
+        assert rates.rate("EUR", "USD") == Decimal("1.1")
+        assert rates.base is None
+        assert rates.version == 2
+        with pytest.raises(RateNotFoundException):
+            rates.rate("USD", "JPY")
+
+        publisher.publish(RateTable({}))
+        assert rates.snapshot().rates == {}
+
+
+def test_other_processes(publisher: SharedRatePublisher) -> None:
+    publisher.publish(RATES)
+    for _ in range(2):
+        # A reader exiting must leave the segments to the others
+        result = subprocess.run(
+            [sys.executable, "-c", READER, publisher.name],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert result.stdout == "1 USD 10.80\n"
+        assert result.stderr == ""
@@ -0,0 +1,161 @@
+import pickle
+from decimal import ROUND_HALF_EVEN, Decimal
+
+import pytest
+
+from money.constants import CURRENCY
+from money.dataclasses.fast_money import FastMoney
+from money.dataclasses.money import Money
+from money.exceptions import (
+    CurrencyMismatchException,
+    InvalidOperationException,
+    PrecisionLossException,
+)
+
+
+def test_stores_minor_units() -> None:
+    assert FastMoney("1.50", "USD").units == 150
+    assert FastMoney("1.5", "USD").units == 150
+    assert FastMoney("USD 1.5").units == 150
+    assert FastMoney(1200, "JPY").units == 1200
+    assert FastMoney(Decimal("0.125"), "KWD").units == 125
+    assert FastMoney().units == 0
+    assert FastMoney.from_units(150, "usd") == FastMoney("1.50", "USD")
+
+
+def test_str() -> None:
+    assert str(FastMoney("1.5", "USD")) == "USD 1.50"
+    assert str(FastMoney("-1200", "JPY")) == "JPY -1200"
+    assert repr(FastMoney(0, "USD")) == "USD 0.00"
+
+
+def test_sub_minor_unit_amounts_are_rejected() -> None:
+    with pytest.raises(PrecisionLossException):
+        FastMoney("0.001", "USD")
+    with pytest.raises(PrecisionLossException):
+        FastMoney("0.5", "JPY")
+    with pytest.raises(PrecisionLossException):
+        FastMoney.from_money(Money("1.005", "USD"))
+
+
+@pytest.mark.parametrize(
+    "value",
+    [Money("10.50", "USD"), Money("-3", "USD"), Money("1200", "JPY"), Money()],
+)
+def test_money_round_trip(value: Money) -> None:
+    converted = FastMoney.from_money(value).to_money()
+    assert converted == value
+    assert converted.currency is value.currency
+
+
+def test_from_money_with_rounding() -> None:
+    fast = FastMoney.from_money(Money("1.005", "USD"), rounding=ROUND_HALF_EVEN)
+    assert fast == FastMoney("1.00", "USD")
+
+
+def test_arithmetic() -> None:
+    assert FastMoney("1.50", "USD") + FastMoney("2", "USD") == FastMoney("3.5", "USD")
+    assert FastMoney("1.50", "USD") - FastMoney("2", "USD") == FastMoney("-.5", "USD")
+    assert FastMoney("1.50", "USD") + 1 == FastMoney("2.50", "USD")
+    assert 1 + FastMoney("1.50", "USD") == FastMoney("2.50", "USD")
+    assert FastMoney("1.50", "USD") - Decimal("0.25") == FastMoney("1.25", "USD")
+    assert FastMoney("1.50", "USD") + 0.5 == FastMoney("2", "USD")
+    assert sum([FastMoney(1, "USD"), FastMoney(2, "USD")]) == FastMoney(3, "USD")
+    assert FastMoney("1.50", "USD") * 3 == FastMoney("4.50", "USD")
+    assert 3 * FastMoney("1.50", "USD") == FastMoney("4.50", "USD")
+    assert FastMoney("1.50", "USD") * Decimal("0.5") == FastMoney("0.75", "USD")
+    assert FastMoney("1.50", "USD") / 2 == FastMoney("0.75", "USD")
+    assert FastMoney("1.50", "USD") / Decimal("0.5") == FastMoney("3", "USD")
+    assert -FastMoney("1.50", "USD") == FastMoney("-1.50", "USD")
+    assert +FastMoney("1.50", "USD") == FastMoney("1.50", "USD")
+    assert float(FastMoney("1.50", "USD")) == 1.5
+    assert int(FastMoney("-1.50", "USD")) == -1
+
+
+def test_arithmetic_matches_money() -> None:
+    a, b = Money("12.34", "USD"), Money("0.66", "USD")
+    fast_a, fast_b = FastMoney.from_money(a), FastMoney.from_money(b)
+    assert (fast_a + fast_b).to_money() == a + b
+    assert (fast_a - fast_b).to_money() == a - b
+    assert (fast_a * 7).to_money() == a * 7
+    assert (fast_a / 2).to_money() == a / 2
+    assert (fast_a < fast_b) == (a < b)
+    assert (fast_a >= fast_b) == (a >= b)
+
+
+def test_error_precision_loss() -> None:
+    with pytest.raises(PrecisionLossException):
+        FastMoney("0.01", "USD") / 3
+    with pytest.raises(PrecisionLossException):
+        FastMoney("0.01", "USD") * Decimal("0.5")
+    with pytest.raises(PrecisionLossException):
+        FastMoney("1", "USD") + Decimal("0.001")
+    with pytest.raises(ZeroDivisionError):
+        FastMoney("1", "USD") / 0
+
+
+def test_error_currency_mismatch() -> None:
+    with pytest.raises(CurrencyMismatchException, match="JPY != USD"):
+        FastMoney(10, "JPY") + FastMoney(3, "USD")
+    with pytest.raises(CurrencyMismatchException):
+        FastMoney(10, "JPY") - FastMoney(3, "USD")
+    with pytest.raises(CurrencyMismatchException):
+        FastMoney(10, "JPY") < FastMoney(3, "USD")
+
+
+def test_error_invalid_operations() -> None:
+    with pytest.raises(InvalidOperationException):
+        FastMoney(1, "USD") * FastMoney(1, "USD")
+    with pytest.raises(InvalidOperationException):
+        FastMoney(1, "USD") / FastMoney(1, "USD")  # type: ignore[operator]
+    with pytest.raises(InvalidOperationException):
+        FastMoney(1, "USD") // 2
+    with pytest.raises(InvalidOperationException):
+        1 / FastMoney(1, "USD")
+    with pytest.raises(InvalidOperationException):
+        FastMoney(1, "USD") + Money(1, "USD")  # type: ignore[operator]
+    with pytest.raises(TypeError):
+        1 - FastMoney(1, "USD")
+    with pytest.raises(TypeError):
+        FastMoney(1, "USD") % 2  # type: ignore[operator]
+
+
+def test_equality() -> None:
+    assert FastMoney("1.5", "USD") == FastMoney("1.50", "USD")
+    assert FastMoney(1, "USD") != FastMoney(1, "EUR")
+    assert FastMoney(0, "USD") == 0
+    assert FastMoney(0, "USD") != FastMoney(0, "EUR")
+    assert FastMoney(1, "USD") != 1
+    assert FastMoney(1, "USD") != Money(1, "USD")
+    assert not FastMoney(0, "USD")
+    assert FastMoney("0.01", "USD")
+
+
+def test_hash() -> None:
+    assert hash(FastMoney("1.5", "USD")) == hash(FastMoney("1.50", "USD"))
+    assert hash(FastMoney(0, "USD")) == hash(0)
+    assert len({FastMoney(1, "USD"), FastMoney("1.00", "USD")}) == 1
+
+
+def test_comparisons() -> None:
+    assert FastMoney(1, "USD") < FastMoney(2, "USD")
+    assert FastMoney(2, "USD") >= FastMoney(2, "USD")
+    assert FastMoney(2, "USD") > 1
+    assert FastMoney(2, "USD") <= 2
+    # Thresholds finer than the minor unit still compare correctly
+    assert FastMoney("2.50", "USD") < Decimal("2.505")
+    assert not FastMoney("2.50", "USD") > Decimal("2.505")
+    assert FastMoney("2.50", "USD") > 2.495
+    assert not FastMoney("2.50", "USD") <= Decimal("2.495")
+
+
+def test_immutable() -> None:
+    with pytest.raises(AttributeError):
+        FastMoney(10, "JPY").amount = 3  # type: ignore[misc, assignment]
+
+
+def test_pickle() -> None:
+    value = FastMoney("1.50", "USD")
+    loaded = pickle.loads(pickle.dumps(value))
+    assert loaded == value
+    assert loaded.currency is CURRENCY["USD"]
@@ -1,11 +1,22 @@
-from decimal import Decimal
+import functools
+import os
+import pickle
+from decimal import (
+    ROUND_CEILING,
+    ROUND_DOWN,
+    ROUND_FLOOR,
+    ROUND_HALF_UP,
+    Decimal,
+    localcontext,
+)
+from typing import Any
 
 import pytest
 
 from money.constants import CURRENCY
 from money.dataclasses.currency import Currency
-from money.dataclasses.money import Money
-from money.exceptions import IncorrectMoneyInputError
+from money.dataclasses.money import Money, Ratio, sum_money
+from money.exceptions import IncorrectMoneyInputError, PrecisionLossException
 
 
 def test_string_parse() -> None:
@@ -163,3 +174,253 @@ def test_currency_attribute() -> None:
     assert value.currency == "USD"
     value = Money(101, "JPY")
     assert value.currency == "JPY"
+
+
+def test_hash_agrees_with_equality() -> None:
+    assert hash(Money("10.50", "USD")) == hash(Money("10.5", "USD"))
+    assert hash(Money(10, "USD")) == hash(Money(Decimal("10.00"), "usd"))
+    # Zero equals 0 in any currency, so it has to hash like 0 does
+    for zero in (0, 0.0, Decimal("0.00")):
+        assert Money(0, "USD") == zero
+        assert hash(Money(0, "USD")) == hash(zero)
+
+
+def test_hashable_containers() -> None:
+    values = {Money(10, "USD"), Money("10.0", "USD"), Money(10, "JPY")}
+    assert values == {Money(10, "USD"), Money(10, "JPY")}
+    assert Money(0, "USD") in {0}
+    assert {Money(10, "USD"): "a"}[Money("10.00", "USD")] == "a"
+
+    @functools.lru_cache
+    def double(value: Money) -> Money:
+        return value * 2
+
+    assert double(Money(5, "USD")) == Money(10, "USD")
+    assert double(Money("5.0", "USD")) == Money(10, "USD")
+    assert double.cache_info().hits == 1
+
+
+def test_hash_index_lookup() -> None:
+    index = {Money(i, "USD"): i for i in range(1, 100)}
+    index[Money(0, "USD")] = 0
+    # Equal zeros share a hash, whatever their exponent
+    assert hash(Money(0, "USD")) == hash(Money("0.00", "USD")) == hash(0)
+    assert index[Money("0.00", "USD")] == 0
+    assert 0 in index
+    for i in (1, 50, 99):
+        assert index[Money("%d.00" % i, "USD")] == i
+    assert Money(100, "USD") not in index
+    assert Money(1, "JPY") not in index
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        ("123.45", Money("123.45")),
+        (" -123.45 ", Money("-123.45")),
+        ("1e3", Money(1000)),
+        ("USD 123.45", Money("123.45", "USD")),
+        ("usd 123.45", Money("123.45", "USD")),
+        ("JPY-1200", Money("-1200", "JPY")),
+        ("  KWD   .125  ", Money("0.125", "KWD")),
+    ],
+)
+def test_string_parse_forms(value: str, expected: Money) -> None:
+    result = Money.from_string(value)
+    assert result == expected
+    assert result.currency is expected.currency
+    assert Money(value) == expected
+
+
+@pytest.mark.parametrize("value", ["", "USD", "ABC 123", "USD 1.2.3", "123 USD"])
+def test_string_parse_malformed(value: str) -> None:
+    with pytest.raises(IncorrectMoneyInputError):
+        Money.from_string(value)
+
+
+def test_string_parse_decimal_specials() -> None:
+    """
+    Values only Decimal understands are still accepted
+    """
+    assert Money.from_string("NaN").amount.is_nan()
+    assert Money.from_string("1_000") == Money(1000)
+    assert Money.from_string("USD Infinity").amount.is_infinite()
+
+
+def test_parse_many() -> None:
+    result = Money.parse_many(["USD 1.50", "2", "JPY 3", "2"], default_currency="usd")
+    assert result.values == [
+        Money("1.50", "USD"),
+        Money(2, "USD"),
+        Money(3, "JPY"),
+        Money(2, "USD"),
+    ]
+    assert result.errors == []
+    assert Money.parse_many(["2"]).values == [Money(2)]
+
+
+def test_parse_many_collects_errors() -> None:
+    result = Money.parse_many(["1", "oops", "USD 2", "ABC 3", "oops"])
+    assert result.values == [Money(1), None, Money(2, "USD"), None, None]
+    assert [index for index, _ in result.errors] == [1, 3, 4]
+    assert "oops" in result.errors[0][1]
+
+
+def test_parse_many_collects_non_string_rows() -> None:
+    rows: list[Any] = ["USD 1", None, 2, Decimal("3"), "oops", "JPY 4"]
+    result = Money.parse_many(rows)
+    assert result.values == [Money(1, "USD"), None, None, None, None, Money(4, "JPY")]
+    assert [row for row, _ in result.errors] == [1, 2, 3, 4]
+    assert result.errors[0][1] == "Expected a string, got None"
+    assert result.errors[2][1] == "Expected a string, got Decimal('3')"
+
+
+def test_parse_many_reuses_repeated_values() -> None:
+    result = Money.parse_many(["USD 9.99"] * 3)
+    first, second, third = result.values
+    assert first is second is third
+
+
+MONEY_QUANTIZE: list[tuple[Money, str | None, str]] = [
+    (Money("1.005", "USD"), None, "USD 1.00"),
+    (Money("1.005", "USD"), ROUND_HALF_UP, "USD 1.01"),
+    (Money("1.5", "USD"), None, "USD 1.50"),
+    (Money("-1.009", "USD"), ROUND_DOWN, "USD -1.00"),
+    (Money("1.001", "USD"), ROUND_CEILING, "USD 1.01"),
+    (Money("2.5", "JPY"), None, "JPY 2"),
+    (Money("2.5", "JPY"), ROUND_HALF_UP, "JPY 3"),
+    (Money("1200.00", "JPY"), None, "JPY 1200"),
+    (Money("0.1235", "KWD"), ROUND_HALF_UP, "KWD 0.124"),
+    (Money("0.1235", "KWD"), ROUND_FLOOR, "KWD 0.123"),
+    (Money("7.9"), None, "XXX 8"),
+]
+
+
+@pytest.mark.parametrize("value,rounding,expected", MONEY_QUANTIZE)
+def test_quantize(value: Money, rounding: str | None, expected: str) -> None:
+    assert str(value.quantize(rounding)) == expected
+
+
+def test_quantize_many() -> None:
+    values = [value for value, _, _ in MONEY_QUANTIZE]
+    assert [str(value) for value in Money.quantize_many(values)] == [
+        str(value.quantize()) for value in values
+    ]
+    assert Money.quantize_many(iter(values), ROUND_HALF_UP) == [
+        value.quantize(ROUND_HALF_UP) for value in values
+    ]
+    assert Money.quantize_many([]) == []
+
+
+def test_quantize_follows_the_decimal_context() -> None:
+    with localcontext() as context:
+        context.rounding = ROUND_HALF_UP
+        assert str(Money("1.005", "USD").quantize()) == "USD 1.01"
+        assert str(Money.quantize_many([Money("1.005", "USD")])[0]) == "USD 1.01"
+
+
+def test_quantize_invalid_rounding() -> None:
+    with pytest.raises(TypeError):
+        Money("1", "USD").quantize("ROUND_SIDEWAYS")
+    with pytest.raises(TypeError):
+        Money.quantize_many([Money("1", "USD")], "ROUND_SIDEWAYS")
+
+
+MONEY_ALLOCATIONS: list[tuple[Money, list[Ratio], list[Money]]] = [
+    (
+        Money("100", "USD"),
+        [1, 1, 1],
+        [Money("33.34", "USD"), Money("33.33", "USD"), Money("33.33", "USD")],
+    ),
+    (
+        Money("-100", "USD"),
+        [1, 1, 1],
+        [Money("-33.34", "USD"), Money("-33.33", "USD"), Money("-33.33", "USD")],
+    ),
+    (Money("0.05", "USD"), [3, 7], [Money("0.02", "USD"), Money("0.03", "USD")]),
+    (Money("5", "JPY"), [70, 30], [Money(4, "JPY"), Money(1, "JPY")]),
+    # Equal remainders, the earlier parts get the leftover cents
+    (
+        Money("0.05", "USD"),
+        [1, 2, 1, 2, 1, 2, 1],
+        [Money("0.01", "USD")] * 4
+        + [Money(0, "USD"), Money("0.01", "USD")]
+        + [Money(0, "USD")],
+    ),
+    (
+        Money("1", "KWD"),
+        [1, 1, 1],
+        [Money("0.334", "KWD"), Money("0.333", "KWD"), Money("0.333", "KWD")],
+    ),
+    (
+        Money("1", "USD"),
+        ["0.5", Decimal("0.25"), 0.25],
+        [Money("0.50", "USD"), Money("0.25", "USD"), Money("0.25", "USD")],
+    ),
+    (Money("10", "USD"), [1, 0], [Money("10", "USD"), Money(0, "USD")]),
+    (Money(0, "USD"), [1, 2], [Money(0, "USD"), Money(0, "USD")]),
+]
+
+
+@pytest.mark.parametrize("value,ratios,expected", MONEY_ALLOCATIONS)
+def test_allocate(value: Money, ratios: list[Ratio], expected: list[Money]) -> None:
+    parts = value.allocate(ratios)
+    assert parts == expected
+    assert all(part.currency is value.currency for part in parts)
+    assert sum_money(parts) == value
+
+
+def test_allocate_parts_add_up() -> None:
+    for amount in ("0.01", "99.99", "1000000", "-12.34"):
+        for ratios in ([1] * 7, [1, 2, 3, 4], [997, 3], list(range(1, 50))):
+            value = Money(amount, "USD")
+            assert sum_money(value.allocate(ratios)) == value
+
+
+def test_allocate_many_ways() -> None:
+    parts = Money("1000", "USD").allocate([1] * 30_000)
+    assert len(parts) == 30_000
+    assert sum_money(parts) == Money("1000", "USD")
+    assert {part.amount for part in parts} == {Decimal("0.04"), Decimal("0.03")}
+
+
+def test_allocate_many() -> None:
+    values = [Money("100", "USD"), Money("5", "JPY")]
+    assert Money.allocate_many(values, [1, 1, 1]) == [
+        value.allocate([1, 1, 1]) for value in values
+    ]
+    assert Money.allocate_many([], [1]) == []
+
+
+def test_allocate_invalid() -> None:
+    with pytest.raises(ValueError):
+        Money("1", "USD").allocate([])
+    with pytest.raises(ValueError):
+        Money("1", "USD").allocate([0, 0])
+    with pytest.raises(ValueError):
+        Money("1", "USD").allocate([2, -1])
+    with pytest.raises(ValueError):
+        Money("1", "USD").allocate([1, "NaN"])
+    with pytest.raises(PrecisionLossException):
+        Money("1.005", "USD").allocate([1, 1])
+
+
+def test_pickle() -> None:
+    values = [Money("1.50", "USD"), Money("-1E+3", "JPY"), Money("0.000", "EUR")]
+    data = pickle.dumps(values)
+    assert b"Dollar" not in data
+    loaded = pickle.loads(data)
+    assert [str(value) for value in loaded] == [str(value) for value in values]
+    assert loaded[1].amount.as_tuple() == values[1].amount.as_tuple()
+    assert all(value.currency is CURRENCY[value.currency.code] for value in loaded)
+    custom = pickle.loads(pickle.dumps(Money(1, Currency(code="AAA", decimals=3))))
+    assert (custom.currency.code, custom.currency.decimals) == ("AAA", 3)
+
+
+def test_unpickle_2_0_0() -> None:
+    # [Money("12.30", "USD"), Money("5", "JPY")] pickled by python-money 2.0.0
+    path = os.path.join(os.path.dirname(__file__), "fixtures", "money-2.0.0.pickle")
+    with open(path, "rb") as f:
+        loaded = pickle.load(f)
+    assert [str(value) for value in loaded] == ["USD 12.30", "JPY 5"]
+    assert all(value.currency is CURRENCY[value.currency.code] for value in loaded)
@@ -0,0 +1,199 @@
+from decimal import Decimal
+
+import pytest
+
+from money.constants import CURRENCY
+from money.dataclasses.money import Money
+from money.exceptions import (
+    CurrencyMismatchException,
+    InvalidOperationException,
+    PrecisionLossException,
+)
+
+np = pytest.importorskip("numpy")
+
+from money.dataclasses.money_array import MoneyArray  # noqa: E402
+
+LEDGER = [
+    Money("10.50", "USD"),
+    Money("-3", "USD"),
+    Money("1200", "JPY"),
+    Money("0.125", "KWD"),
+    Money("7.25", "USD"),
+]
+
+
+def usd(*amounts: str) -> MoneyArray:
+    return MoneyArray(Money(amount, "USD") for amount in amounts)
+
+
+def test_round_trip() -> None:
+    values = MoneyArray(LEDGER)
+    assert len(values) == len(LEDGER)
+    assert values.to_money() == LEDGER
+    assert list(values) == LEDGER
+    assert [value.currency for value in values] == [value.currency for value in LEDGER]
+    assert values[2] == Money("1200", "JPY")
+    assert values[-1] == Money("7.25", "USD")
+    assert MoneyArray().to_money() == []
+
+
+def test_round_trip_uses_minor_units() -> None:
+    assert MoneyArray([Money("10.5", "USD")])[0].amount.as_tuple().exponent == -2
+    assert MoneyArray([Money("10", "JPY")])[0].amount.as_tuple().exponent == 0
+
+
+def test_sub_minor_unit_amounts_are_rejected() -> None:
+    with pytest.raises(PrecisionLossException):
+        MoneyArray([Money("0.001", "USD")])
+    with pytest.raises(PrecisionLossException):
+        MoneyArray([Money("0.5", "JPY")])
+
+
+def test_addition_and_subtraction() -> None:
+    assert list(usd("1.50", "2") + usd("1", "0.25")) == list(usd("2.50", "2.25"))
+    assert list(usd("1.50", "2") - usd("1", "0.25")) == list(usd("0.50", "1.75"))
+    assert list(usd("1.50", "2") + Money(1, "USD")) == list(usd("2.50", "3"))
+    assert list(usd("1.50", "2") + 1) == list(usd("2.50", "3"))
+    assert list(usd("1.50", "2") - Decimal("0.5")) == list(usd("1", "1.50"))
+    assert list(-usd("1.50")) == list(usd("-1.50"))
+
+
+def test_mixed_currency_arithmetic_lines_up_dictionaries() -> None:
+    left = MoneyArray([Money(1, "USD"), Money(1, "JPY")])
+    right = MoneyArray([Money(2, "USD"), Money(2, "JPY")])
+    assert (left + right).to_money() == [Money(3, "USD"), Money(3, "JPY")]
+
+    # Same values, dictionary built in a different order
+    reordered = MoneyArray([Money(5, "JPY"), Money(2, "USD"), Money(2, "JPY")])[1:]
+    assert (left + reordered).to_money() == [Money(3, "USD"), Money(3, "JPY")]
+
+
+def test_error_currency_mismatch() -> None:
+    with pytest.raises(CurrencyMismatchException):
+        usd("1", "2") + MoneyArray([Money(1, "USD"), Money(1, "EUR")])
+    with pytest.raises(CurrencyMismatchException):
+        usd("1", "2") - Money(1, "EUR")
+    with pytest.raises(CurrencyMismatchException):
+        usd("1") < Money(1, "EUR")
+
+
+def test_error_length_mismatch() -> None:
+    with pytest.raises(ValueError):
+        usd("1", "2") + usd("1")
+
+
+def test_multiplication_and_division() -> None:
+    assert list(usd("1.50", "2") * 3) == list(usd("4.50", "6"))
+    assert list(3 * usd("1.50")) == list(usd("4.50"))
+    assert list(usd("1.50", "2") * Decimal("0.5")) == list(usd("0.75", "1"))
+    assert list(usd("1.50", "2") / 2) == list(usd("0.75", "1"))
+    with pytest.raises(PrecisionLossException):
+        usd("0.01") / 3
+    with pytest.raises(ZeroDivisionError):
+        usd("1") / 0
+
+
+def test_error_invalid_operations() -> None:
+    with pytest.raises(InvalidOperationException):
+        usd("1") * Money(1, "USD")  # type: ignore[operator]
+    with pytest.raises(InvalidOperationException):
+        usd("1") / Money(1, "USD")  # type: ignore[operator]
+    with pytest.raises(InvalidOperationException):
+        usd("1") // 2
+    with pytest.raises(InvalidOperationException):
+        1 / usd("1")
+    with pytest.raises(TypeError):
+        1 - usd("1")
+
+
+def test_comparisons_and_masks() -> None:
+    values = usd("1", "2.50", "3")
+    assert (values > Money("2", "USD")).tolist() == [False, True, True]
+    assert (values <= usd("1", "2", "4")).tolist() == [True, False, True]
+    assert (values >= Decimal("2.50")).tolist() == [False, True, True]
+    # Thresholds finer than the minor unit still compare correctly
+    assert (values < Decimal("2.505")).tolist() == [True, True, False]
+    assert (values > Money("2.495", "USD")).tolist() == [False, True, True]
+
+    assert list(values[values > 2]) == list(usd("2.50", "3"))
+    assert list(values[1:]) == list(usd("2.50", "3"))
+
+
+def test_equality_follows_money_rules() -> None:
+    values = MoneyArray([Money(0, "USD"), Money(1, "USD"), Money(1, "JPY")])
+    assert (values == Money(1, "USD")).tolist() == [False, True, False]
+    assert (values != Money(1, "USD")).tolist() == [True, False, True]
+    assert (values == 0).tolist() == [True, False, False]
+    assert (values == 1).tolist() == [False, False, False]
+    assert (values == Money("1.001", "USD")).tolist() == [False, False, False]
+    assert (values == values).tolist() == [True, True, True]
+
+
+def test_sum() -> None:
+    assert usd("1.50", "2", "-0.25").sum() == Money("3.25", "USD")
+    assert MoneyArray().sum() == Money(0)
+    with pytest.raises(CurrencyMismatchException):
+        MoneyArray(LEDGER).sum()
+    mixed = MoneyArray([Money(1, "USD"), Money(2, "USD"), Money(3, "JPY")])
+    with pytest.raises(
+        CurrencyMismatchException, match="^Currency mismatch: USD != JPY$"
+    ):
+        mixed.sum()
+
+
+def test_groupby_currency() -> None:
+    totals = MoneyArray(LEDGER).groupby_currency()
+    assert totals == {
+        CURRENCY["USD"]: Money("14.75", "USD"),
+        CURRENCY["JPY"]: Money("1200", "JPY"),
+        CURRENCY["KWD"]: Money("0.125", "KWD"),
+    }
+    usd_only = MoneyArray(LEDGER)[np.array([True, True, False, False, True])]
+    assert usd_only.groupby_currency() == {CURRENCY["USD"]: Money("14.75", "USD")}
+
+
+def test_overflow_raises() -> None:
+    large = MoneyArray([Money(2**62, "JPY")])
+    smallest = MoneyArray([Money(-(2**63), "JPY")])
+    with pytest.raises(OverflowError):
+        large * 4
+    with pytest.raises(OverflowError):
+        4 * large
+    with pytest.raises(OverflowError):
+        large * Decimal("2.5")
+    with pytest.raises(OverflowError):
+        large + large
+    with pytest.raises(OverflowError):
+        smallest - large
+    with pytest.raises(OverflowError):
+        large + Money(2**62, "JPY")
+    with pytest.raises(OverflowError):
+        -smallest
+    assert list(large * -1) == [Money(-(2**62), "JPY")]
+    assert list(smallest + large) == [Money(-(2**62), "JPY")]
+
+
+def test_reductions_are_exact_beyond_int64() -> None:
+    values = MoneyArray([Money(2**62, "JPY")] * 4 + [Money("1.50", "USD")])
+    assert values[:4].sum() == Money(2**64, "JPY")
+    assert values.groupby_currency() == {
+        CURRENCY["JPY"]: Money(2**64, "JPY"),
+        CURRENCY["USD"]: Money("1.50", "USD"),
+    }
+
+
+def test_parse_many_to_array() -> None:
+    result = Money.parse_many(["USD 1.50", "bad", "USD 2"]).to_array()
+    assert result.array.sum() == Money("3.50", "USD")
+    assert result.rows == [0, 2]
+    assert [row for row, _ in result.errors] == [1]
+
+
+def test_parse_many_to_array_precision() -> None:
+    # XXX has no decimals, so the fractional row can't be held in minor units
+    result = Money.parse_many(["1.50", "oops", "2", "JPY 0.5"]).to_array()
+    assert list(result.array) == [Money(2)]
+    assert result.rows == [2]
+    assert [row for row, _ in result.errors] == [0, 1, 3]
+    assert "minor units" in result.errors[0][1]
@@ -0,0 +1,86 @@
+from decimal import Decimal
+
+from money.constants import CURRENCY
+from money.dataclasses.money import Money
+from money.dataclasses.money_bag import MoneyBag
+
+LEDGER = [
+    Money("10.50", "USD"),
+    Money("1200", "JPY"),
+    Money("-3", "USD"),
+    Money("0.125", "KWD"),
+]
+
+
+def test_totals_per_currency() -> None:
+    bag = MoneyBag(LEDGER)
+    assert bag["USD"] == Money("7.50", "USD")
+    assert bag[CURRENCY["JPY"]] == Money("1200", "JPY")
+    assert bag["KWD"] == Money("0.125", "KWD")
+    assert bag["EUR"] == Money(0, "EUR")
+    assert bag["EUR"].currency is CURRENCY["EUR"]
+    assert len(bag) == 3
+    assert "USD" in bag
+    assert CURRENCY["EUR"] not in bag
+
+
+def test_iteration_reads_totals_as_money() -> None:
+    bag = MoneyBag(LEDGER)
+    assert list(bag) == [
+        Money("7.50", "USD"),
+        Money("1200", "JPY"),
+        Money("0.125", "KWD"),
+    ]
+    assert bag.currencies == [CURRENCY["USD"], CURRENCY["JPY"], CURRENCY["KWD"]]
+    assert bag.to_dict() == {
+        CURRENCY["USD"]: Money("7.50", "USD"),
+        CURRENCY["JPY"]: Money("1200", "JPY"),
+        CURRENCY["KWD"]: Money("0.125", "KWD"),
+    }
+
+
+def test_accumulates_in_place() -> None:
+    bag = MoneyBag()
+    bag.add(Money(1, "USD"))
+    bag += Money(2, "USD")
+    bag.subtract(Money("0.5", "USD"))
+    bag -= Money(5, "JPY")
+    bag.update(LEDGER)
+    assert bag["USD"] == Money(10, "USD")
+    assert bag["JPY"] == Money(1195, "JPY")
+
+
+def test_merge_and_subtract_bags() -> None:
+    first = MoneyBag([Money(1, "USD"), Money(100, "JPY")])
+    second = MoneyBag([Money(2, "USD"), Money(3, "EUR")])
+
+    assert list(first + second) == [
+        Money(3, "USD"),
+        Money(100, "JPY"),
+        Money(3, "EUR"),
+    ]
+    assert list(first - second) == [
+        Money(-1, "USD"),
+        Money(100, "JPY"),
+        Money(-3, "EUR"),
+    ]
+    # + and - leave their operands alone, merge doesn't
+    assert first["USD"] == Money(1, "USD")
+    first.merge(second)
+    assert first["USD"] == Money(3, "USD")
+    assert list(-second) == [Money(-2, "USD"), Money(-3, "EUR")]
+
+
+def test_equality_and_truthiness_ignore_zero_totals() -> None:
+    bag = MoneyBag([Money(1, "USD"), Money(5, "JPY"), Money(-5, "JPY")])
+    assert bag == MoneyBag([Money(1, "USD")])
+    assert bag != MoneyBag([Money(2, "USD")])
+    assert bag != Money(1, "USD")
+    assert bag
+    assert not MoneyBag([Money(5, "JPY"), Money(-5, "JPY")])
+    assert not MoneyBag()
+
+
+def test_totals_are_exact_decimals() -> None:
+    bag = MoneyBag(Money("0.1", "USD") for _ in range(10))
+    assert bag["USD"].amount == Decimal("1.0")
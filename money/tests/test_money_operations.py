@@ -3,7 +3,8 @@ from typing import Callable
 
 import pytest
 
-from money.dataclasses.money import Money
+from money.constants import CURRENCY, DEFAULT_CURRENCY
+from money.dataclasses.money import Money, sum_money
 from money.exceptions import CurrencyMismatchException, InvalidOperationException
 
 MONEY_STRINGS: list[tuple[Money, str]] = [
@@ -120,6 +121,49 @@ def test_error_invalid_currency(value: ArithmeticFunc) -> None:
         value()
 
 
+MONEY_SUMS: list[list[Money]] = [
+    [Money("1.50", "USD"), Money("2", "USD"), Money("-0.25", "USD")],
+    [Money("100", "JPY")],
+    [Money("0.1"), Money("0.2"), Money("-0.3")],
+]
+
+
+@pytest.mark.parametrize("values", MONEY_SUMS)
+def test_sum_money_matches_sum(values: list[Money]) -> None:
+    total = sum_money(values)
+    expected = sum(values, Money(0, values[0].currency))
+    assert total == expected
+    assert str(total) == str(expected)
+    assert total.currency is values[0].currency
+
+
+def test_sum_money_accepts_iterators() -> None:
+    values = (Money(amount, "USD") for amount in ("1", "2", "3"))
+    assert sum_money(values) == Money(6, "USD")
+
+
+def test_sum_money_empty() -> None:
+    assert sum_money([]) == Money(0)
+    assert sum_money([]).currency == DEFAULT_CURRENCY
+    assert sum_money([], "usd").currency == CURRENCY["USD"]
+    assert sum_money([], CURRENCY["JPY"]).currency == CURRENCY["JPY"]
+
+
+def test_sum_money_with_currency() -> None:
+    assert sum_money([Money(1, "USD"), Money(2, "USD")], "USD") == Money(3, "USD")
+    with pytest.raises(CurrencyMismatchException, match="USD != EUR"):
+        sum_money([Money(1, "EUR")], "USD")
+
+
+def test_error_sum_money_currency_mismatch() -> None:
+    values = [Money(1, "JPY"), Money(2, "JPY"), Money(3, "EUR")]
+    with pytest.raises(CurrencyMismatchException) as expected:
+        sum(values, Money(0, "JPY"))
+    with pytest.raises(CurrencyMismatchException) as raised:
+        sum_money(values)
+    assert str(raised.value) == str(expected.value)
+
+
 MONEY_EQUALITY: list[tuple[bool, bool]] = [
     # Bool
     (bool(Money("0")), False),
@@ -278,3 +322,19 @@ def test_error_mutation_of_amount() -> None:
 def test_error_mutation_of_currency() -> None:
     with pytest.raises(AttributeError):
         Money(10, "JPY").currency = "USD"  # type: ignore[misc, assignment]
+
+
+def test_error_mutation_of_private_attributes() -> None:
+    value = Money(10, "JPY")
+    with pytest.raises(AttributeError):
+        value._amount = Decimal(3)  # type: ignore[misc]
+    with pytest.raises(AttributeError):
+        value.extra = 3  # type: ignore[attr-defined]
+
+
+def test_arithmetic_results_are_fully_formed() -> None:
+    result = -(Money("10.50", "USD") + Money("1.25", "USD")) * 2
+    assert isinstance(result, Money)
+    assert result.amount == Decimal("-23.50")
+    assert result.currency == "USD"
+    assert not hasattr(result, "__dict__")
@@ -0,0 +1,108 @@
+import subprocess
+import sys
+
+import pytest
+
+from money.constants import CURRENCY, CURRENCY_LIST, DEFAULT_CURRENCY
+from money.dataclasses.currency import Currency
+from money.registry import CurrencyList, CurrencyRegistry
+
+ROWS = [
+    ("AAA", "001", 2, "$", "A Dollar", ("A LAND",)),
+    ("BBB", "002", 0, "", "B Yen", ("B LAND", "C LAND")),
+]
+
+
+def test_registry_builds_currencies_on_first_lookup() -> None:
+    registry = CurrencyRegistry(ROWS)
+    assert len(registry) == 2
+    assert list(registry) == ["AAA", "BBB"]
+    assert "BBB" in registry
+    assert registry._currencies == {}
+
+    currency = registry["BBB"]
+    assert currency == Currency(
+        code="BBB",
+        numeric="002",
+        decimals=0,
+        name="B Yen",
+        countries=["B LAND", "C LAND"],
+    )
+    assert list(registry._currencies) == ["BBB"]
+    assert registry["BBB"] is currency
+    assert registry.get("BBB") is currency
+
+
+def test_registry_missing_codes() -> None:
+    registry = CurrencyRegistry(ROWS)
+    assert "ZZZ" not in registry
+    assert registry.get("ZZZ") is None
+    assert registry.get("ZZZ", DEFAULT_CURRENCY) is DEFAULT_CURRENCY
+    with pytest.raises(KeyError):
+        registry["ZZZ"]
+
+
+def test_currency_list_follows_registry() -> None:
+    registry = CurrencyRegistry(ROWS)
+    currencies = CurrencyList(registry)
+    assert len(currencies) == 2
+    assert registry._currencies == {}
+    assert currencies[0] is registry["AAA"]
+    assert [currency.code for currency in currencies] == ["AAA", "BBB"]
+    assert currencies[1:] == (registry["BBB"],)
+
+
+def test_currency_constants() -> None:
+    assert len(CURRENCY) == len(CURRENCY_LIST)
+    assert dict(CURRENCY.items())["JPY"].decimals == 0
+    assert DEFAULT_CURRENCY is CURRENCY["XXX"]
+    for currency in CURRENCY_LIST:
+        assert CURRENCY[currency.code] is currency
+
+
+def test_lookup_by_numeric() -> None:
+    assert CURRENCY.by_numeric("392") is CURRENCY["JPY"]
+    assert CURRENCY.by_numeric(8) is CURRENCY["ALL"]
+    assert Currency.by_numeric("840") is CURRENCY["USD"]
+    with pytest.raises(KeyError):
+        CURRENCY.by_numeric("000")
+
+
+def test_currencies_for_country() -> None:
+    assert CURRENCY.currencies_for_country("JAPAN") == (CURRENCY["JPY"],)
+    assert CURRENCY.currencies_for_country("japan") == (CURRENCY["JPY"],)
+    assert set(CURRENCY.currencies_for_country("SWITZERLAND")) >= {
+        CURRENCY["CHF"],
+        CURRENCY["CHE"],
+    }
+    assert CURRENCY.currencies_for_country("ATLANTIS") == ()
+
+
+def test_currencies_for_symbol() -> None:
+    dollars = CURRENCY.currencies_for_symbol("$")
+    assert CURRENCY["USD"] in dollars
+    assert all(currency.symbol == "$" for currency in dollars)
+    assert CURRENCY.currencies_for_symbol("") == ()
+
+
+def test_indexes_agree_with_a_scan() -> None:
+    for currency in CURRENCY_LIST:
+        assert CURRENCY.by_numeric(currency.numeric) is currency
+        for country in currency.countries:
+            assert currency in CURRENCY.currencies_for_country(country)
+
+
+def test_import_money_loads_lazily() -> None:
+    code = (
+        "import sys, money\n"
+        "print(sorted(m for m in sys.modules if m.startswith('money.')))\n"
+        "print(money.FastMoney.__name__, money.MoneyBag.__name__)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    loaded, names = result.stdout.splitlines()
+    assert "fast_money" not in loaded
+    assert "money_bag" not in loaded
+    assert "parse_result" not in loaded
+    assert names == "FastMoney MoneyBag"